@@ -0,0 +1,6 @@
+"""`python -m datalex_cli ...` — same entry point as the `datalex` script."""
+
+from datalex_cli.main import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,7 +8,7 @@ import os
 import sys
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import yaml
@@ -58,7 +58,7 @@ from datalex_core import (
     write_markdown_docs,
     write_migration,
 )
-from datalex_core.issues import Issue, has_errors, to_lines
+from datalex_core.issues import Issue, has_errors, severity_counts, to_lines
 
 STARTER_MODEL = """model:
   name: starter_model
@@ -97,6 +97,7 @@ def _cli_version() -> str:
     except importlib.metadata.PackageNotFoundError:
         return "unknown"
 
+
 MULTI_MODEL_SHARED = """model:
   name: shared_dimensions
   spec_version: 2
@@ -1324,13 +1325,14 @@ def cmd_policy_check(args: argparse.Namespace) -> int:
     _print_issue_block("Policy evaluation", evaluated_issues)
 
     if args.output_json:
+        counts = severity_counts(evaluated_issues)
         payload = {
             "model": args.model,
             "policy": policy_paths if len(policy_paths) > 1 else policy_paths[0],
             "summary": {
-                "error_count": len([item for item in evaluated_issues if item.severity == "error"]),
-                "warning_count": len([item for item in evaluated_issues if item.severity == "warn"]),
-                "info_count": len([item for item in evaluated_issues if item.severity == "info"]),
+                "error_count": counts["error"],
+                "warning_count": counts["warn"],
+                "info_count": counts["info"],
             },
             "issues": _issues_as_json(evaluated_issues),
         }
@@ -1420,8 +1422,15 @@ def cmd_generate_metadata(args: argparse.Namespace) -> int:
     return 0
 
 
+def _read_import_input(path: str) -> str:
+    """Read an importer source file; `-` reads it from stdin instead."""
+    if path == "-":
+        return sys.stdin.read()
+    return Path(path).read_text(encoding="utf-8")
+
+
 def cmd_import_sql(args: argparse.Namespace) -> int:
-    ddl_text = Path(args.input).read_text(encoding="utf-8")
+    ddl_text = _read_import_input(args.input)
     model = import_sql_ddl(
         ddl_text=ddl_text,
         model_name=args.model_name,
@@ -1443,7 +1452,7 @@ def cmd_import_sql(args: argparse.Namespace) -> int:
 
 
 def cmd_import_dbml(args: argparse.Namespace) -> int:
-    dbml_text = Path(args.input).read_text(encoding="utf-8")
+    dbml_text = _read_import_input(args.input)
     model = import_dbml(
         dbml_text=dbml_text,
         model_name=args.model_name,
@@ -1465,7 +1474,7 @@ def cmd_import_dbml(args: argparse.Namespace) -> int:
 
 
 def cmd_import_spark_schema(args: argparse.Namespace) -> int:
-    text = Path(args.input).read_text(encoding="utf-8")
+    text = _read_import_input(args.input)
     model = import_spark_schema(
         schema_text=text,
         model_name=args.model_name,
@@ -1488,7 +1497,7 @@ def cmd_import_spark_schema(args: argparse.Namespace) -> int:
 
 
 def cmd_import_dbt(args: argparse.Namespace) -> int:
-    schema_text = Path(args.input).read_text(encoding="utf-8")
+    schema_text = _read_import_input(args.input)
     model = import_dbt_schema_yml(
         schema_yml_text=schema_text,
         model_name=args.model_name,
@@ -3339,9 +3348,8 @@ def cmd_watch(args: argparse.Namespace) -> int:
                         for iss in all_issues:
                             sev = iss.severity.upper()
                             print(f"  [{sev}] {iss.code}: {iss.message}")
-                        error_count = sum(1 for i in all_issues if i.severity == "error")
-                        warn_count = sum(1 for i in all_issues if i.severity == "warn")
-                        print(f"  Result: {error_count} error(s), {warn_count} warning(s)")
+                        counts = severity_counts(all_issues)
+                        print(f"  Result: {counts['error']} error(s), {counts['warn']} warning(s)")
                     else:
                         print("  \u2713 Valid")
                 except Exception as exc:
@@ -3562,7 +3570,7 @@ def build_parser() -> argparse.ArgumentParser:
     import_sub = import_parser.add_subparsers(dest="import_command", required=True)
 
     import_sql_parser = import_sub.add_parser("sql", help="Import SQL DDL file")
-    import_sql_parser.add_argument("input", help="Path to SQL DDL file")
+    import_sql_parser.add_argument("input", help="Path to SQL DDL file (- for stdin)")
     import_sql_parser.add_argument("--out", help="Write output YAML model file")
     import_sql_parser.add_argument("--model-name", default="imported_sql_model", help="Model name")
     import_sql_parser.add_argument("--domain", default="imported", help="Domain value")
@@ -3576,7 +3584,7 @@ def build_parser() -> argparse.ArgumentParser:
     import_sql_parser.set_defaults(func=cmd_import_sql)
 
     import_dbml_parser = import_sub.add_parser("dbml", help="Import DBML file")
-    import_dbml_parser.add_argument("input", help="Path to DBML file")
+    import_dbml_parser.add_argument("input", help="Path to DBML file (- for stdin)")
     import_dbml_parser.add_argument("--out", help="Write output YAML model file")
     import_dbml_parser.add_argument("--model-name", default="imported_dbml_model", help="Model name")
     import_dbml_parser.add_argument("--domain", default="imported", help="Domain value")
@@ -3590,7 +3598,7 @@ def build_parser() -> argparse.ArgumentParser:
     import_dbml_parser.set_defaults(func=cmd_import_dbml)
 
     import_spark_parser = import_sub.add_parser("spark-schema", help="Import Spark schema JSON file")
-    import_spark_parser.add_argument("input", help="Path to Spark schema JSON file")
+    import_spark_parser.add_argument("input", help="Path to Spark schema JSON file (- for stdin)")
     import_spark_parser.add_argument("--out", help="Write output YAML model file")
     import_spark_parser.add_argument("--model-name", default="imported_spark_schema", help="Model name")
     import_spark_parser.add_argument("--table-name", help="Table name (for single StructType schemas)")
@@ -3600,7 +3608,7 @@ def build_parser() -> argparse.ArgumentParser:
     import_spark_parser.set_defaults(func=cmd_import_spark_schema)
 
     import_dbt_parser = import_sub.add_parser("dbt", help="Import dbt schema.yml file")
-    import_dbt_parser.add_argument("input", help="Path to dbt schema.yml file")
+    import_dbt_parser.add_argument("input", help="Path to dbt schema.yml file (- for stdin)")
     import_dbt_parser.add_argument("--out", help="Write output YAML model file")
     import_dbt_parser.add_argument("--model-name", default="imported_dbt_model", help="Model name")
     import_dbt_parser.add_argument("--domain", default="imported", help="Domain value")
@@ -4069,9 +4077,9 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     return args.func(args)
 
 
@@ -18,7 +18,6 @@ from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import yaml
-from jsonschema import Draft202012Validator
 
 from datalex_core.datalex.errors import DataLexError, DataLexErrorBag, SourceLocation
 from datalex_core.datalex.parse_cache import (
@@ -123,6 +122,8 @@ def _load_yaml_marked(path: Path, bag: DataLexErrorBag) -> Optional[Any]:
 
 
 _SCHEMA_CACHE: Dict[str, Dict[str, Any]] = {}
+# Validators are built once per kind, alongside the schema they compile.
+_VALIDATOR_CACHE: Dict[str, Any] = {}
 
 
 def _load_kind_schema(schemas_root: Path, kind: str) -> Optional[Dict[str, Any]]:
@@ -151,8 +152,15 @@ def _validate_against_kind_schema(
         )
         return
 
+    validator = _VALIDATOR_CACHE.get(kind)
+    if validator is None or validator.schema is not schema:
+        # Deferred: jsonschema is the single largest import in the CLI's start-up.
+        from jsonschema import Draft202012Validator
+
+        validator = Draft202012Validator(schema)
+        _VALIDATOR_CACHE[kind] = validator
+
     clean = _strip_marks(doc)
-    validator = Draft202012Validator(schema)
     for err in sorted(validator.iter_errors(clean), key=lambda e: list(e.absolute_path)):
         line, column = _lookup_mark(doc, list(err.absolute_path))
         bag.add(
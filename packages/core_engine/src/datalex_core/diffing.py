@@ -1,4 +1,6 @@
+import filecmp
 import glob
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -294,6 +296,13 @@ def _find_model_files(directory: str) -> Dict[str, str]:
     return models
 
 
+def _same_path(a: str, b: str) -> bool:
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return False
+
+
 def project_diff(
     old_dir: str,
     new_dir: str,
@@ -303,7 +312,10 @@ def project_diff(
     Returns a summary of added/removed/changed models and per-model diffs.
     """
     old_models = _find_model_files(old_dir)
-    new_models = _find_model_files(new_dir)
+    if _same_path(old_dir, new_dir):
+        new_models = dict(old_models)
+    else:
+        new_models = _find_model_files(new_dir)
 
     old_names = set(old_models.keys())
     new_names = set(new_models.keys())
@@ -316,6 +328,10 @@ def project_diff(
     all_breaking: List[str] = []
 
     for name in common_models:
+        # Byte-identical files (or the same file twice) cannot differ
+        # semantically; skip loading and diffing them.
+        if filecmp.cmp(old_models[name], new_models[name], shallow=False):
+            continue
         old_model = load_yaml_model(old_models[name])
         new_model = load_yaml_model(new_models[name])
         diff = semantic_diff(old_model, new_model)
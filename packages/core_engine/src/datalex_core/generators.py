@@ -16,12 +16,9 @@ def _to_snake(name: str) -> str:
     return "".join(out)
 
 
-def _sql_type(field_type: str, dialect: str) -> str:
-    value = field_type.strip().lower()
-    if value.startswith("decimal"):
-        return value.upper()
-
-    mapping_postgres = {
+# Built once at import; _sql_type runs for every generated column.
+_SQL_TYPE_MAPPINGS: Dict[str, Dict[str, str]] = {
+    "postgres": {
         "string": "TEXT",
         "integer": "INTEGER",
         "bigint": "BIGINT",
@@ -33,8 +30,8 @@ def _sql_type(field_type: str, dialect: str) -> str:
         "uuid": "UUID",
         "text": "TEXT",
         "binary": "BYTEA",
-    }
-    mapping_snowflake = {
+    },
+    "snowflake": {
         "string": "VARCHAR",
         "integer": "NUMBER",
         "bigint": "NUMBER",
@@ -46,8 +43,8 @@ def _sql_type(field_type: str, dialect: str) -> str:
         "uuid": "VARCHAR",
         "text": "VARCHAR",
         "binary": "BINARY",
-    }
-    mapping_bigquery = {
+    },
+    "bigquery": {
         "string": "STRING",
         "integer": "INT64",
         "bigint": "INT64",
@@ -59,8 +56,8 @@ def _sql_type(field_type: str, dialect: str) -> str:
         "uuid": "STRING",
         "text": "STRING",
         "binary": "BYTES",
-    }
-    mapping_databricks = {
+    },
+    "databricks": {
         "string": "STRING",
         "integer": "INT",
         "bigint": "BIGINT",
@@ -72,15 +69,19 @@ def _sql_type(field_type: str, dialect: str) -> str:
         "uuid": "STRING",
         "text": "STRING",
         "binary": "BINARY",
-    }
-
-    mappings = {
-        "postgres": mapping_postgres,
-        "snowflake": mapping_snowflake,
-        "bigquery": mapping_bigquery,
-        "databricks": mapping_databricks,
-    }
-    mapping = mappings.get(dialect, mapping_postgres)
+    },
+}
+
+# Standard description written by older Snowflake connector pulls.
+_SNOWFLAKE_PULL_DESCRIPTION = re.compile(r"Pulled from Snowflake [^\s.]+\.[^\s.]+\.([^\s]+) on ")
+
+
+def _sql_type(field_type: str, dialect: str) -> str:
+    value = field_type.strip().lower()
+    if value.startswith("decimal"):
+        return value.upper()
+
+    mapping = _SQL_TYPE_MAPPINGS.get(dialect, _SQL_TYPE_MAPPINGS["postgres"])
     return mapping.get(value, field_type)
 
 
@@ -91,7 +92,7 @@ def _qualified_name(entity: Dict[str, Any], dialect: str) -> str:
         # Backward-compatible fallback: older connector pulls didn't store physical_name.
         # Try to recover the warehouse identifier from the standard "Pulled from ..." description.
         desc = str(entity.get("description") or "")
-        m = re.search(r"Pulled from Snowflake [^\s.]+\.[^\s.]+\.([^\s]+) on ", desc)
+        m = _SNOWFLAKE_PULL_DESCRIPTION.search(desc)
         if m:
             inferred_physical = m.group(1)
 
@@ -265,6 +266,10 @@ def generate_sql_ddl(model: Dict[str, Any], dialect: str = "postgres") -> str:
             create_sql = dim_header + "\n" + create_sql
         create_blocks.append(create_sql)
 
+    # BigQuery gets neither foreign keys nor indexes, so skip both loops.
+    if dialect == "bigquery":
+        relationships = indexes = []
+
     for rel in relationships:
         from_ref = str(rel.get("from", ""))
         to_ref = str(rel.get("to", ""))
@@ -293,9 +298,6 @@ def generate_sql_ddl(model: Dict[str, Any], dialect: str = "postgres") -> str:
         child_qualified = _qualified_name(entity_map.get(child_entity, {"name": child_entity}), dialect)
         parent_qualified = _qualified_name(entity_map.get(parent_entity, {"name": parent_entity}), dialect)
 
-        if dialect == "bigquery":
-            continue
-
         alter_sql = (
             f"ALTER TABLE {child_qualified} "
             f'ADD CONSTRAINT "{constraint}" FOREIGN KEY ("{child_field}") '
@@ -314,9 +316,6 @@ def generate_sql_ddl(model: Dict[str, Any], dialect: str = "postgres") -> str:
         cols = ", ".join([f'"{f}"' for f in idx_fields])
         unique_kw = "UNIQUE " if idx_unique else ""
 
-        if dialect == "bigquery":
-            continue
-
         index_blocks.append(
             f'CREATE {unique_kw}INDEX "{idx_name}" ON {qualified} ({cols});'
         )
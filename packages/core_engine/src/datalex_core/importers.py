@@ -1,10 +1,23 @@
 import json
 import re
 from datetime import date
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 
+# The DDL constraint patterns below run against user-supplied text. When the
+# optional `google-re2` package is installed they are compiled with RE2,
+# whose linear-time matching cannot blow up on pathological input (e.g. an
+# unterminated CHECK clause). RE2's \w, \s and \b are ASCII-only while
+# re's are Unicode-aware, so only patterns that spell every character class
+# out in ASCII go through RE2; identifier patterns stay on re.
+try:
+    import re2 as _re_ascii
+except ImportError:
+    _re_ascii = re
+
+_SQL_SPACE = r"[ \t\n\r\f\v]"
+
 
 CREATE_TABLE_RE = re.compile(
     r"create\s+table\s+(?:if\s+not\s+exists\s+)?([\w\"\.\.]+)\s*\((.*?)\)\s*;",
@@ -22,8 +35,19 @@ CREATE_INDEX_RE = re.compile(
     r"create\s+(?:unique\s+)?index\s+(?:if\s+not\s+exists\s+)?([\w\"]+)\s+on\s+([\w\"\.\.]+)\s*\(([^)]+)\)",
     flags=re.IGNORECASE,
 )
+CREATE_UNIQUE_INDEX_RE = _re_ascii.compile(rf"(?i)create{_SQL_SPACE}+unique{_SQL_SPACE}+index")
+PAREN_LIST_RE = _re_ascii.compile(r"\((.*?)\)")
+TABLE_FK_RE = re.compile(
+    r"foreign\s+key\s*\((.*?)\)\s+references\s+([\w\"\.\.]+)\s*\((.*?)\)",
+    flags=re.IGNORECASE,
+)
+COLUMN_RE = re.compile(r"^\s*\"?([A-Za-z_][A-Za-z0-9_]*)\"?\s+([^\s,]+(?:\([^)]*\))?)(.*)$")
+COLUMN_REF_RE = re.compile(r"references\s+([\w\"\.\.]+)\s*\((.*?)\)", flags=re.IGNORECASE)
+DEFAULT_RE = _re_ascii.compile(rf"(?i)default{_SQL_SPACE}+('(?:[^']*)'|[^ \t\n\r\f\v]+)")
+CHECK_RE = _re_ascii.compile(rf"(?i)check{_SQL_SPACE}*\((.+?)\)")
 TABLE_RE = re.compile(r"^\s*table\s+([\w\"]+)\s*\{\s*$", flags=re.IGNORECASE)
 REF_RE = re.compile(r"^\s*ref\s*:\s*([\w]+)\.([\w]+)\s*([<>-]+)\s*([\w]+)\.([\w]+)", flags=re.IGNORECASE)
+DBML_FIELD_RE = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)\s+([^\s\[]+)(?:\s*\[(.*?)\])?$")
 DBT_REF_RE = re.compile(r"ref\(\s*['\"]([^'\"]+)['\"]\s*\)", flags=re.IGNORECASE)
 DBT_SOURCE_RE = re.compile(
     r"source\(\s*['\"]([^'\"]+)['\"]\s*,\s*['\"]([^'\"]+)['\"]\s*\)",
@@ -106,7 +130,7 @@ def _default_model(model_name: str, domain: str, owners: List[str]) -> Dict[str,
 
 def _parse_default_value(rest: str) -> Optional[str]:
     """Extract DEFAULT value from column definition tail."""
-    m = re.search(r"default\s+('(?:[^']*)'|\S+)", rest, re.IGNORECASE)
+    m = DEFAULT_RE.search(rest)
     if m:
         val = m.group(1).strip("'")
         return val
@@ -115,7 +139,7 @@ def _parse_default_value(rest: str) -> Optional[str]:
 
 def _parse_check_constraint(rest: str) -> Optional[str]:
     """Extract CHECK constraint expression from column definition tail."""
-    m = re.search(r"check\s*\((.+?)\)", rest, re.IGNORECASE)
+    m = CHECK_RE.search(rest)
     if m:
         return m.group(1).strip()
     return None
@@ -145,7 +169,8 @@ def import_sql_ddl(
             schema_name = parts[-2]
         table_raw = parts[-1]
         entity_name = _to_pascal(table_raw)
-        entity_fields.setdefault(entity_name, [])
+        # Bound append: a wide table body adds one field per column definition.
+        add_field = entity_fields.setdefault(entity_name, []).append
         primary_keys.setdefault(entity_name, [])
         if schema_name:
             entity_meta.setdefault(entity_name, {})["schema"] = schema_name
@@ -154,18 +179,14 @@ def import_sql_ddl(
         for definition in _split_top_level(body):
             lowered = definition.lower()
             if lowered.startswith("primary key"):
-                cols_match = re.search(r"\((.*?)\)", definition)
+                cols_match = PAREN_LIST_RE.search(definition)
                 if cols_match:
                     cols = [col.strip().replace('"', "") for col in cols_match.group(1).split(",")]
                     primary_keys[entity_name].extend(cols)
                 continue
 
             if lowered.startswith("foreign key"):
-                fk_match = re.search(
-                    r"foreign\s+key\s*\((.*?)\)\s+references\s+([\w\"\.\.]+)\s*\((.*?)\)",
-                    definition,
-                    flags=re.IGNORECASE,
-                )
+                fk_match = TABLE_FK_RE.search(definition)
                 if fk_match:
                     local_field = fk_match.group(1).strip().replace('"', "")
                     ref_table = fk_match.group(2).strip().split(".")[-1].replace('"', "")
@@ -186,7 +207,7 @@ def import_sql_ddl(
             if lowered.startswith("check") or (lowered.startswith("constraint") and "check" in lowered):
                 continue
 
-            col_match = re.match(r"^\s*\"?([A-Za-z_][A-Za-z0-9_]*)\"?\s+([^\s,]+(?:\([^)]*\))?)(.*)$", definition)
+            col_match = COLUMN_RE.match(definition)
             if not col_match:
                 continue
 
@@ -213,11 +234,7 @@ def import_sql_ddl(
             if check_expr:
                 field["check"] = check_expr
 
-            ref_match = re.search(
-                r"references\s+([\w\"\.\.]+)\s*\((.*?)\)",
-                rest,
-                flags=re.IGNORECASE,
-            )
+            ref_match = COLUMN_REF_RE.search(rest)
             if ref_match:
                 ref_table = ref_match.group(1).strip().split(".")[-1].replace('"', "")
                 ref_field = ref_match.group(2).strip().replace('"', "")
@@ -233,7 +250,7 @@ def import_sql_ddl(
                     }
                 )
 
-            entity_fields[entity_name].append(field)
+            add_field(field)
 
     # --- Parse CREATE VIEW / CREATE MATERIALIZED VIEW ---
     for m in CREATE_MVIEW_RE.finditer(ddl_text):
@@ -258,7 +275,7 @@ def import_sql_ddl(
         idx_cols = [c.strip().replace('"', '') for c in m.group(3).split(",")]
         # Check for UNIQUE by looking at the full matched statement prefix
         stmt_prefix = ddl_text[max(0, m.start()-50):m.start() + 30].lower()
-        is_unique = bool(re.search(r"create\s+unique\s+index", stmt_prefix, re.IGNORECASE))
+        is_unique = bool(CREATE_UNIQUE_INDEX_RE.search(stmt_prefix))
         idx_entity = _to_pascal(idx_table)
         indexes.append({
             "name": idx_name,
@@ -268,6 +285,8 @@ def import_sql_ddl(
         })
 
     # --- Build entities ---
+    description = f"Imported from SQL on {date.today().isoformat()}"
+    add_entity = model["entities"].append
     for entity_name, fields in sorted(entity_fields.items()):
         pk_set = {value for value in primary_keys.get(entity_name, []) if value}
         for field in fields:
@@ -279,12 +298,12 @@ def import_sql_ddl(
         entity: Dict[str, Any] = {
             "name": entity_name,
             "type": meta.get("type", "table"),
-            "description": f"Imported from SQL on {date.today().isoformat()}",
+            "description": description,
             "fields": fields,
         }
         if meta.get("schema"):
             entity["schema"] = meta["schema"]
-        model["entities"].append(entity)
+        add_entity(entity)
 
     deduped: Dict[Tuple[str, str, str, str], Dict[str, str]] = {}
     for rel in relationships:
@@ -358,10 +377,7 @@ def import_dbml(
 
         if current_entity:
             # Example: user_id integer [pk, not null, unique]
-            field_match = re.match(
-                r"^([A-Za-z_][A-Za-z0-9_]*)\s+([^\s\[]+)(?:\s*\[(.*?)\])?$",
-                line,
-            )
+            field_match = DBML_FIELD_RE.match(line)
             if not field_match:
                 continue
 
@@ -684,7 +700,7 @@ def _semantic_measure_field_type(agg: str) -> str:
 
 
 def import_dbt_schema_yml(
-    schema_yml_text: str,
+    schema_yml_text: Union[str, bytes],
     model_name: str = "imported_dbt_model",
     domain: str = "imported",
     owners: List[str] = None,
@@ -692,6 +708,7 @@ def import_dbt_schema_yml(
     owners = owners or ["data-team@example.com"]
     model = _default_model(model_name=model_name, domain=domain, owners=owners)
 
+    # Bytes go straight to the YAML reader, which decodes them itself.
     loaded = yaml.safe_load(schema_yml_text) or {}
     if not isinstance(loaded, dict):
         return model
@@ -1,3 +1,5 @@
+import sys
+from collections import Counter
 from dataclasses import dataclass
 from typing import Iterable, List
 
@@ -9,11 +11,24 @@ class Issue:
     message: str
     path: str = "/"
 
+    def __post_init__(self) -> None:
+        # Large models emit thousands of issues sharing a handful of codes and
+        # severities; interning makes them share one string object each.
+        if type(self.code) is str:
+            object.__setattr__(self, "code", sys.intern(self.code))
+        if type(self.severity) is str:
+            object.__setattr__(self, "severity", sys.intern(self.severity))
+
 
 def has_errors(issues: Iterable[Issue]) -> bool:
     return any(issue.severity == "error" for issue in issues)
 
 
+def severity_counts(issues: Iterable[Issue]) -> "Counter[str]":
+    """Count issues per severity in one pass; missing severities read as 0."""
+    return Counter(issue.severity for issue in issues)
+
+
 def to_lines(issues: List[Issue]) -> List[str]:
     lines = []
     for issue in issues:
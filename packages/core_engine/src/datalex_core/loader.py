@@ -3,6 +3,11 @@ from typing import Any, Dict
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 def load_yaml_model(path: str) -> Dict[str, Any]:
     model_path = Path(path)
@@ -10,7 +15,7 @@ def load_yaml_model(path: str) -> Dict[str, Any]:
         raise FileNotFoundError(f"Model file not found: {path}")
 
     with model_path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle)
+        data = yaml.load(handle, Loader=_SafeLoader)
 
     if data is None:
         return {}
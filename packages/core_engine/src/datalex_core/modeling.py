@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from functools import lru_cache
 import re
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
@@ -21,15 +22,26 @@ PHYSICAL_ENTITY_TYPES = {
 }
 SUPPORTED_NAMING_STYLES = {"pascal_case", "snake_case", "lower_snake_case", "upper_snake_case"}
 
+_NON_ALNUM = re.compile(r"[^A-Za-z0-9]+")
+_CAMEL_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+_REPEATED_UNDERSCORE = re.compile(r"__+")
+_SNAKE_CASE = re.compile(r"[a-z][a-z0-9_]*")
+_STYLE_PATTERNS = {
+    "pascal_case": re.compile(r"[A-Z][A-Za-z0-9]*"),
+    "snake_case": _SNAKE_CASE,
+    "lower_snake_case": _SNAKE_CASE,
+    "upper_snake_case": re.compile(r"[A-Z][A-Z0-9_]*"),
+}
+
 
 def _clone(model: Dict[str, Any]) -> Dict[str, Any]:
     return deepcopy(model) if isinstance(model, dict) else {}
 
 
 def _to_snake(text: str) -> str:
-    cleaned = re.sub(r"[^A-Za-z0-9]+", "_", str(text or "").strip())
-    cleaned = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", cleaned)
-    cleaned = re.sub(r"__+", "_", cleaned).strip("_").lower()
+    cleaned = _NON_ALNUM.sub("_", str(text or "").strip())
+    cleaned = _CAMEL_BOUNDARY.sub(r"\1_\2", cleaned)
+    cleaned = _REPEATED_UNDERSCORE.sub("_", cleaned).strip("_").lower()
     if not cleaned:
         return ""
     if cleaned[0].isdigit():
@@ -38,7 +50,7 @@ def _to_snake(text: str) -> str:
 
 
 def _to_pascal(text: str) -> str:
-    parts = re.split(r"[^A-Za-z0-9]+", str(text or "").strip())
+    parts = _NON_ALNUM.split(str(text or "").strip())
     joined = "".join(p[:1].upper() + p[1:] for p in parts if p)
     return joined or "Entity"
 
@@ -238,13 +250,14 @@ def _style_rule(naming_rules: Dict[str, Any], key: str) -> Tuple[str, str]:
 def _matches_style(value: str, style: str) -> bool:
     if not value or not style:
         return True
-    if style == "pascal_case":
-        return bool(re.fullmatch(r"[A-Z][A-Za-z0-9]*", value))
-    if style in {"snake_case", "lower_snake_case"}:
-        return bool(re.fullmatch(r"[a-z][a-z0-9_]*", value))
-    if style == "upper_snake_case":
-        return bool(re.fullmatch(r"[A-Z][A-Z0-9_]*", value))
-    return True
+    pattern = _STYLE_PATTERNS.get(style)
+    return pattern is None or pattern.fullmatch(value) is not None
+
+
+@lru_cache(maxsize=256)
+def _naming_pattern(pattern: str) -> "re.Pattern[str]":
+    # naming_rules patterns repeat for every entity, field and index checked.
+    return re.compile(pattern)
 
 
 def _apply_style(value: str, style: str) -> str:
@@ -339,14 +352,16 @@ def standards_issues(model: Dict[str, Any]) -> List[Issue]:
         if isinstance(item, dict)
     }
 
+    entity_style, entity_pattern = _style_rule(naming_rules, "entity")
+    field_style, field_pattern = _style_rule(naming_rules, "field")
+    physical_style, physical_pattern = _style_rule(naming_rules, "physical_name")
     for entity in _coerce_list(normalized.get("entities")):
         if not isinstance(entity, dict):
             continue
         entity_name = str(entity.get("name") or "")
-        entity_style, entity_pattern = _style_rule(naming_rules, "entity")
         if entity_style and not _matches_style(entity_name, entity_style):
             issues.append(Issue("warn", "ENTITY_NAMING_RULE", f"Entity '{entity_name}' does not match naming rule '{entity_style}'.", f"/entities/{entity_name}/name"))
-        if entity_pattern and not re.fullmatch(entity_pattern, entity_name):
+        if entity_pattern and not _naming_pattern(entity_pattern).fullmatch(entity_name):
             issues.append(Issue("warn", "ENTITY_NAMING_PATTERN", f"Entity '{entity_name}' does not match configured pattern '{entity_pattern}'.", f"/entities/{entity_name}/name"))
 
         area = str(entity.get("subject_area") or "").strip()
@@ -361,37 +376,35 @@ def standards_issues(model: Dict[str, Any]) -> List[Issue]:
             if not isinstance(field, dict):
                 continue
             field_name = str(field.get("name") or "")
-            field_style, field_pattern = _style_rule(naming_rules, "field")
             if field_style and not _matches_style(field_name, field_style):
                 issues.append(Issue("warn", "FIELD_NAMING_RULE", f"Field '{entity_name}.{field_name}' does not match naming rule '{field_style}'.", f"/entities/{entity_name}/fields/{field_name}/name"))
-            if field_pattern and not re.fullmatch(field_pattern, field_name):
+            if field_pattern and not _naming_pattern(field_pattern).fullmatch(field_name):
                 issues.append(Issue("warn", "FIELD_NAMING_PATTERN", f"Field '{entity_name}.{field_name}' does not match configured pattern '{field_pattern}'.", f"/entities/{entity_name}/fields/{field_name}/name"))
             domain_name = str(field.get("domain") or "").strip()
             if domain_name and domain_name not in domains:
                 issues.append(Issue("warn", "DOMAIN_NOT_FOUND", f"Field '{entity_name}.{field_name}' references missing domain '{domain_name}'.", f"/entities/{entity_name}/fields/{field_name}/domain"))
 
-        physical_style, physical_pattern = _style_rule(naming_rules, "physical_name")
         physical_name = str(entity.get("physical_name") or "")
         if physical_name:
             if physical_style and not _matches_style(physical_name, physical_style):
                 issues.append(Issue("warn", "PHYSICAL_NAME_RULE", f"physical_name '{physical_name}' does not match naming rule '{physical_style}'.", f"/entities/{entity_name}/physical_name"))
-            if physical_pattern and not re.fullmatch(physical_pattern, physical_name):
+            if physical_pattern and not _naming_pattern(physical_pattern).fullmatch(physical_name):
                 issues.append(Issue("warn", "PHYSICAL_NAME_PATTERN", f"physical_name '{physical_name}' does not match configured pattern '{physical_pattern}'.", f"/entities/{entity_name}/physical_name"))
 
+    style, pattern = _style_rule(naming_rules, "relationship")
     for relationship in _coerce_list(normalized.get("relationships")):
         name = str(relationship.get("name") or "")
-        style, pattern = _style_rule(naming_rules, "relationship")
         if style and name and not _matches_style(name, style):
             issues.append(Issue("warn", "RELATIONSHIP_NAMING_RULE", f"Relationship '{name}' does not match naming rule '{style}'.", "/relationships"))
-        if pattern and name and not re.fullmatch(pattern, name):
+        if pattern and name and not _naming_pattern(pattern).fullmatch(name):
             issues.append(Issue("warn", "RELATIONSHIP_NAMING_PATTERN", f"Relationship '{name}' does not match configured pattern '{pattern}'.", "/relationships"))
 
+    style, pattern = _style_rule(naming_rules, "index")
     for index in _coerce_list(normalized.get("indexes")):
         name = str(index.get("name") or "")
-        style, pattern = _style_rule(naming_rules, "index")
         if style and name and not _matches_style(name, style):
             issues.append(Issue("warn", "INDEX_NAMING_RULE", f"Index '{name}' does not match naming rule '{style}'.", "/indexes"))
-        if pattern and name and not re.fullmatch(pattern, name):
+        if pattern and name and not _naming_pattern(pattern).fullmatch(name):
             issues.append(Issue("warn", "INDEX_NAMING_PATTERN", f"Index '{name}' does not match configured pattern '{pattern}'.", "/indexes"))
 
     return issues
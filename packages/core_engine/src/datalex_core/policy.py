@@ -1,9 +1,22 @@
+import functools
+import json
 import re
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set
+from types import CodeType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional: stdlib json is used when absent
+    _orjson = None
+
 from datalex_core.issues import Issue
 from datalex_core.modeling import normalize_model
 
@@ -13,8 +26,17 @@ def load_policy_pack(path: str) -> Dict[str, Any]:
     if not policy_path.exists():
         raise FileNotFoundError(f"Policy pack not found: {path}")
 
-    with policy_path.open("r", encoding="utf-8") as handle:
-        loaded = yaml.safe_load(handle)
+    if policy_path.suffix.lower() == ".json":
+        raw = policy_path.read_bytes()
+        try:
+            loaded = _orjson.loads(raw) if _orjson is not None else json.loads(raw)
+        except ValueError:
+            # Not strict JSON: the YAML loader either reads it (YAML is a
+            # superset) or raises yaml.YAMLError, as it did for every pack.
+            loaded = yaml.load(raw, Loader=_SafeLoader)
+    else:
+        with policy_path.open("r", encoding="utf-8") as handle:
+            loaded = yaml.load(handle, Loader=_SafeLoader)
 
     if loaded is None:
         return {}
@@ -22,9 +44,79 @@ def load_policy_pack(path: str) -> Dict[str, Any]:
     if not isinstance(loaded, dict):
         raise ValueError("Policy pack must parse to a YAML object at root.")
 
+    _precompile_policies(loaded)
     return loaded
 
 
+# Used with fullmatch, so no anchors are needed.
+_EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def _is_email(value: str) -> bool:
+    value = value.strip()
+    # Owners without an '@' (team names, handles) are rejected without
+    # running the regex.
+    return "@" in value and _EMAIL_PATTERN.fullmatch(value) is not None
+
+
+@functools.lru_cache(maxsize=512)
+def _compile(pattern: str) -> Tuple[Optional["re.Pattern[str]"], Optional[str]]:
+    """Compile a policy regex once per process.
+
+    Returns ``(pattern, None)`` on success or ``(None, error)`` when the
+    pattern is invalid, so misconfigured policies are cached too.
+    """
+    try:
+        return re.compile(pattern), None
+    except re.error as err:
+        return None, str(err)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_expression(expression: str) -> Tuple[Optional[CodeType], Optional[str]]:
+    """Compile a custom_expression once per process (see ``_compile``)."""
+    try:
+        return compile(expression, "<policy>", "eval"), None
+    except (SyntaxError, ValueError) as err:
+        return None, str(err)
+
+
+_NAMING_PATTERN_KEYS = ("entity_pattern", "field_pattern", "relationship_pattern", "index_pattern")
+
+
+def _precompile_policies(pack: Dict[str, Any]) -> None:
+    """Warm the regex and expression caches for every policy in *pack*.
+
+    Evaluation then only matches; invalid patterns are still reported as
+    MISCONFIGURED by the handlers, which read the cached error.
+    """
+    policies = pack.get("policies")
+    if not isinstance(policies, list):
+        return
+    for policy in policies:
+        if not isinstance(policy, dict) or not isinstance(policy.get("params"), dict):
+            continue
+        policy_type = policy.get("type")
+        params = policy["params"]
+        if policy_type == "naming_convention":
+            patterns = [params.get(key) for key in _NAMING_PATTERN_KEYS]
+        elif policy_type == "classification_required_for_tags":
+            patterns = [params.get("field_name_regex")]
+        elif policy_type == "regex_per_layer":
+            raw = params.get("patterns")
+            patterns = [str(v) for v in raw.values()] if isinstance(raw, dict) else []
+        elif policy_type == "custom_expression":
+            expression = str(params.get("expression", "")).strip()
+            if expression:
+                _compile_expression(expression)
+            continue
+        else:
+            continue
+        for pattern in patterns:
+            if isinstance(pattern, str) and pattern.strip():
+                _compile(pattern)
+
+
 def _policy_issue(severity: str, code: str, message: str, path: str = "/") -> Issue:
     return Issue(severity=severity, code=code, message=message, path=path)
 
@@ -37,15 +129,17 @@ def _normalize_list(value: Any) -> List[str]:
     return []
 
 
-def _field_refs(model: Dict[str, Any]) -> Set[str]:
-    refs: Set[str] = set()
+def _filter_set(value: Any) -> Optional[FrozenSet[str]]:
+    """Membership set for an optional list filter; ``None`` means no filter."""
+    return frozenset(_normalize_list(value)) or None
+
+
+def _iter_entity_fields(
+    model: Dict[str, Any],
+) -> Iterator[Tuple[Dict[str, Any], str, List[Dict[str, Any]]]]:
+    """Yield ``(entity, entity_name, fields)`` with each lookup done once."""
     for entity in model.get("entities", []):
-        entity_name = entity.get("name", "")
-        for field in entity.get("fields", []):
-            field_name = field.get("name", "")
-            if entity_name and field_name:
-                refs.add(f"{entity_name}.{field_name}")
-    return refs
+        yield entity, str(entity.get("name", "")), entity.get("fields", [])
 
 
 def _classification(model: Dict[str, Any]) -> Dict[str, str]:
@@ -110,9 +204,8 @@ def _require_field_descriptions(
     exempt_primary_key = bool(params.get("exempt_primary_key", True))
     issues: List[Issue] = []
 
-    for entity in model.get("entities", []):
-        entity_name = str(entity.get("name", ""))
-        for field in entity.get("fields", []):
+    for _, entity_name, fields in _iter_entity_fields(model):
+        for field in fields:
             field_name = str(field.get("name", ""))
             if exempt_primary_key and field.get("primary_key") is True:
                 continue
@@ -142,9 +235,8 @@ def _classification_required_for_tags(
 
     compiled_pattern: Optional[re.Pattern[str]] = None
     if isinstance(name_regex, str) and name_regex.strip():
-        try:
-            compiled_pattern = re.compile(name_regex)
-        except re.error:
+        compiled_pattern, error = _compile(name_regex)
+        if error is not None:
             return [
                 _policy_issue(
                     "error",
@@ -157,9 +249,8 @@ def _classification_required_for_tags(
     classification = _classification(model)
     issues: List[Issue] = []
 
-    for entity in model.get("entities", []):
-        entity_name = str(entity.get("name", ""))
-        for field in entity.get("fields", []):
+    for _, entity_name, fields in _iter_entity_fields(model):
+        for field in fields:
             field_name = str(field.get("name", ""))
             ref = f"{entity_name}.{field_name}"
             field_tags = set(_normalize_list(field.get("tags")))
@@ -204,7 +295,6 @@ def _rule_target_required(
     params: Dict[str, Any],
 ) -> List[Issue]:
     target_types = set(_normalize_list(params.get("field_types")))
-    refs = _field_refs(model)
     rule_targets = {
         str(rule.get("target", ""))
         for rule in model.get("rules", [])
@@ -212,13 +302,14 @@ def _rule_target_required(
     }
 
     issues: List[Issue] = []
-    for entity in model.get("entities", []):
-        entity_name = str(entity.get("name", ""))
-        for field in entity.get("fields", []):
+    for entity, entity_name, fields in _iter_entity_fields(model):
+        if not entity.get("name"):
+            continue
+        for field in fields:
+            if not field.get("name"):
+                continue
             field_name = str(field.get("name", ""))
             ref = f"{entity_name}.{field_name}"
-            if ref not in refs:
-                continue
 
             field_type = str(field.get("type", "")).lower()
             if target_types and field_type not in target_types:
@@ -251,21 +342,18 @@ def _naming_convention(
     patterns: Dict[str, Optional[re.Pattern[str]]] = {}
     issues: List[Issue] = []
 
-    for label, pat_str in [
-        ("entity_pattern", entity_pattern_str),
-        ("field_pattern", field_pattern_str),
-        ("relationship_pattern", relationship_pattern_str),
-        ("index_pattern", index_pattern_str),
-    ]:
+    for label, pat_str in zip(
+        _NAMING_PATTERN_KEYS,
+        (entity_pattern_str, field_pattern_str, relationship_pattern_str, index_pattern_str),
+    ):
         if pat_str is None:
             patterns[label] = None
             continue
         if not isinstance(pat_str, str) or not pat_str.strip():
             patterns[label] = None
             continue
-        try:
-            patterns[label] = re.compile(pat_str)
-        except re.error:
+        patterns[label], error = _compile(pat_str)
+        if error is not None:
             return [
                 _policy_issue(
                     "error",
@@ -289,68 +377,103 @@ def _naming_convention(
     fp = patterns.get("field_pattern")
     rp = patterns.get("relationship_pattern")
     ip = patterns.get("index_pattern")
+    code = f"POLICY_{policy_id}"
 
-    for entity in model.get("entities", []):
-        entity_name = str(entity.get("name", ""))
-        if ep and not ep.fullmatch(entity_name):
-            issues.append(
-                _policy_issue(
-                    severity,
-                    f"POLICY_{policy_id}",
-                    f"Entity name '{entity_name}' does not match pattern '{entity_pattern_str}'.",
-                    f"/entities/{entity_name}",
-                )
-            )
-        if fp:
-            for field in entity.get("fields", []):
-                field_name = str(field.get("name", ""))
-                if not fp.fullmatch(field_name):
-                    issues.append(
-                        _policy_issue(
-                            severity,
-                            f"POLICY_{policy_id}",
-                            f"Field name '{entity_name}.{field_name}' does not match pattern '{field_pattern_str}'.",
-                            f"/entities/{entity_name}/fields/{field_name}",
-                        )
-                    )
+    # Bound fullmatch methods keep attribute lookups out of the per-name loops.
+    entity_match = ep.fullmatch if ep else None
+    field_match = fp.fullmatch if fp else None
 
-    if rp:
-        for rel in model.get("relationships", []):
-            rel_name = str(rel.get("name", ""))
-            if not rp.fullmatch(rel_name):
+    if entity_match or field_match:
+        for entity in model.get("entities", []):
+            entity_name = str(entity.get("name", ""))
+            if entity_match and not entity_match(entity_name):
                 issues.append(
                     _policy_issue(
                         severity,
-                        f"POLICY_{policy_id}",
-                        f"Relationship name '{rel_name}' does not match pattern '{relationship_pattern_str}'.",
-                        f"/relationships/{rel_name}",
+                        code,
+                        f"Entity name '{entity_name}' does not match pattern '{entity_pattern_str}'.",
+                        f"/entities/{entity_name}",
                     )
                 )
-
-    if ip:
-        for idx in model.get("indexes", []):
-            idx_name = str(idx.get("name", ""))
-            if not ip.fullmatch(idx_name):
-                issues.append(
+            if field_match:
+                field_names = [str(field.get("name", "")) for field in entity.get("fields", [])]
+                issues.extend(
                     _policy_issue(
                         severity,
-                        f"POLICY_{policy_id}",
-                        f"Index name '{idx_name}' does not match pattern '{index_pattern_str}'.",
-                        f"/indexes/{idx_name}",
+                        code,
+                        f"Field name '{entity_name}.{field_name}' does not match pattern '{field_pattern_str}'.",
+                        f"/entities/{entity_name}/fields/{field_name}",
                     )
+                    for field_name in field_names
+                    if not field_match(field_name)
                 )
 
+    if rp:
+        rel_match = rp.fullmatch
+        rel_names = [str(rel.get("name", "")) for rel in model.get("relationships", [])]
+        issues.extend(
+            _policy_issue(
+                severity,
+                code,
+                f"Relationship name '{rel_name}' does not match pattern '{relationship_pattern_str}'.",
+                f"/relationships/{rel_name}",
+            )
+            for rel_name in rel_names
+            if not rel_match(rel_name)
+        )
+
+    if ip:
+        idx_match = ip.fullmatch
+        idx_names = [str(idx.get("name", "")) for idx in model.get("indexes", [])]
+        issues.extend(
+            _policy_issue(
+                severity,
+                code,
+                f"Index name '{idx_name}' does not match pattern '{index_pattern_str}'.",
+                f"/indexes/{idx_name}",
+            )
+            for idx_name in idx_names
+            if not idx_match(idx_name)
+        )
+
     return issues
 
 
+class _EntityInfo(NamedTuple):
+    """Per-entity values shared by the entity-scoped require_* policies."""
+
+    entity: Dict[str, Any]
+    name: str
+    type: str
+    tags: FrozenSet[str]
+
+
+def _entity_infos(model: Dict[str, Any]) -> List[_EntityInfo]:
+    """Normalize every entity's name, type and tags in one pass.
+
+    ``policy_issues`` builds this once per model and hands it to each
+    handler in ``_ENTITY_INFO_HANDLERS``; direct callers get it built lazily.
+    """
+    return [
+        _EntityInfo(
+            entity,
+            str(entity.get("name", "")),
+            str(entity.get("type", "table")).lower(),
+            frozenset(_normalize_list(entity.get("tags", []))),
+        )
+        for entity in model.get("entities", [])
+    ]
+
+
 def _require_indexes(
     model: Dict[str, Any],
     severity: str,
     policy_id: str,
     params: Dict[str, Any],
+    entity_infos: Optional[List[_EntityInfo]] = None,
 ) -> List[Issue]:
     min_fields = int(params.get("min_fields", 5))
-    entity_types = set(_normalize_list(params.get("entity_types", ["table"])))
+    entity_types = _filter_set(params.get("entity_types", ["table"]))
 
     indexed_entities: Set[str] = set()
     for idx in model.get("indexes", []):
@@ -359,10 +482,8 @@ def _require_indexes(
             indexed_entities.add(ent)
 
     issues: List[Issue] = []
-    for entity in model.get("entities", []):
-        entity_name = str(entity.get("name", ""))
-        entity_type = str(entity.get("type", "table")).lower()
-        if entity_types and entity_type not in entity_types:
+    for entity, entity_name, entity_type, _ in entity_infos or _entity_infos(model):
+        if entity_types is not None and entity_type not in entity_types:
             continue
         field_count = len(entity.get("fields", []))
         if field_count >= min_fields and entity_name not in indexed_entities:
@@ -383,16 +504,14 @@ def _require_owner(
     severity: str,
     policy_id: str,
     params: Dict[str, Any],
+    entity_infos: Optional[List[_EntityInfo]] = None,
 ) -> List[Issue]:
-    entity_types = set(_normalize_list(params.get("entity_types", [])))
+    entity_types = _filter_set(params.get("entity_types", []))
     require_email = bool(params.get("require_email", False))
-    email_pattern = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
     issues: List[Issue] = []
-    for entity in model.get("entities", []):
-        entity_name = str(entity.get("name", ""))
-        entity_type = str(entity.get("type", "table")).lower()
-        if entity_types and entity_type not in entity_types:
+    for entity, entity_name, entity_type, _ in entity_infos or _entity_infos(model):
+        if entity_types is not None and entity_type not in entity_types:
             continue
 
         owner = entity.get("owner")
@@ -405,7 +524,7 @@ def _require_owner(
                     f"/entities/{entity_name}",
                 )
             )
-        elif require_email and isinstance(owner, str) and not email_pattern.match(owner.strip()):
+        elif require_email and isinstance(owner, str) and not _is_email(owner):
             issues.append(
                 _policy_issue(
                     severity,
@@ -423,21 +542,19 @@ def _require_sla(
     severity: str,
     policy_id: str,
     params: Dict[str, Any],
+    entity_infos: Optional[List[_EntityInfo]] = None,
 ) -> List[Issue]:
-    entity_types = set(_normalize_list(params.get("entity_types", ["table"])))
-    required_tags = set(_normalize_list(params.get("required_tags", [])))
+    entity_types = _filter_set(params.get("entity_types", ["table"]))
+    required_tags = _filter_set(params.get("required_tags", []))
     require_freshness = bool(params.get("require_freshness", True))
     require_quality_score = bool(params.get("require_quality_score", False))
 
     issues: List[Issue] = []
-    for entity in model.get("entities", []):
-        entity_name = str(entity.get("name", ""))
-        entity_type = str(entity.get("type", "table")).lower()
-        entity_tags = set(_normalize_list(entity.get("tags", [])))
+    for entity, entity_name, entity_type, entity_tags in entity_infos or _entity_infos(model):
 
-        if entity_types and entity_type not in entity_types:
+        if entity_types is not None and entity_type not in entity_types:
             continue
-        if required_tags and not required_tags.intersection(entity_tags):
+        if required_tags is not None and required_tags.isdisjoint(entity_tags):
             continue
 
         sla = entity.get("sla")
@@ -485,69 +602,174 @@ def _deprecation_check(
     check_references = bool(params.get("check_references", True))
 
     deprecated_fields: Set[str] = set()
+    # entity name -> deprecated field names, so index checks skip entities
+    # without deprecations instead of formatting a ref per indexed field.
+    deprecated_by_entity: Dict[str, Set[str]] = {}
     issues: List[Issue] = []
 
-    for entity in model.get("entities", []):
-        entity_name = str(entity.get("name", ""))
-        for field in entity.get("fields", []):
+    for _, entity_name, fields in _iter_entity_fields(model):
+        for field in fields:
+            if field.get("deprecated") is not True:
+                continue
             field_name = str(field.get("name", ""))
-            if field.get("deprecated") is True:
-                ref = f"{entity_name}.{field_name}"
-                deprecated_fields.add(ref)
-                if require_message:
-                    msg = field.get("deprecated_message")
-                    if not isinstance(msg, str) or not msg.strip():
-                        issues.append(
-                            _policy_issue(
-                                severity,
-                                f"POLICY_{policy_id}",
-                                f"Deprecated field '{ref}' is missing a deprecated_message with migration guidance.",
-                                f"/entities/{entity_name}/fields/{field_name}",
-                            )
+            ref = f"{entity_name}.{field_name}"
+            deprecated_fields.add(ref)
+            deprecated_by_entity.setdefault(entity_name, set()).add(field_name)
+            if require_message:
+                msg = field.get("deprecated_message")
+                if not isinstance(msg, str) or not msg.strip():
+                    issues.append(
+                        _policy_issue(
+                            severity,
+                            f"POLICY_{policy_id}",
+                            f"Deprecated field '{ref}' is missing a deprecated_message with migration guidance.",
+                            f"/entities/{entity_name}/fields/{field_name}",
                         )
-
-    if check_references and deprecated_fields:
-        for rel in model.get("relationships", []):
-            rel_name = str(rel.get("name", ""))
-            from_ref = str(rel.get("from", ""))
-            to_ref = str(rel.get("to", ""))
-            if from_ref in deprecated_fields:
-                issues.append(
-                    _policy_issue(
-                        severity,
-                        f"POLICY_{policy_id}",
-                        f"Relationship '{rel_name}' references deprecated field '{from_ref}'.",
-                        f"/relationships/{rel_name}",
                     )
+
+    # The common case: nothing is deprecated, so relationships and indexes
+    # are never walked.
+    if not deprecated_fields or not check_references:
+        return issues
+
+    for rel in model.get("relationships", []):
+        rel_name = str(rel.get("name", ""))
+        from_ref = str(rel.get("from", ""))
+        to_ref = str(rel.get("to", ""))
+        if from_ref in deprecated_fields:
+            issues.append(
+                _policy_issue(
+                    severity,
+                    f"POLICY_{policy_id}",
+                    f"Relationship '{rel_name}' references deprecated field '{from_ref}'.",
+                    f"/relationships/{rel_name}",
+                )
+            )
+        if to_ref in deprecated_fields:
+            issues.append(
+                _policy_issue(
+                    severity,
+                    f"POLICY_{policy_id}",
+                    f"Relationship '{rel_name}' references deprecated field '{to_ref}'.",
+                    f"/relationships/{rel_name}",
                 )
-            if to_ref in deprecated_fields:
+            )
+
+    for idx in model.get("indexes", []):
+        idx_entity = str(idx.get("entity", ""))
+        entity_deprecated = deprecated_by_entity.get(idx_entity)
+        if not entity_deprecated:
+            continue
+        idx_name = str(idx.get("name", ""))
+        for idx_field in _normalize_list(idx.get("fields", [])):
+            if idx_field in entity_deprecated:
+                ref = f"{idx_entity}.{idx_field}"
                 issues.append(
                     _policy_issue(
                         severity,
                         f"POLICY_{policy_id}",
-                        f"Relationship '{rel_name}' references deprecated field '{to_ref}'.",
-                        f"/relationships/{rel_name}",
+                        f"Index '{idx_name}' references deprecated field '{ref}'.",
+                        f"/indexes/{idx_name}",
                     )
                 )
 
-        for idx in model.get("indexes", []):
-            idx_name = str(idx.get("name", ""))
-            idx_entity = str(idx.get("entity", ""))
-            for idx_field in _normalize_list(idx.get("fields", [])):
-                ref = f"{idx_entity}.{idx_field}"
-                if ref in deprecated_fields:
-                    issues.append(
-                        _policy_issue(
-                            severity,
-                            f"POLICY_{policy_id}",
-                            f"Index '{idx_name}' references deprecated field '{ref}'.",
-                            f"/indexes/{idx_name}",
-                        )
-                    )
-
     return issues
 
 
+_ENTITY_EXPRESSION_CONTEXT: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "name": lambda entity: str(entity.get("name", "")),
+    "type": lambda entity: str(entity.get("type", "table")),
+    "tags": lambda entity: _normalize_list(entity.get("tags", [])),
+    "field_count": lambda entity: len(entity.get("fields", [])),
+    "has_owner": lambda entity: bool(entity.get("owner")),
+    "has_sla": lambda entity: bool(entity.get("sla")),
+    "has_description": lambda entity: bool(entity.get("description")),
+    "schema": lambda entity: str(entity.get("schema", "")),
+    "subject_area": lambda entity: str(entity.get("subject_area", "")),
+}
+
+_FIELD_EXPRESSION_CONTEXT: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "name": lambda field: str(field.get("name", "")),
+    "type": lambda field: str(field.get("type", "")),
+    "nullable": lambda field: bool(field.get("nullable", True)),
+    "primary_key": lambda field: bool(field.get("primary_key", False)),
+    "unique": lambda field: bool(field.get("unique", False)),
+    "has_description": lambda field: bool(field.get("description")),
+    "deprecated": lambda field: bool(field.get("deprecated", False)),
+    "sensitivity": lambda field: str(field.get("sensitivity", "")),
+    "has_default": lambda field: field.get("default") is not None,
+    "has_check": lambda field: bool(field.get("check")),
+    "computed": lambda field: bool(field.get("computed", False)),
+    "foreign_key": lambda field: bool(field.get("foreign_key", False)),
+    "tags": lambda field: _normalize_list(field.get("tags", [])),
+}
+
+_MODEL_EXPRESSION_CONTEXT: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "name": lambda model: str(model.get("model", {}).get("name", "")),
+    "version": lambda model: str(model.get("model", {}).get("version", "")),
+    "domain": lambda model: str(model.get("model", {}).get("domain", "")),
+    "state": lambda model: str(model.get("model", {}).get("state", "")),
+    "layer": lambda model: str(model.get("model", {}).get("layer", "")),
+    "entity_count": lambda model: len(model.get("entities", [])),
+    "relationship_count": lambda model: len(model.get("relationships", [])),
+    "index_count": lambda model: len(model.get("indexes", [])),
+    "metric_count": lambda model: len(model.get("metrics", [])),
+    "has_governance": lambda model: bool(model.get("governance")),
+    "has_glossary": lambda model: bool(model.get("glossary")),
+    "has_rules": lambda model: bool(model.get("rules")),
+    "has_metrics": lambda model: bool(model.get("metrics")),
+}
+
+
+def _builtin_expressions() -> Dict[Tuple[str, str], Callable[[Dict[str, Any]], Any]]:
+    """Specialized predicates for the most common custom expressions.
+
+    Every bare context variable and its ``not`` form is answered directly by
+    the scope's getter, so e.g. ``has_description`` skips ``eval`` entirely.
+    """
+    table: Dict[Tuple[str, str], Callable[[Dict[str, Any]], Any]] = {}
+    for scope, getters in (
+        ("entity", _ENTITY_EXPRESSION_CONTEXT),
+        ("field", _FIELD_EXPRESSION_CONTEXT),
+        ("model", _MODEL_EXPRESSION_CONTEXT),
+    ):
+        for key, getter in getters.items():
+            table[(scope, key)] = getter
+            table[(scope, f"not {key}")] = lambda item, getter=getter: not getter(item)
+
+    field_sensitivity = _FIELD_EXPRESSION_CONTEXT["sensitivity"]
+    field_described = _FIELD_EXPRESSION_CONTEXT["has_description"]
+    entity_count = _MODEL_EXPRESSION_CONTEXT["entity_count"]
+    table[("field", "sensitivity == '' or has_description")] = (
+        lambda field: field_sensitivity(field) == "" or field_described(field)
+    )
+    table[("model", "entity_count >= 1")] = lambda model: entity_count(model) >= 1
+    table[("model", "entity_count > 0")] = lambda model: entity_count(model) > 0
+    return table
+
+
+_BUILTIN_EXPRESSIONS = _builtin_expressions()
+
+
+@functools.lru_cache(maxsize=256)
+def _expression_names(code: CodeType) -> FrozenSet[str]:
+    """Names an expression may look up, including inside comprehensions."""
+    names = set(code.co_names) | set(code.co_varnames) | set(code.co_freevars)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _expression_names(const)
+    return frozenset(names)
+
+
+def _expression_context(
+    getters: Dict[str, Callable[[Dict[str, Any]], Any]],
+    names: FrozenSet[str],
+    item: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Build only the context variables the expression actually references."""
+    return {key: getter(item) for key, getter in getters.items() if key in names}
+
+
 def _custom_expression(
     model: Dict[str, Any],
     severity: str,
@@ -568,24 +790,31 @@ def _custom_expression(
             )
         ]
 
+    code, error = _compile_expression(expression)
+    if code is None:
+        return [
+            _policy_issue(
+                "error",
+                f"POLICY_{policy_id}_MISCONFIGURED",
+                f"Policy '{policy_id}' has invalid expression '{expression}': {error}",
+                "/policies",
+            )
+        ]
+
+    names = _expression_names(code)
+    no_builtins: Dict[str, Any] = {"__builtins__": {}}
+    predicate = _BUILTIN_EXPRESSIONS.get((scope, expression))
     issues: List[Issue] = []
 
     if scope == "entity":
         for entity in model.get("entities", []):
             entity_name = str(entity.get("name", ""))
-            ctx = {
-                "name": entity_name,
-                "type": str(entity.get("type", "table")),
-                "tags": _normalize_list(entity.get("tags", [])),
-                "field_count": len(entity.get("fields", [])),
-                "has_owner": bool(entity.get("owner")),
-                "has_sla": bool(entity.get("sla")),
-                "has_description": bool(entity.get("description")),
-                "schema": str(entity.get("schema", "")),
-                "subject_area": str(entity.get("subject_area", "")),
-            }
             try:
-                result = eval(expression, {"__builtins__": {}}, ctx)  # noqa: S307
+                if predicate is not None:
+                    result = predicate(entity)
+                else:
+                    ctx = _expression_context(_ENTITY_EXPRESSION_CONTEXT, names, entity)
+                    result = eval(code, no_builtins, ctx)  # noqa: S307
             except Exception:
                 return [
                     _policy_issue(
@@ -604,29 +833,18 @@ def _custom_expression(
                 )
 
     elif scope == "field":
-        for entity in model.get("entities", []):
-            entity_name = str(entity.get("name", ""))
-            for field in entity.get("fields", []):
+        for _, entity_name, fields in _iter_entity_fields(model):
+            for field in fields:
                 field_name = str(field.get("name", ""))
                 ref = f"{entity_name}.{field_name}"
-                ctx = {
-                    "name": field_name,
-                    "entity": entity_name,
-                    "type": str(field.get("type", "")),
-                    "nullable": bool(field.get("nullable", True)),
-                    "primary_key": bool(field.get("primary_key", False)),
-                    "unique": bool(field.get("unique", False)),
-                    "has_description": bool(field.get("description")),
-                    "deprecated": bool(field.get("deprecated", False)),
-                    "sensitivity": str(field.get("sensitivity", "")),
-                    "has_default": field.get("default") is not None,
-                    "has_check": bool(field.get("check")),
-                    "computed": bool(field.get("computed", False)),
-                    "foreign_key": bool(field.get("foreign_key", False)),
-                    "tags": _normalize_list(field.get("tags", [])),
-                }
                 try:
-                    result = eval(expression, {"__builtins__": {}}, ctx)  # noqa: S307
+                    if predicate is not None:
+                        result = predicate(field)
+                    else:
+                        ctx = _expression_context(_FIELD_EXPRESSION_CONTEXT, names, field)
+                        if "entity" in names:
+                            ctx["entity"] = entity_name
+                        result = eval(code, no_builtins, ctx)  # noqa: S307
                 except Exception:
                     return [
                         _policy_issue(
@@ -648,24 +866,12 @@ def _custom_expression(
                     )
 
     elif scope == "model":
-        model_meta = model.get("model", {})
-        ctx = {
-            "name": str(model_meta.get("name", "")),
-            "version": str(model_meta.get("version", "")),
-            "domain": str(model_meta.get("domain", "")),
-            "state": str(model_meta.get("state", "")),
-            "layer": str(model_meta.get("layer", "")),
-            "entity_count": len(model.get("entities", [])),
-            "relationship_count": len(model.get("relationships", [])),
-            "index_count": len(model.get("indexes", [])),
-            "metric_count": len(model.get("metrics", [])),
-            "has_governance": bool(model.get("governance")),
-            "has_glossary": bool(model.get("glossary")),
-            "has_rules": bool(model.get("rules")),
-            "has_metrics": bool(model.get("metrics")),
-        }
         try:
-            result = eval(expression, {"__builtins__": {}}, ctx)  # noqa: S307
+            if predicate is not None:
+                result = predicate(model)
+            else:
+                ctx = _expression_context(_MODEL_EXPRESSION_CONTEXT, names, model)
+                result = eval(code, no_builtins, ctx)  # noqa: S307
         except Exception:
             return [
                 _policy_issue(
@@ -676,7 +882,8 @@ def _custom_expression(
                 )
             ]
         if not result:
-            msg = message_template.replace("{name}", ctx["name"]) if message_template else (
+            model_name = _MODEL_EXPRESSION_CONTEXT["name"](model)
+            msg = message_template.replace("{name}", model_name) if message_template else (
                 f"Model failed custom policy check: {expression}"
             )
             issues.append(_policy_issue(severity, f"POLICY_{policy_id}", msg, "/model"))
@@ -980,9 +1187,8 @@ def _regex_per_layer(
 
     compiled: Dict[str, "re.Pattern[str]"] = {}
     for layer, regex in patterns_raw.items():
-        try:
-            compiled[str(layer).lower()] = re.compile(str(regex))
-        except re.error as err:
+        pattern, err = _compile(str(regex))
+        if err is not None:
             return [
                 _policy_issue(
                     "error",
@@ -991,6 +1197,7 @@ def _regex_per_layer(
                     "/policies",
                 )
             ]
+        compiled[str(layer).lower()] = pattern
 
     selector = params.get("selectors") or {}
     issues: List[Issue] = []
@@ -1213,6 +1420,9 @@ _POLICY_HANDLERS = {
 }
 
 
+_ENTITY_INFO_HANDLERS = frozenset({"require_indexes", "require_owner", "require_sla"})
+
+
 def merge_policy_packs(*packs: Dict[str, Any]) -> Dict[str, Any]:
     """Merge multiple policy packs with later packs overriding earlier ones.
 
@@ -1224,8 +1434,9 @@ def merge_policy_packs(*packs: Dict[str, Any]) -> Dict[str, Any]:
         return {"pack": {"name": "merged", "version": "1.0.0"}, "policies": []}
 
     merged_pack_meta: Dict[str, Any] = {}
-    policy_map: Dict[str, Dict[str, Any]] = {}  # keyed by policy id
-    order: List[str] = []
+    # Keyed by policy id; an override keeps the position of the first
+    # definition because dicts preserve insertion order.
+    policy_map: Dict[str, Dict[str, Any]] = {}
 
     for pack in packs:
         if not isinstance(pack, dict):
@@ -1240,39 +1451,57 @@ def merge_policy_packs(*packs: Dict[str, Any]) -> Dict[str, Any]:
             pid = str(policy.get("id", ""))
             if not pid:
                 continue
-            if pid not in policy_map:
-                order.append(pid)
             policy_map[pid] = policy
 
     return {
         "pack": merged_pack_meta or {"name": "merged", "version": "1.0.0"},
-        "policies": [policy_map[pid] for pid in order if pid in policy_map],
+        "policies": list(policy_map.values()),
     }
 
 
-def load_policy_pack_with_inheritance(path: str) -> Dict[str, Any]:
-    """Load a policy pack, resolving ``pack.extends`` references.
+def _collect_extends_chain(
+    path: str,
+    chain: List[Dict[str, Any]],
+    visited: Set[str],
+    stack: Set[str],
+) -> None:
+    """Append *path*'s ancestors, then the pack itself, to *chain* (post-order).
 
-    If the pack defines ``pack.extends`` (a string path or list of paths),
-    the referenced base packs are loaded first and merged in order, with the
-    current pack applied last (highest priority).
+    Each pack is visited once even when several children extend it, and an
+    ``extends`` cycle raises instead of recursing forever.
     """
-    pack = load_policy_pack(path)
-    extends = pack.get("pack", {}).get("extends")
-    if not extends:
-        return pack
+    key = str(Path(path).resolve())
+    if key in stack:
+        raise ValueError(f"Policy pack extends cycle detected at '{path}'.")
+    if key in visited:
+        return
 
-    base_paths = _normalize_list(extends)
+    stack.add(key)
+    pack = load_policy_pack(path)
     base_dir = Path(path).parent
-
-    bases: List[Dict[str, Any]] = []
-    for bp in base_paths:
+    for bp in _normalize_list(pack.get("pack", {}).get("extends")):
         resolved = (base_dir / bp).resolve()
         if resolved.exists():
-            bases.append(load_policy_pack_with_inheritance(str(resolved)))
+            _collect_extends_chain(str(resolved), chain, visited, stack)
+    stack.discard(key)
+    visited.add(key)
+    chain.append(pack)
 
-    bases.append(pack)
-    return merge_policy_packs(*bases)
+
+def load_policy_pack_with_inheritance(path: str) -> Dict[str, Any]:
+    """Load a policy pack, resolving ``pack.extends`` references.
+
+    If the pack defines ``pack.extends`` (a string path or list of paths),
+    the referenced base packs are loaded first and merged in order, with the
+    current pack applied last (highest priority).  A base pack shared by
+    several ancestors is loaded and merged only once, at its first position.
+    """
+    chain: List[Dict[str, Any]] = []
+    _collect_extends_chain(path, chain, set(), set())
+    pack = chain[-1]
+    if not pack.get("pack", {}).get("extends"):
+        return pack
+    return merge_policy_packs(*chain)
 
 
 def policy_issues(model: Dict[str, Any], policy_pack: Dict[str, Any]) -> List[Issue]:
@@ -1288,6 +1517,7 @@ def policy_issues(model: Dict[str, Any], policy_pack: Dict[str, Any]) -> List[Is
         ]
 
     issues: List[Issue] = []
+    entity_infos: Optional[List[_EntityInfo]] = None
     for index, policy in enumerate(policies):
         if not isinstance(policy, dict):
             issues.append(
@@ -1343,6 +1573,20 @@ def policy_issues(model: Dict[str, Any], policy_pack: Dict[str, Any]) -> List[Is
             )
             continue
 
+        if policy_type in _ENTITY_INFO_HANDLERS:
+            if entity_infos is None:
+                entity_infos = _entity_infos(model)
+            issues.extend(
+                handler(
+                    model=model,
+                    severity=severity,
+                    policy_id=policy_id,
+                    params=params,
+                    entity_infos=entity_infos,
+                )
+            )
+            continue
+
         issues.extend(handler(model=model, severity=severity, policy_id=policy_id, params=params))
 
     return issues
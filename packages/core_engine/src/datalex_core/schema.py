@@ -1,8 +1,8 @@
 import json
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
-
-from jsonschema import Draft202012Validator
+from typing import Any, Dict, List, Tuple
 
 from datalex_core.issues import Issue
 from datalex_core.modeling import normalize_model
@@ -35,19 +35,90 @@ def _looks_like_model_schema(schema: Dict[str, Any]) -> bool:
     return "model" in properties and "entities" in properties
 
 
+# Compiled validators keyed by id(schema). Each entry keeps the schema object
+# alive so its id cannot be reused by another dict while cached. Schemas are
+# treated as immutable once passed in.
+_VALIDATOR_CACHE: "OrderedDict[int, Tuple[Dict[str, Any], Any]]" = OrderedDict()
+_RS_VALIDATOR_CACHE: "OrderedDict[int, Tuple[Dict[str, Any], Any]]" = OrderedDict()
+_VALIDATOR_CACHE_SIZE = 16
+
+
+def _cached_validator(cache: "OrderedDict[int, Tuple[Dict[str, Any], Any]]", schema: Dict[str, Any], build) -> Any:
+    cached = cache.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        cache.move_to_end(id(schema))
+        return cached[1]
+    validator = build(schema)
+    cache[id(schema)] = (schema, validator)
+    if len(cache) > _VALIDATOR_CACHE_SIZE:
+        cache.popitem(last=False)
+    return validator
+
+
+def _build_validator(schema: Dict[str, Any]) -> Any:
+    # Deferred: commands that never validate (init, completion, --help)
+    # should not pay for importing jsonschema.
+    from jsonschema import Draft202012Validator
+
+    return Draft202012Validator(schema)
+
+
+def _build_rs_validator(schema: Dict[str, Any]) -> Any:
+    import jsonschema_rs
+
+    try:
+        return jsonschema_rs.Draft202012Validator(schema)
+    except ValueError:
+        # Schemas jsonschema-rs rejects still get the Python validator.
+        return None
+
+
+def _validator_for(schema: Dict[str, Any]) -> Any:
+    return _cached_validator(_VALIDATOR_CACHE, schema, _build_validator)
+
+
+@lru_cache(maxsize=None)
+def _has_jsonschema_rs() -> bool:
+    # Optional Rust validator; probed on first validation, like jsonschema.
+    try:
+        import jsonschema_rs  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _schema_errors(model: Dict[str, Any], schema: Dict[str, Any]) -> List[Tuple[List[Any], str]]:
+    """(instance path, message) for every violation.
+
+    jsonschema-rs, if installed, only answers whether the model is valid;
+    violations are always reported by the Python validator so messages and
+    paths do not depend on which backend is present.
+    """
+    if _has_jsonschema_rs():
+        validator = _cached_validator(_RS_VALIDATOR_CACHE, schema, _build_rs_validator)
+        if validator is not None:
+            try:
+                if validator.is_valid(model):
+                    return []
+            except ValueError:
+                # Values with no JSON equivalent (e.g. YAML dates) are only
+                # understood by the Python validator.
+                pass
+    return [(list(err.absolute_path), err.message) for err in _validator_for(schema).iter_errors(model)]
+
+
 def schema_issues(model: Dict[str, Any], schema: Dict[str, Any]) -> List[Issue]:
     if _looks_like_model_schema(schema):
         model = normalize_model(model)
-    validator = Draft202012Validator(schema)
     issues: List[Issue] = []
 
-    for error in sorted(validator.iter_errors(model), key=lambda e: list(e.absolute_path)):
+    for path, message in sorted(_schema_errors(model, schema), key=lambda item: item[0]):
         issues.append(
             Issue(
                 severity="error",
                 code="SCHEMA_VALIDATION_FAILED",
-                message=error.message,
-                path=_to_json_path(list(error.absolute_path)),
+                message=message,
+                path=_to_json_path(path),
             )
         )
 
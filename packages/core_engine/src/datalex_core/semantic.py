@@ -1214,6 +1214,7 @@ def lint_issues(model: Dict[str, Any]) -> List[Issue]:
     seen_entities: Set[str] = set()
     refs = _entity_field_refs(model)
     entity_field_map = _entity_field_names(model)
+    has_imports = bool(model.get("model", {}).get("imports"))
 
     for entity in entities:
         entity_name = entity.get("name", "")
@@ -1305,7 +1306,6 @@ def lint_issues(model: Dict[str, Any]) -> List[Issue]:
 
         # dimension_refs: warn if a referenced dimension entity is not in this model
         dim_refs = entity.get("dimension_refs", [])
-        has_imports = bool(model.get("model", {}).get("imports"))
         if isinstance(dim_refs, list):
             for ref_name in dim_refs:
                 if ref_name and ref_name not in entity_field_map:
@@ -0,0 +1,72 @@
+import contextlib
+import copy
+import functools
+import io
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Make the in-repo packages importable without installing them.
+for _src in (ROOT / "packages" / "core_engine" / "src", ROOT / "packages" / "cli" / "src"):
+    if str(_src) not in sys.path:
+        sys.path.insert(0, str(_src))
+
+from datalex_cli.main import main as dm_main  # noqa: E402
+from datalex_core.loader import load_yaml_model  # noqa: E402
+from datalex_core.schema import load_schema  # noqa: E402
+
+MODEL_SCHEMA_PATH = ROOT / "schemas" / "model.schema.json"
+
+
+def run_dm(*args: str) -> subprocess.CompletedProcess:
+    """Run the CLI in-process, returning output shaped like subprocess.run's."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            returncode = dm_main(list(args))
+        except SystemExit as exc:
+            returncode = exc.code if isinstance(exc.code, int) else 1
+    return subprocess.CompletedProcess(list(args), returncode or 0, stdout.getvalue(), stderr.getvalue())
+
+
+@pytest.fixture(scope="session")
+def schema():
+    """The model JSON schema, parsed once per test session."""
+    return load_schema(str(MODEL_SCHEMA_PATH))
+
+
+@pytest.fixture(scope="session")
+def read_text():
+    """Read a text file at most once per session."""
+
+    @functools.lru_cache(maxsize=None)
+    def _read(path):
+        return Path(path).read_text(encoding="utf-8")
+
+    return _read
+
+
+@pytest.fixture(scope="session")
+def file_exists():
+    """os.path.exists, probed at most once per path per session."""
+    return functools.lru_cache(maxsize=None)(os.path.exists)
+
+
+@pytest.fixture(scope="session")
+def yaml_model():
+    """Load a model YAML file at most once per session.
+
+    Returns a loader; every call hands back a private deep copy so tests
+    may mutate the result without affecting later tests.
+    """
+    load = functools.lru_cache(maxsize=None)(load_yaml_model)
+
+    def _load(path):
+        return copy.deepcopy(load(str(Path(path).resolve())))
+
+    return _load
@@ -563,7 +563,7 @@ class TestCLIIntegration(unittest.TestCase):
         import subprocess
         result = subprocess.run(
             [sys.executable, "-m", "datalex_cli.main", "doctor", "--path", str(ROOT), "--output-json"],
-            capture_output=True, text=True, cwd=str(ROOT),
+            capture_output=True, cwd=str(ROOT),
             env={**os.environ, "PYTHONPATH": str(ROOT / "packages" / "core_engine" / "src") + ":" + str(ROOT / "packages" / "cli" / "src")},
         )
         data = json.loads(result.stdout)
@@ -630,10 +630,10 @@ class TestCLIIntegration(unittest.TestCase):
                     "--dry-run", "--dialect", "snowflake", "--allow-destructive",
                     "--report-json", report_path, "--write-sql", write_sql_path, "--output-json",
                 ],
-                capture_output=True, text=True, cwd=str(ROOT),
+                capture_output=True, cwd=str(ROOT),
                 env={**os.environ, "PYTHONPATH": str(ROOT / "packages" / "core_engine" / "src") + ":" + str(ROOT / "packages" / "cli" / "src")},
             )
-            self.assertEqual(result.returncode, 0)
+            self.assertEqual(result.returncode, 0, result.stderr.decode())
             payload = json.loads(result.stdout)
             self.assertEqual(payload.get("status"), "dry_run")
             self.assertEqual(payload.get("destructive_statement_count"), 1)
@@ -679,6 +679,16 @@ class TestCLIIntegration(unittest.TestCase):
         self.assertEqual(result.returncode, 0)
         self.assertIn("complete -c dm", result.stdout)
 
+    def test_help_does_not_import_jsonschema(self):
+        import subprocess
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "datalex_cli", "init", "--help"],
+            capture_output=True, text=True, cwd=str(ROOT),
+            env={**os.environ, "PYTHONPATH": str(ROOT / "packages" / "core_engine" / "src") + ":" + str(ROOT / "packages" / "cli" / "src")},
+        )
+        self.assertEqual(result.returncode, 0)
+        self.assertNotIn("jsonschema", result.stderr)
+
 
 # ===========================================================================
 # Module existence
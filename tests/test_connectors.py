@@ -801,7 +801,7 @@ class TestCLIIntegration(unittest.TestCase):
         import subprocess
         result = subprocess.run(
             [sys.executable, "-m", "datalex_cli.main", "connectors", "--output-json"],
-            capture_output=True, text=True, cwd=str(ROOT),
+            capture_output=True, cwd=str(ROOT),
             env={**os.environ, "PYTHONPATH": str(ROOT / "packages" / "core_engine" / "src") + ":" + str(ROOT / "packages" / "cli" / "src")},
         )
         self.assertEqual(result.returncode, 0)
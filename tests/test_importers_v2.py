@@ -1,6 +1,7 @@
 """Tests for importers used by local/open-source DataLex workflows."""
 
 import json
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -185,10 +186,49 @@ class TestSQLDDLEnhanced:
         # Should not crash, entity should have 2 fields
         assert len(model["entities"][0]["fields"]) == 2
 
+    def test_non_ascii_identifiers(self):
+        ddl = """
+        CREATE TABLE caf\u00e9_orders (
+            order_id INTEGER PRIMARY KEY,
+            statut TEXT DEFAULT 'en_attente' CHECK(statut <> 'annul\u00e9'),
+            ville TEXT DEFAULT Z\u00fcrich
+        );
+        CREATE UNIQUE INDEX idx_caf\u00e9 ON caf\u00e9_orders (statut);
+        """
+        model = import_sql_ddl(ddl)
+        fields = {f["name"]: f for f in model["entities"][0]["fields"]}
+        assert fields["statut"]["check"] == "statut <> 'annul\u00e9'"
+        assert fields["ville"]["default"] == "Z\u00fcrich"
+        assert model["indexes"][0]["name"] == "idx_caf\u00e9"
+        assert model["indexes"][0]["unique"] is True
+
+    @pytest.mark.parametrize("name", ["CREATE_UNIQUE_INDEX_RE", "PAREN_LIST_RE", "DEFAULT_RE", "CHECK_RE"])
+    def test_re2_patterns_match_stdlib(self, name):
+        from datalex_core import importers
+
+        pattern = getattr(importers, name)
+        # RE2's Perl classes are ASCII-only; these patterns must not use them.
+        assert not re.search(r"\\[wWsSbBdD]", pattern.pattern)
+        stdlib = re.compile(pattern.pattern)
+        samples = [
+            "create unique index idx_caf\u00e9",
+            "create\u00a0unique index x",
+            "(caf\u00e9, na\u00efve)",
+            "default Z\u00fcrich not null",
+            "default\u00a0'x'",
+            "CHECK(statut <> 'annul\u00e9')",
+        ]
+        for text in samples:
+            expected = stdlib.search(text)
+            actual = pattern.search(text)
+            assert (actual and actual.groups()) == (expected and expected.groups()), text
 
-class TestDbtSchemaImporter:
-    def test_import_models_and_sources(self):
-        dbt_schema = """
+
+# ---------------------------------------------------------------------------
+# dbt schema.yml importer
+# ---------------------------------------------------------------------------
+
+_DBT_MODELS_AND_SOURCES = """
 version: 2
 sources:
   - name: raw
@@ -214,26 +254,8 @@ models:
               to: source('raw', 'customers')
               field: customer_id
 """
-        model = import_dbt_schema_yml(dbt_schema, model_name="dbt_import")
-        entities = {e["name"]: e for e in model["entities"]}
-        assert "Customers" in entities
-        assert "StgOrders" in entities
-        assert entities["Customers"]["type"] == "external_table"
-        assert entities["StgOrders"]["type"] == "view"
 
-        orders_fields = {f["name"]: f for f in entities["StgOrders"]["fields"]}
-        assert orders_fields["order_id"].get("primary_key") is True
-        assert orders_fields["customer_id"].get("foreign_key") is True
-        assert orders_fields["customer_id"]["nullable"] is False
-
-        rels = model.get("relationships", [])
-        assert len(rels) == 1
-        assert rels[0]["from"] == "Customers.customer_id"
-        assert rels[0]["to"] == "StgOrders.customer_id"
-        assert rels[0]["cardinality"] == "one_to_many"
-
-    def test_import_relationships_skips_unresolved_targets(self):
-        dbt_schema = """
+_DBT_UNRESOLVED_RELATIONSHIP = """
 version: 2
 models:
   - name: stg_orders
@@ -244,13 +266,8 @@ models:
               to: ref('missing_dim')
               field: id
 """
-        model = import_dbt_schema_yml(dbt_schema, model_name="dbt_import")
-        assert len(model["entities"]) == 1
-        assert model["entities"][0]["name"] == "StgOrders"
-        assert model.get("relationships", []) == []
 
-    def test_import_data_tests_and_constraints(self):
-        dbt_schema = """
+_DBT_DATA_TESTS_AND_CONSTRAINTS = """
 version: 2
 models:
   - name: dim_customers
@@ -269,24 +286,8 @@ models:
       - name: customer_id
         data_tests: [not_null]
 """
-        model = import_dbt_schema_yml(dbt_schema, model_name="dbt_constraints")
-        entities = {e["name"]: e for e in model["entities"]}
-        assert "DimCustomers" in entities
-        assert "FctOrders" in entities
 
-        dim_fields = {f["name"]: f for f in entities["DimCustomers"]["fields"]}
-        assert dim_fields["customer_id"].get("primary_key") is True
-        assert dim_fields["customer_id"].get("nullable") is False
-
-        fct_fields = {f["name"]: f for f in entities["FctOrders"]["fields"]}
-        assert fct_fields["order_id"].get("primary_key") is True
-        assert fct_fields["customer_id"].get("foreign_key") is True
-
-        rels = model.get("relationships", [])
-        assert any(r["from"] == "DimCustomers.customer_id" and r["to"] == "FctOrders.customer_id" for r in rels)
-
-    def test_normalizes_non_snake_case_column_names(self):
-        dbt_schema = """
+_DBT_NON_SNAKE_CASE_COLUMNS = """
 version: 2
 models:
   - name: stg_orders
@@ -303,23 +304,8 @@ models:
       - name: CustomerID
         tests: [not_null, unique]
 """
-        model = import_dbt_schema_yml(dbt_schema, model_name="dbt_normalized")
-        entities = {e["name"]: e for e in model["entities"]}
-        assert "StgOrders" in entities
-        assert "DimCustomers" in entities
-
-        stg_fields = {f["name"]: f for f in entities["StgOrders"]["fields"]}
-        dim_fields = {f["name"]: f for f in entities["DimCustomers"]["fields"]}
-        assert "order_id" in stg_fields
-        assert "customer_id" in stg_fields
-        assert "customer_id" in dim_fields
-        assert stg_fields["order_id"].get("primary_key") is True
 
-        rels = model.get("relationships", [])
-        assert any(r["from"] == "DimCustomers.customer_id" and r["to"] == "StgOrders.customer_id" for r in rels)
-
-    def test_sources_without_columns_get_placeholder_field(self):
-        dbt_schema = """
+_DBT_SOURCES_WITHOUT_COLUMNS = """
 version: 2
 sources:
   - name: raw
@@ -327,26 +313,13 @@ sources:
     tables:
       - name: players
 """
-        model = import_dbt_schema_yml(dbt_schema, model_name="dbt_sources_only")
-        entities = {e["name"]: e for e in model["entities"]}
-        assert "Players" in entities
-        fields = entities["Players"]["fields"]
-        assert len(fields) == 1
-        assert fields[0]["name"] == "row_id"
 
-    def test_empty_dbt_schema_gets_placeholder_entity(self):
-        dbt_schema = """
+_DBT_EMPTY_SCHEMA = """
 version: 2
 models: []
 """
-        model = import_dbt_schema_yml(dbt_schema, model_name="dbt_empty")
-        assert len(model["entities"]) == 1
-        ent = model["entities"][0]
-        assert ent["name"] == "DbtSchemaInfo"
-        assert ent["fields"][0]["name"] == "row_id"
 
-    def test_import_semantic_models_and_metrics(self):
-        dbt_schema = """
+_DBT_SEMANTIC_LAYER = """
 version: 2
 semantic_models:
   - name: fact_orders
@@ -375,7 +348,88 @@ metrics:
     type: derived
     description: Net sales divided by order count.
 """
-        model = import_dbt_schema_yml(dbt_schema, model_name="dbt_semantic")
+
+
+class TestDbtSchemaImporter:
+    def test_import_models_and_sources(self):
+        model = import_dbt_schema_yml(_DBT_MODELS_AND_SOURCES, model_name="dbt_import")
+        entities = {e["name"]: e for e in model["entities"]}
+        assert "Customers" in entities
+        assert "StgOrders" in entities
+        assert entities["Customers"]["type"] == "external_table"
+        assert entities["StgOrders"]["type"] == "view"
+
+        orders_fields = {f["name"]: f for f in entities["StgOrders"]["fields"]}
+        assert orders_fields["order_id"].get("primary_key") is True
+        assert orders_fields["customer_id"].get("foreign_key") is True
+        assert orders_fields["customer_id"]["nullable"] is False
+
+        rels = model.get("relationships", [])
+        assert len(rels) == 1
+        assert rels[0]["from"] == "Customers.customer_id"
+        assert rels[0]["to"] == "StgOrders.customer_id"
+        assert rels[0]["cardinality"] == "one_to_many"
+
+    def test_import_accepts_bytes(self):
+        from_bytes = import_dbt_schema_yml(_DBT_MODELS_AND_SOURCES.encode("utf-8"), model_name="dbt_import")
+        assert from_bytes == import_dbt_schema_yml(_DBT_MODELS_AND_SOURCES, model_name="dbt_import")
+
+    def test_import_relationships_skips_unresolved_targets(self):
+        model = import_dbt_schema_yml(_DBT_UNRESOLVED_RELATIONSHIP, model_name="dbt_import")
+        assert len(model["entities"]) == 1
+        assert model["entities"][0]["name"] == "StgOrders"
+        assert model.get("relationships", []) == []
+
+    def test_import_data_tests_and_constraints(self):
+        model = import_dbt_schema_yml(_DBT_DATA_TESTS_AND_CONSTRAINTS, model_name="dbt_constraints")
+        entities = {e["name"]: e for e in model["entities"]}
+        assert "DimCustomers" in entities
+        assert "FctOrders" in entities
+
+        dim_fields = {f["name"]: f for f in entities["DimCustomers"]["fields"]}
+        assert dim_fields["customer_id"].get("primary_key") is True
+        assert dim_fields["customer_id"].get("nullable") is False
+
+        fct_fields = {f["name"]: f for f in entities["FctOrders"]["fields"]}
+        assert fct_fields["order_id"].get("primary_key") is True
+        assert fct_fields["customer_id"].get("foreign_key") is True
+
+        rels = model.get("relationships", [])
+        assert any(r["from"] == "DimCustomers.customer_id" and r["to"] == "FctOrders.customer_id" for r in rels)
+
+    def test_normalizes_non_snake_case_column_names(self):
+        model = import_dbt_schema_yml(_DBT_NON_SNAKE_CASE_COLUMNS, model_name="dbt_normalized")
+        entities = {e["name"]: e for e in model["entities"]}
+        assert "StgOrders" in entities
+        assert "DimCustomers" in entities
+
+        stg_fields = {f["name"]: f for f in entities["StgOrders"]["fields"]}
+        dim_fields = {f["name"]: f for f in entities["DimCustomers"]["fields"]}
+        assert "order_id" in stg_fields
+        assert "customer_id" in stg_fields
+        assert "customer_id" in dim_fields
+        assert stg_fields["order_id"].get("primary_key") is True
+
+        rels = model.get("relationships", [])
+        assert any(r["from"] == "DimCustomers.customer_id" and r["to"] == "StgOrders.customer_id" for r in rels)
+
+    def test_sources_without_columns_get_placeholder_field(self):
+        model = import_dbt_schema_yml(_DBT_SOURCES_WITHOUT_COLUMNS, model_name="dbt_sources_only")
+        entities = {e["name"]: e for e in model["entities"]}
+        assert "Players" in entities
+        fields = entities["Players"]["fields"]
+        assert len(fields) == 1
+        assert fields[0]["name"] == "row_id"
+
+    def test_empty_dbt_schema_gets_placeholder_entity(self):
+        model = import_dbt_schema_yml(_DBT_EMPTY_SCHEMA, model_name="dbt_empty")
+        assert len(model["entities"]) == 1
+        ent = model["entities"][0]
+        assert ent["name"] == "DbtSchemaInfo"
+        assert ent["fields"][0]["name"] == "row_id"
+
+    def test_import_semantic_models_and_metrics(self):
+        model = import_dbt_schema_yml(_DBT_SEMANTIC_LAYER, model_name="dbt_semantic")
         entities = {e["name"]: e for e in model["entities"]}
         assert "FactOrders" in entities
         assert "MetricCatalog" in entities
@@ -1,4 +1,6 @@
+import os
 import subprocess
+import sys
 import tempfile
 import unittest
 from pathlib import Path
@@ -7,25 +9,46 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 FIXTURES = ROOT / "tests" / "fixtures"
 POLICIES = ROOT / "tests" / "policies"
+# Run the CLI package directly rather than through the ./datalex launcher,
+# which only exists to put the source trees on sys.path.
+DM_CMD = [sys.executable, "-m", "datalex_cli"]
+DM_ENV = {
+    **os.environ,
+    "PYTHONPATH": os.pathsep.join(
+        filter(None, [
+            str(ROOT / "packages" / "cli" / "src"),
+            str(ROOT / "packages" / "core_engine" / "src"),
+            os.environ.get("PYTHONPATH", ""),
+        ])
+    ),
+}
 MODEL = ROOT / "model-examples" / "starter-commerce.model.yaml"
+SQL_SCHEMA = (FIXTURES / "sample_schema.sql").read_bytes()
+DBML_SCHEMA = (FIXTURES / "sample_schema.dbml").read_bytes()
+
+
+def _output(result):
+    """Decoded stdout+stderr for assertion messages; outputs stay bytes otherwise."""
+    return (result.stdout + result.stderr).decode("utf-8", "replace")
 
 
 class IntegrationCommandTests(unittest.TestCase):
-    def run_dm(self, args):
+    def run_dm(self, args, stdin=None):
         return subprocess.run(
-            ["./datalex", *args],
+            [*DM_CMD, *args],
             cwd=ROOT,
+            env=DM_ENV,
             check=False,
             capture_output=True,
-            text=True,
+            input=stdin,
         )
 
     def test_generate_sql_postgres(self):
         result = self.run_dm(
             ["generate", "sql", str(MODEL), "--dialect", "postgres"]
         )
-        self.assertEqual(0, result.returncode, result.stdout + result.stderr)
-        self.assertIn("CREATE TABLE", result.stdout)
+        self.assertEqual(0, result.returncode, _output(result))
+        self.assertIn(b"CREATE TABLE", result.stdout)
 
     def test_generate_dbt_scaffold(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -40,14 +63,14 @@ class IntegrationCommandTests(unittest.TestCase):
                     "commerce_models",
                 ]
             )
-            self.assertEqual(0, result.returncode, result.stdout + result.stderr)
+            self.assertEqual(0, result.returncode, _output(result))
             self.assertTrue((Path(tmp) / "dbt_project.yml").exists())
             self.assertTrue((Path(tmp) / "models" / "staging" / "schema.yml").exists())
 
     def test_generate_metadata_json(self):
         result = self.run_dm(["generate", "metadata", str(MODEL)])
-        self.assertEqual(0, result.returncode, result.stdout + result.stderr)
-        self.assertIn("\"entity_count\"", result.stdout)
+        self.assertEqual(0, result.returncode, _output(result))
+        self.assertIn(b"\"entity_count\"", result.stdout)
 
     def test_import_sql_and_validate(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -56,16 +79,17 @@ class IntegrationCommandTests(unittest.TestCase):
                 [
                     "import",
                     "sql",
-                    str(FIXTURES / "sample_schema.sql"),
+                    "-",
                     "--out",
                     str(out),
-                ]
+                ],
+                stdin=SQL_SCHEMA,
             )
-            self.assertEqual(0, result.returncode, result.stdout + result.stderr)
+            self.assertEqual(0, result.returncode, _output(result))
             self.assertTrue(out.exists())
 
             validate = self.run_dm(["validate", str(out)])
-            self.assertEqual(0, validate.returncode, validate.stdout + validate.stderr)
+            self.assertEqual(0, validate.returncode, _output(validate))
 
     def test_import_dbml_and_validate(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -74,16 +98,17 @@ class IntegrationCommandTests(unittest.TestCase):
                 [
                     "import",
                     "dbml",
-                    str(FIXTURES / "sample_schema.dbml"),
+                    "-",
                     "--out",
                     str(out),
-                ]
+                ],
+                stdin=DBML_SCHEMA,
             )
-            self.assertEqual(0, result.returncode, result.stdout + result.stderr)
+            self.assertEqual(0, result.returncode, _output(result))
             self.assertTrue(out.exists())
 
             validate = self.run_dm(["validate", str(out)])
-            self.assertEqual(0, validate.returncode, validate.stdout + validate.stderr)
+            self.assertEqual(0, validate.returncode, _output(validate))
 
     def test_policy_check_pass(self):
         result = self.run_dm(
@@ -94,8 +119,8 @@ class IntegrationCommandTests(unittest.TestCase):
                 str(POLICIES / "pass.policy.yaml"),
             ]
         )
-        self.assertEqual(0, result.returncode, result.stdout + result.stderr)
-        self.assertIn("Policy check passed.", result.stdout)
+        self.assertEqual(0, result.returncode, _output(result))
+        self.assertIn(b"Policy check passed.", result.stdout)
 
     def test_policy_check_fail(self):
         result = self.run_dm(
@@ -106,8 +131,8 @@ class IntegrationCommandTests(unittest.TestCase):
                 str(POLICIES / "fail.policy.yaml"),
             ]
         )
-        self.assertEqual(1, result.returncode, result.stdout + result.stderr)
-        self.assertIn("Policy check failed.", result.stdout)
+        self.assertEqual(1, result.returncode, _output(result))
+        self.assertIn(b"Policy check failed.", result.stdout)
 
 
 if __name__ == "__main__":
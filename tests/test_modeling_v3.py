@@ -5,6 +5,7 @@ import subprocess
 import sys
 import tempfile
 import unittest
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -22,6 +23,8 @@ SCHEMA_PATH = str(ROOT / "schemas" / "model.schema.json")
 DM_CLI = str(ROOT / "datalex")
 
 
+# Parsed once: schema_issues caches its compiled validator per schema object.
+@lru_cache(maxsize=1)
 def _schema():
     return load_schema(SCHEMA_PATH)
 
@@ -144,6 +147,20 @@ class TestModelingV3Standards(unittest.TestCase):
         issues = standards_issues(model)
         self.assertTrue(any(issue.code == "DOMAIN_NOT_FOUND" for issue in issues))
 
+    def test_standards_naming_styles_and_patterns(self):
+        model = _conceptual_model()
+        model["naming_rules"]["field"] = {"style": "snake_case", "pattern": "[a-z_]+_(id|name|at)"}
+        model["naming_rules"]["index"] = {"pattern": "idx_[a-z_]+"}
+        model["entities"][1]["name"] = "order_header"
+        model["entities"][1]["fields"].append({"name": "Total", "type": "decimal"})
+        model["indexes"] = [{"name": "ix_order", "entity": "order_header", "fields": ["order_id"]}]
+        codes = [issue.code for issue in standards_issues(model)]
+        self.assertIn("ENTITY_NAMING_RULE", codes)
+        self.assertIn("FIELD_NAMING_RULE", codes)
+        self.assertIn("INDEX_NAMING_PATTERN", codes)
+        # Only "Total" breaks the field pattern; every other field matches it.
+        self.assertEqual(1, codes.count("FIELD_NAMING_PATTERN"))
+
     def test_standards_fix_generates_subject_areas_and_physical_name(self):
         model = transform_model(_conceptual_model(), "physical")
         model.pop("subject_areas", None)
@@ -1,7 +1,8 @@
 """Tests for Phase 2: Multi-model resolution, cross-file imports,
 project diff, and CLI commands."""
 
-import json
+import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -10,20 +11,54 @@ from typing import Any, Dict
 import pytest
 import yaml
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "packages" / "core_engine" / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "packages" / "cli" / "src"))
+
+from tests.conftest import run_dm
 
 from datalex_core.diffing import project_diff, semantic_diff
-from datalex_core.loader import load_yaml_model
 from datalex_core.resolver import ResolvedModel, resolve_model, resolve_project
-from datalex_core.schema import load_schema, schema_issues
+from datalex_core.schema import schema_issues
 
-SCHEMA_PATH = str(Path(__file__).resolve().parent.parent / "schemas" / "model.schema.json")
 DEMO_DIR = str(Path(__file__).resolve().parent.parent / "model-examples" / "multi-model-demo")
-DM_CLI = str(Path(__file__).resolve().parent.parent / "dm")
+DM_CLI = str(Path(__file__).resolve().parent.parent / "datalex")
+# libyaml's emitter when PyYAML was built with it.
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _dump_yaml(data: Dict[str, Any]) -> str:
+    return yaml.dump(data, Dumper=_YAML_DUMPER)
+
+
+_ID_FIELD = {"name": "id", "type": "integer", "primary_key": True, "nullable": False}
+
 
+def _model_doc(name: str, entity: str, imports=None) -> Dict[str, Any]:
+    """Minimal single-entity model; only the names and imports vary per test."""
+    meta: Dict[str, Any] = {"name": name, "version": "1.0.0", "domain": "test",
+                            "owners": ["t@t.com"], "state": "draft"}
+    if imports is not None:
+        meta["imports"] = imports
+    return {"model": meta, "entities": [{"name": entity, "type": "table", "fields": [dict(_ID_FIELD)]}]}
 
-def _schema():
-    return load_schema(SCHEMA_PATH)
+
+@pytest.fixture(scope="session")
+def base_model_yaml() -> str:
+    """The shared 'base' model, serialized once per session."""
+    return _dump_yaml(_model_doc("base", "Foo"))
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink an unchanged fixture file into a second directory."""
+    try:
+        os.link(src, dst)
+    except OSError:  # filesystems without hardlink support
+        shutil.copyfile(src, dst)
 
 
 # ---------------------------------------------------------------------------
@@ -31,25 +66,20 @@ def _schema():
 # ---------------------------------------------------------------------------
 
 class TestImportsSchema:
-    def test_model_without_imports_validates(self):
-        model = load_yaml_model("model-examples/starter-commerce.model.yaml")
-        issues = schema_issues(model, _schema())
+    def test_model_with_imports_validates(self, schema, yaml_model):
+        model = yaml_model(f"{DEMO_DIR}/orders.model.yaml")
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
-    def test_model_with_imports_validates(self):
-        model = load_yaml_model(f"{DEMO_DIR}/orders.model.yaml")
-        issues = schema_issues(model, _schema())
-        assert len(issues) == 0
-
-    def test_imports_field_structure(self):
-        model = load_yaml_model(f"{DEMO_DIR}/orders.model.yaml")
+    def test_imports_field_structure(self, yaml_model):
+        model = yaml_model(f"{DEMO_DIR}/orders.model.yaml")
         imports = model.get("model", {}).get("imports", [])
         assert len(imports) == 1
         assert imports[0]["model"] == "customers"
         assert imports[0]["alias"] == "cust"
         assert "Customer" in imports[0]["entities"]
 
-    def test_invalid_import_model_name(self):
+    def test_invalid_import_model_name(self, schema):
         model = {
             "model": {
                 "name": "test_model",
@@ -65,10 +95,10 @@ class TestImportsSchema:
                 ]}
             ],
         }
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert any(i.severity == "error" for i in issues)
 
-    def test_import_with_path(self):
+    def test_import_with_path(self, schema):
         model = {
             "model": {
                 "name": "test_model",
@@ -84,7 +114,7 @@ class TestImportsSchema:
                 ]}
             ],
         }
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
 
@@ -177,98 +207,34 @@ class TestGraphSummary:
 class TestResolverErrors:
     def test_missing_import_file(self, tmp_path):
         model_file = tmp_path / "test.model.yaml"
-        model_file.write_text(yaml.safe_dump({
-            "model": {
-                "name": "test_model",
-                "version": "1.0.0",
-                "domain": "test",
-                "owners": ["t@t.com"],
-                "state": "draft",
-                "imports": [{"model": "nonexistent"}],
-            },
-            "entities": [
-                {"name": "Foo", "type": "table", "fields": [
-                    {"name": "id", "type": "integer", "primary_key": True, "nullable": False}
-                ]}
-            ],
-        }))
+        model_file.write_text(_dump_yaml(_model_doc("test_model", "Foo", imports=[{"model": "nonexistent"}])))
         resolved = resolve_model(str(model_file))
         assert any(i.code == "IMPORT_NOT_FOUND" for i in resolved.issues)
 
     def test_import_entity_not_found(self, tmp_path):
         # Create a model that imports a specific entity that doesn't exist
         base_file = tmp_path / "base.model.yaml"
-        base_file.write_text(yaml.safe_dump({
-            "model": {"name": "base", "version": "1.0.0", "domain": "test",
-                      "owners": ["t@t.com"], "state": "draft"},
-            "entities": [
-                {"name": "Foo", "type": "table", "fields": [
-                    {"name": "id", "type": "integer", "primary_key": True, "nullable": False}
-                ]}
-            ],
-        }))
+        base_file.write_text(_dump_yaml(_model_doc("base", "Foo")))
         child_file = tmp_path / "child.model.yaml"
-        child_file.write_text(yaml.safe_dump({
-            "model": {"name": "child", "version": "1.0.0", "domain": "test",
-                      "owners": ["t@t.com"], "state": "draft",
-                      "imports": [{"model": "base", "entities": ["NonExistent"]}]},
-            "entities": [
-                {"name": "Bar", "type": "table", "fields": [
-                    {"name": "id", "type": "integer", "primary_key": True, "nullable": False}
-                ]}
-            ],
-        }))
+        child_file.write_text(_dump_yaml(_model_doc(
+            "child", "Bar", imports=[{"model": "base", "entities": ["NonExistent"]}],
+        )))
         resolved = resolve_model(str(child_file))
         assert any(i.code == "IMPORT_ENTITY_NOT_FOUND" for i in resolved.issues)
 
     def test_circular_import_detected(self, tmp_path):
         a_file = tmp_path / "a.model.yaml"
         b_file = tmp_path / "b.model.yaml"
-        a_file.write_text(yaml.safe_dump({
-            "model": {"name": "a", "version": "1.0.0", "domain": "test",
-                      "owners": ["t@t.com"], "state": "draft",
-                      "imports": [{"model": "b"}]},
-            "entities": [
-                {"name": "Foo", "type": "table", "fields": [
-                    {"name": "id", "type": "integer", "primary_key": True, "nullable": False}
-                ]}
-            ],
-        }))
-        b_file.write_text(yaml.safe_dump({
-            "model": {"name": "b", "version": "1.0.0", "domain": "test",
-                      "owners": ["t@t.com"], "state": "draft",
-                      "imports": [{"model": "a"}]},
-            "entities": [
-                {"name": "Bar", "type": "table", "fields": [
-                    {"name": "id", "type": "integer", "primary_key": True, "nullable": False}
-                ]}
-            ],
-        }))
+        a_file.write_text(_dump_yaml(_model_doc("a", "Foo", imports=[{"model": "b"}])))
+        b_file.write_text(_dump_yaml(_model_doc("b", "Bar", imports=[{"model": "a"}])))
         resolved = resolve_model(str(a_file))
         assert any(i.code == "CIRCULAR_IMPORT" for i in resolved.issues)
 
     def test_duplicate_entity_across_models_warns(self, tmp_path):
         base_file = tmp_path / "base.model.yaml"
-        base_file.write_text(yaml.safe_dump({
-            "model": {"name": "base", "version": "1.0.0", "domain": "test",
-                      "owners": ["t@t.com"], "state": "draft"},
-            "entities": [
-                {"name": "Shared", "type": "table", "fields": [
-                    {"name": "id", "type": "integer", "primary_key": True, "nullable": False}
-                ]}
-            ],
-        }))
+        base_file.write_text(_dump_yaml(_model_doc("base", "Shared")))
         child_file = tmp_path / "child.model.yaml"
-        child_file.write_text(yaml.safe_dump({
-            "model": {"name": "child", "version": "1.0.0", "domain": "test",
-                      "owners": ["t@t.com"], "state": "draft",
-                      "imports": [{"model": "base"}]},
-            "entities": [
-                {"name": "Shared", "type": "table", "fields": [
-                    {"name": "id", "type": "integer", "primary_key": True, "nullable": False}
-                ]}
-            ],
-        }))
+        child_file.write_text(_dump_yaml(_model_doc("child", "Shared", imports=[{"model": "base"}])))
         resolved = resolve_model(str(child_file))
         assert any(i.code == "DUPLICATE_CROSS_MODEL_ENTITY" for i in resolved.issues)
 
@@ -307,55 +273,27 @@ class TestProjectDiff:
         assert diff["summary"]["changed_models"] == 0
         assert not diff["has_breaking_changes"]
 
-    def test_added_model_detected(self, tmp_path):
+    def test_added_model_detected(self, tmp_path, base_model_yaml):
         old_dir = tmp_path / "old"
         new_dir = tmp_path / "new"
         old_dir.mkdir()
         new_dir.mkdir()
 
-        base = {
-            "model": {"name": "base", "version": "1.0.0", "domain": "test",
-                      "owners": ["t@t.com"], "state": "draft"},
-            "entities": [
-                {"name": "Foo", "type": "table", "fields": [
-                    {"name": "id", "type": "integer", "primary_key": True, "nullable": False}
-                ]}
-            ],
-        }
-        (old_dir / "base.model.yaml").write_text(yaml.safe_dump(base))
-        (new_dir / "base.model.yaml").write_text(yaml.safe_dump(base))
-
-        extra = {
-            "model": {"name": "extra", "version": "1.0.0", "domain": "test",
-                      "owners": ["t@t.com"], "state": "draft"},
-            "entities": [
-                {"name": "Bar", "type": "table", "fields": [
-                    {"name": "id", "type": "integer", "primary_key": True, "nullable": False}
-                ]}
-            ],
-        }
-        (new_dir / "extra.model.yaml").write_text(yaml.safe_dump(extra))
+        (old_dir / "base.model.yaml").write_text(base_model_yaml)
+        _link_or_copy(old_dir / "base.model.yaml", new_dir / "base.model.yaml")
+        (new_dir / "extra.model.yaml").write_text(_dump_yaml(_model_doc("extra", "Bar")))
 
         diff = project_diff(str(old_dir), str(new_dir))
         assert diff["summary"]["added_models"] == 1
         assert "extra" in diff["added_models"]
 
-    def test_removed_model_is_breaking(self, tmp_path):
+    def test_removed_model_is_breaking(self, tmp_path, base_model_yaml):
         old_dir = tmp_path / "old"
         new_dir = tmp_path / "new"
         old_dir.mkdir()
         new_dir.mkdir()
 
-        base = {
-            "model": {"name": "base", "version": "1.0.0", "domain": "test",
-                      "owners": ["t@t.com"], "state": "draft"},
-            "entities": [
-                {"name": "Foo", "type": "table", "fields": [
-                    {"name": "id", "type": "integer", "primary_key": True, "nullable": False}
-                ]}
-            ],
-        }
-        (old_dir / "base.model.yaml").write_text(yaml.safe_dump(base))
+        (old_dir / "base.model.yaml").write_text(base_model_yaml)
         # new_dir is empty
 
         diff = project_diff(str(old_dir), str(new_dir))
@@ -363,38 +301,50 @@ class TestProjectDiff:
         assert diff["has_breaking_changes"]
         assert any("Model removed" in bc for bc in diff["breaking_changes"])
 
+    def test_changed_model_detected(self, tmp_path):
+        old_dir = tmp_path / "old"
+        new_dir = tmp_path / "new"
+        old_dir.mkdir()
+        new_dir.mkdir()
+        (old_dir / "base.model.yaml").write_text(_dump_yaml(_model_doc("base", "Foo")))
+        (new_dir / "base.model.yaml").write_text(_dump_yaml(_model_doc("base", "Bar")))
+        (old_dir / "same.model.yaml").write_text(_dump_yaml(_model_doc("same", "Baz")))
+        (new_dir / "same.model.yaml").write_text(_dump_yaml(_model_doc("same", "Baz")))
+
+        diff = project_diff(str(old_dir), str(new_dir))
+        assert diff["changed_models"] == ["base"]
+        assert diff["summary"]["unchanged_models"] == 1
+
 
 # ---------------------------------------------------------------------------
 # CLI commands
 # ---------------------------------------------------------------------------
 
+# Keep the CLI tests on one xdist worker (`-n auto --dist=loadgroup`) so a
+# small machine doesn't start an interpreter per core for them.
+@pytest.mark.xdist_group("cli")
 class TestCLIMultiModel:
+    @pytest.mark.slow
     def test_dm_resolve(self):
         result = subprocess.run(
             [sys.executable, DM_CLI, "resolve", f"{DEMO_DIR}/orders.model.yaml"],
-            capture_output=True, text=True,
+            capture_output=True,
         )
-        assert result.returncode == 0
-        assert "Root model: orders" in result.stdout
-        assert "Models resolved: 2" in result.stdout
-        assert "Total entities: 5" in result.stdout
+        assert result.returncode == 0, result.stderr.decode()
+        assert b"Root model: orders" in result.stdout
+        assert b"Models resolved: 2" in result.stdout
+        assert b"Total entities: 5" in result.stdout
 
     def test_dm_resolve_json(self):
-        result = subprocess.run(
-            [sys.executable, DM_CLI, "resolve", f"{DEMO_DIR}/orders.model.yaml", "--output-json"],
-            capture_output=True, text=True,
-        )
+        result = run_dm("resolve", f"{DEMO_DIR}/orders.model.yaml", "--output-json")
         assert result.returncode == 0
-        data = json.loads(result.stdout)
+        data = _json_loads(result.stdout)
         assert data["root_model"] == "orders"
         assert data["model_count"] == 2
         assert len(data["cross_model_relationships"]) == 2
 
     def test_dm_resolve_project(self):
-        result = subprocess.run(
-            [sys.executable, DM_CLI, "resolve-project", DEMO_DIR],
-            capture_output=True, text=True,
-        )
+        result = run_dm("resolve-project", DEMO_DIR)
         assert result.returncode == 0
         assert "Models found: 3" in result.stdout
         assert "customers:" in result.stdout
@@ -402,62 +352,41 @@ class TestCLIMultiModel:
         assert "products:" in result.stdout
 
     def test_dm_resolve_project_json(self):
-        result = subprocess.run(
-            [sys.executable, DM_CLI, "resolve-project", DEMO_DIR, "--output-json"],
-            capture_output=True, text=True,
-        )
+        result = run_dm("resolve-project", DEMO_DIR, "--output-json")
         assert result.returncode == 0
-        data = json.loads(result.stdout)
+        data = _json_loads(result.stdout)
         assert len(data["models"]) == 3
         assert data["total_issues"] == 0
 
     def test_dm_diff_all_same_dir(self):
-        result = subprocess.run(
-            [sys.executable, DM_CLI, "diff-all", DEMO_DIR, DEMO_DIR],
-            capture_output=True, text=True,
-        )
+        result = run_dm("diff-all", DEMO_DIR, DEMO_DIR)
         assert result.returncode == 0
         assert "unchanged:3" in result.stdout
 
     def test_dm_diff_all_json(self):
-        result = subprocess.run(
-            [sys.executable, DM_CLI, "diff-all", DEMO_DIR, DEMO_DIR, "--output-json"],
-            capture_output=True, text=True,
-        )
+        result = run_dm("diff-all", DEMO_DIR, DEMO_DIR, "--output-json")
         assert result.returncode == 0
-        data = json.loads(result.stdout)
+        data = _json_loads(result.stdout)
         assert data["summary"]["changed_models"] == 0
         assert not data["has_breaking_changes"]
 
     def test_dm_validate_standalone_model(self):
         # customers.model.yaml has no imports, so it validates standalone
-        result = subprocess.run(
-            [sys.executable, DM_CLI, "validate", f"{DEMO_DIR}/customers.model.yaml"],
-            capture_output=True, text=True,
-        )
+        result = run_dm("validate", f"{DEMO_DIR}/customers.model.yaml")
         assert result.returncode == 0
 
     def test_dm_validate_cross_model_needs_resolve(self):
         # orders.model.yaml has cross-model refs — single-file validate finds unresolved refs
-        result = subprocess.run(
-            [sys.executable, DM_CLI, "validate", f"{DEMO_DIR}/orders.model.yaml"],
-            capture_output=True, text=True,
-        )
+        result = run_dm("validate", f"{DEMO_DIR}/orders.model.yaml")
         # Expected: fails because Customer/Address refs are in imported model
         assert result.returncode == 1
         assert "RELATIONSHIP_REF_NOT_FOUND" in result.stdout
         # But resolve succeeds (imports are resolved)
-        result2 = subprocess.run(
-            [sys.executable, DM_CLI, "resolve", f"{DEMO_DIR}/orders.model.yaml"],
-            capture_output=True, text=True,
-        )
+        result2 = run_dm("resolve", f"{DEMO_DIR}/orders.model.yaml")
         assert result2.returncode == 0
 
     def test_dm_init_multi_model(self, tmp_path):
-        result = subprocess.run(
-            [sys.executable, DM_CLI, "init", "--path", str(tmp_path), "--multi-model"],
-            capture_output=True, text=True,
-        )
+        result = run_dm("init", "--path", str(tmp_path), "--multi-model")
         assert result.returncode == 0
         assert "multi-model" in result.stdout
         assert (tmp_path / "models" / "shared" / "shared_dimensions.model.yaml").exists()
@@ -467,10 +396,7 @@ class TestCLIMultiModel:
         assert "multi_model: true" in config
 
     def test_dm_init_end_to_end_template(self, tmp_path):
-        result = subprocess.run(
-            [sys.executable, DM_CLI, "init", "--path", str(tmp_path), "--template", "end-to-end"],
-            capture_output=True, text=True,
-        )
+        result = run_dm("init", "--path", str(tmp_path), "--template", "end-to-end")
         assert result.returncode == 0
         assert "end-to-end modeling workspace" in result.stdout
         assert (tmp_path / "models" / "source" / "source_sales_raw.model.yaml").exists()
@@ -482,54 +408,32 @@ class TestCLIMultiModel:
         assert "policy_pack: policies/end_to_end_dictionary.policy.yaml" in config
 
     def test_dm_init_end_to_end_rejects_multi_model_flag(self, tmp_path):
-        result = subprocess.run(
-            [
-                sys.executable,
-                DM_CLI,
-                "init",
-                "--path",
-                str(tmp_path),
-                "--template",
-                "end-to-end",
-                "--multi-model",
-            ],
-            capture_output=True,
-            text=True,
-        )
+        result = run_dm("init", "--path", str(tmp_path), "--template", "end-to-end", "--multi-model")
         assert result.returncode == 1
         assert "--multi-model cannot be combined" in result.stderr
 
     def test_dm_resolve_transitive(self):
-        result = subprocess.run(
-            [sys.executable, DM_CLI, "resolve", f"{DEMO_DIR}/products.model.yaml", "--output-json"],
-            capture_output=True, text=True,
-        )
+        result = run_dm("resolve", f"{DEMO_DIR}/products.model.yaml", "--output-json")
         assert result.returncode == 0
-        data = json.loads(result.stdout)
+        data = _json_loads(result.stdout)
         assert data["model_count"] == 3
         assert data["total_entities"] == 7
 
 
 # ---------------------------------------------------------------------------
-# Multi-model demo files validate
+# Example model files validate
 # ---------------------------------------------------------------------------
 
-class TestMultiModelDemo:
-    def test_customers_model_validates(self):
-        model = load_yaml_model(f"{DEMO_DIR}/customers.model.yaml")
-        issues = schema_issues(model, _schema())
-        assert len(issues) == 0
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "model-examples"
+ALL_EXAMPLE_MODELS = sorted(EXAMPLES_DIR.rglob("*.model.yaml"))
 
-    def test_orders_model_validates(self):
-        model = load_yaml_model(f"{DEMO_DIR}/orders.model.yaml")
-        issues = schema_issues(model, _schema())
-        assert len(issues) == 0
 
-    def test_products_model_validates(self):
-        model = load_yaml_model(f"{DEMO_DIR}/products.model.yaml")
-        issues = schema_issues(model, _schema())
-        assert len(issues) == 0
+@pytest.mark.parametrize("path", ALL_EXAMPLE_MODELS, ids=lambda p: str(p.relative_to(EXAMPLES_DIR)))
+def test_example_model_validates(path, schema, yaml_model):
+    assert schema_issues(yaml_model(str(path)), schema) == []
+
 
+class TestMultiModelDemo:
     def test_readme_exists(self):
         readme = Path(DEMO_DIR) / "README.md"
         # We'll create this in the docs step
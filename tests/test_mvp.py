@@ -25,6 +25,19 @@ class MvpTests(unittest.TestCase):
         issues = schema_issues(model, schema)
         self.assertEqual([], issues)
 
+    def test_schema_validation_reuses_compiled_validator(self) -> None:
+        from datalex_core.schema import _validator_for
+
+        schema = load_schema(str(self.schema))
+        self.assertIs(_validator_for(schema), _validator_for(schema))
+        # An equal but distinct schema object gets its own validator.
+        self.assertIsNot(_validator_for(schema), _validator_for(load_schema(str(self.schema))))
+
+        broken = load_yaml_model(str(self.sample_model))
+        del broken["model"]["name"]
+        self.assertTrue(schema_issues(broken, schema))
+        self.assertEqual([], schema_issues(load_yaml_model(str(self.sample_model)), schema))
+
     def test_semantic_lint_passes_for_starter(self) -> None:
         model = load_yaml_model(str(self.sample_model))
         issues = lint_issues(model)
@@ -1,6 +1,5 @@
 import time
 import unittest
-from copy import deepcopy
 from pathlib import Path
 
 import sys
@@ -10,34 +9,37 @@ sys.path.insert(0, str(ROOT / "packages" / "core_engine" / "src"))
 
 from datalex_core import compile_model, semantic_diff
 
+try:
+    import pytest_benchmark  # noqa: F401  (provides the `benchmark` fixture)
+except ImportError:
+    pytest_benchmark = None
+
 
 def make_large_model(entity_count=250, field_count=8):
-    entities = []
-    relationships = []
-
-    for idx in range(entity_count):
-        entity_name = f"Entity{idx:03d}"
-        fields = [
-            {
-                "name": f"field_{field_idx}",
-                "type": "integer" if field_idx == 0 else "string",
-                "primary_key": field_idx == 0,
-                "nullable": field_idx != 0,
-            }
-            for field_idx in range(field_count)
-        ]
-        entities.append({"name": entity_name, "type": "table", "fields": fields})
-
-        if idx > 0:
-            prev_entity = f"Entity{idx - 1:03d}"
-            relationships.append(
-                {
-                    "name": f"{prev_entity.lower()}_{entity_name.lower()}_rel",
-                    "from": f"{prev_entity}.field_0",
-                    "to": f"{entity_name}.field_0",
-                    "cardinality": "one_to_many",
-                }
-            )
+    entity_names = [f"Entity{idx:03d}" for idx in range(entity_count)]
+    field_template = tuple(
+        {
+            "name": f"field_{field_idx}",
+            "type": "integer" if field_idx == 0 else "string",
+            "primary_key": field_idx == 0,
+            "nullable": field_idx != 0,
+        }
+        for field_idx in range(field_count)
+    )
+
+    entities = [
+        {"name": name, "type": "table", "fields": [field.copy() for field in field_template]}
+        for name in entity_names
+    ]
+    relationships = [
+        {
+            "name": f"{prev_name.lower()}_{name.lower()}_rel",
+            "from": f"{prev_name}.field_0",
+            "to": f"{name}.field_0",
+            "cardinality": "one_to_many",
+        }
+        for prev_name, name in zip(entity_names, entity_names[1:])
+    ]
 
     return {
         "model": {
@@ -52,13 +54,24 @@ def make_large_model(entity_count=250, field_count=8):
     }
 
 
+def make_changed_model(baseline):
+    # Only entity 10 diverges; everything else is shared with the baseline.
+    # compile_model and semantic_diff clone their inputs, so this is safe.
+    changed = {**baseline, "entities": list(baseline["entities"])}
+    changed["entities"][10] = {
+        **baseline["entities"][10],
+        "fields": baseline["entities"][10]["fields"]
+        + [{"name": "new_metric", "type": "decimal(12,2)", "nullable": True}],
+    }
+    return changed
+
+
 class PerformanceTests(unittest.TestCase):
+    # Coarse wall-clock budgets so plain `unittest` runs (CI) still catch
+    # gross regressions; the benchmarks below track finer drift.
     def test_large_model_compile_and_diff_budget(self):
         baseline = make_large_model()
-        changed = deepcopy(baseline)
-        changed["entities"][10]["fields"].append(
-            {"name": "new_metric", "type": "decimal(12,2)", "nullable": True}
-        )
+        changed = make_changed_model(baseline)
 
         compile_start = time.perf_counter()
         compile_model(baseline)
@@ -73,5 +86,22 @@ class PerformanceTests(unittest.TestCase):
         self.assertEqual(1, diff["summary"]["changed_entities"])
 
 
+# Statistical benchmarks, collected only when pytest-benchmark is installed:
+#   pytest tests/test_performance.py --benchmark-autosave
+#   pytest tests/test_performance.py --benchmark-compare --benchmark-compare-fail=mean:10%
+if pytest_benchmark is not None:
+
+    def test_compile_benchmark(benchmark):
+        baseline = make_large_model()
+        result = benchmark.pedantic(compile_model, args=(baseline,), rounds=5, iterations=1, warmup_rounds=1)
+        assert len(result["entities"]) == 250
+
+    def test_semantic_diff_benchmark(benchmark):
+        baseline = make_large_model()
+        changed = make_changed_model(baseline)
+        diff = benchmark.pedantic(semantic_diff, args=(baseline, changed), rounds=5, iterations=1, warmup_rounds=1)
+        assert diff["summary"]["changed_entities"] == 1
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 import sys
 import unittest
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -18,10 +19,13 @@ SCHEMA_PATH = str(ROOT / "schemas" / "model.schema.json")
 POLICY_SCHEMA_PATH = str(ROOT / "schemas" / "policy.schema.json")
 
 
+# Parsed once: schema_issues caches its compiled validator per schema object.
+@lru_cache(maxsize=1)
 def _schema():
     return load_schema(SCHEMA_PATH)
 
 
+@lru_cache(maxsize=1)
 def _policy_schema():
     return load_schema(POLICY_SCHEMA_PATH)
 
@@ -10,21 +10,42 @@ Tests for:
 - Keyboard shortcuts definitions
 """
 
+import copy
 import json
 import os
 import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional
 import pytest
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
 # ── helpers ──────────────────────────────────────────────────────────────────
 
 FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
 WEB_APP_DIR = os.path.join(os.path.dirname(__file__), "..", "packages", "web-app", "src")
 
+# Web-app sources read by several tests, joined once at import.
+PATH_CSS = os.path.join(WEB_APP_DIR, "styles", "globals.css")
+PATH_KB = os.path.join(WEB_APP_DIR, "components", "panels", "KeyboardShortcutsPanel.jsx")
+PATH_ANNOT = os.path.join(WEB_APP_DIR, "components", "diagram", "AnnotationNode.jsx")
+PATH_TOOLBAR = os.path.join(WEB_APP_DIR, "components", "diagram", "DiagramToolbar.jsx")
+PATH_ELK = os.path.join(WEB_APP_DIR, "lib", "elkLayout.js")
+
+
+def _assert_all_in(content, *needles):
+    """Assert every needle occurs in content, reporting all missing ones."""
+    missing = [n for n in needles if n not in content]
+    assert not missing, missing
+
 
 def load_yaml(path):
     with open(path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_Loader)
 
 
 def build_model_with_subject_areas():
@@ -97,6 +118,47 @@ def build_model_with_subject_areas():
     }
 
 
+@pytest.fixture(scope="session")
+def read_source(read_text, file_exists):
+    """Cached reader for web-app sources; skips content checks on missing files.
+
+    The existence tests still fail for a missing file, so it is reported once
+    rather than as a FileNotFoundError in every content test.
+    """
+
+    def _read(path):
+        if not file_exists(path):
+            pytest.skip(f"{os.path.relpath(path, WEB_APP_DIR)} is missing")
+        return read_text(path)
+
+    return _read
+
+
+@pytest.fixture(scope="session")
+def base_model():
+    """Shared read-only model; tests that mutate it use `model` instead."""
+    return build_model_with_subject_areas()
+
+
+@pytest.fixture
+def model(base_model):
+    return copy.deepcopy(base_model)
+
+
+@pytest.fixture(scope="session")
+def entities_by_name(base_model):
+    return {e["name"]: e for e in base_model["entities"]}
+
+
+@pytest.fixture(scope="session")
+def fields_by_entity(base_model):
+    """Entity name -> {field name -> field}, built once per session."""
+    return {
+        e["name"]: {f["name"]: f for f in e["fields"]}
+        for e in base_model["entities"]
+    }
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # 1. Subject Area Grouping Tests
 # ══════════════════════════════════════════════════════════════════════════════
@@ -104,8 +166,8 @@ def build_model_with_subject_areas():
 class TestSubjectAreaGrouping:
     """Tests for subject area grouping logic."""
 
-    def test_entities_have_subject_area(self):
-        model = build_model_with_subject_areas()
+    def test_entities_have_subject_area(self, base_model):
+        model = base_model
         sa_map = {}
         for e in model["entities"]:
             sa = e.get("subject_area", "")
@@ -118,30 +180,28 @@ class TestSubjectAreaGrouping:
         assert sa_map["Sales"] == ["Order"]
         assert sa_map["Inventory"] == ["Product"]
 
-    def test_ungrouped_entities(self):
-        model = build_model_with_subject_areas()
+    def test_ungrouped_entities(self, base_model):
+        model = base_model
         ungrouped = [e["name"] for e in model["entities"] if not e.get("subject_area")]
         assert ungrouped == ["AuditLog"]
 
-    def test_subject_area_count(self):
-        model = build_model_with_subject_areas()
-        areas = set(e.get("subject_area") for e in model["entities"] if e.get("subject_area"))
+    def test_subject_area_count(self, base_model):
+        model = base_model
+        areas = {e["subject_area"] for e in model["entities"] if e.get("subject_area")}
         assert len(areas) == 3
 
-    def test_single_subject_area_no_grouping(self):
+    def test_single_subject_area_no_grouping(self, model):
         """When all entities share one subject area, no grouping should occur."""
-        model = build_model_with_subject_areas()
         for e in model["entities"]:
             e["subject_area"] = "Common"
-        areas = set(e.get("subject_area") for e in model["entities"])
+        areas = {e["subject_area"] for e in model["entities"]}
         assert len(areas) == 1
 
-    def test_no_subject_areas(self):
+    def test_no_subject_areas(self, model):
         """When no entities have subject_area, grouping is skipped."""
-        model = build_model_with_subject_areas()
         for e in model["entities"]:
             e.pop("subject_area", None)
-        areas = set(e.get("subject_area") for e in model["entities"] if e.get("subject_area"))
+        areas = {e["subject_area"] for e in model["entities"] if e.get("subject_area")}
         assert len(areas) == 0
 
 
@@ -152,173 +212,148 @@ class TestSubjectAreaGrouping:
 class TestEnhancedEntityNodes:
     """Tests for enhanced entity node data passthrough."""
 
-    def test_sla_present_on_entity(self):
-        model = build_model_with_subject_areas()
-        customer = next(e for e in model["entities"] if e["name"] == "Customer")
-        assert customer["sla"] == "99.9%"
+    def test_sla_present_on_entity(self, entities_by_name):
+        assert entities_by_name["Customer"]["sla"] == "99.9%"
 
-    def test_sla_missing_on_entity(self):
-        model = build_model_with_subject_areas()
-        product = next(e for e in model["entities"] if e["name"] == "Product")
-        assert "sla" not in product
+    def test_sla_missing_on_entity(self, entities_by_name):
+        assert "sla" not in entities_by_name["Product"]
 
-    def test_sensitivity_on_field(self):
-        model = build_model_with_subject_areas()
-        customer = next(e for e in model["entities"] if e["name"] == "Customer")
-        email_field = next(f for f in customer["fields"] if f["name"] == "email")
+    def test_sensitivity_on_field(self, fields_by_entity):
+        email_field = fields_by_entity["Customer"]["email"]
         assert email_field["sensitivity"] == "confidential"
 
-    def test_check_constraint_on_field(self):
-        model = build_model_with_subject_areas()
-        product = next(e for e in model["entities"] if e["name"] == "Product")
-        price_field = next(f for f in product["fields"] if f["name"] == "price")
+    def test_check_constraint_on_field(self, fields_by_entity):
+        price_field = fields_by_entity["Product"]["price"]
         assert price_field["check"] == "price > 0"
 
-    def test_foreign_key_flag(self):
-        model = build_model_with_subject_areas()
-        order = next(e for e in model["entities"] if e["name"] == "Order")
-        fk_field = next(f for f in order["fields"] if f["name"] == "customer_id")
+    def test_foreign_key_flag(self, fields_by_entity):
+        fk_field = fields_by_entity["Order"]["customer_id"]
         assert fk_field["foreign_key"] is True
 
-    def test_primary_key_flag(self):
-        model = build_model_with_subject_areas()
-        for entity in model["entities"]:
-            id_field = next(f for f in entity["fields"] if f["name"] == "id")
-            assert id_field["primary_key"] is True
+    def test_primary_key_flag(self, fields_by_entity):
+        for fields in fields_by_entity.values():
+            assert fields["id"]["primary_key"] is True
 
-    def test_tags_present(self):
-        model = build_model_with_subject_areas()
-        customer = next(e for e in model["entities"] if e["name"] == "Customer")
+    def test_tags_present(self, entities_by_name):
+        customer = entities_by_name["Customer"]
         assert "core" in customer["tags"]
         assert "pii" in customer["tags"]
 
-    def test_description_present(self):
-        model = build_model_with_subject_areas()
-        customer = next(e for e in model["entities"] if e["name"] == "Customer")
-        assert customer["description"] == "Customer master data"
+    def test_description_present(self, entities_by_name):
+        assert entities_by_name["Customer"]["description"] == "Customer master data"
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # 3. Global Search Index Tests
 # ══════════════════════════════════════════════════════════════════════════════
 
+class Hit(NamedTuple):
+    """One search index record (the JS index uses plain objects)."""
+
+    category: str
+    text: str
+    entityName: Optional[str]
+
+
+# Interned once so every Hit shares the same category objects and category
+# comparisons hit the identity fast path.
+CAT_ENTITY = sys.intern("entity")
+CAT_DESCRIPTION = sys.intern("description")
+CAT_TAG = sys.intern("tag")
+CAT_FIELD = sys.intern("field")
+CAT_GLOSSARY = sys.intern("glossary")
+
+
 def build_search_index(model):
     """Python equivalent of the JS buildSearchIndex for testing."""
     results = []
+    append = results.append
     for entity in model.get("entities", []):
-        results.append({
-            "category": "entity",
-            "text": entity["name"],
-            "entityName": entity["name"],
-        })
+        name = entity["name"]
+        append(Hit(CAT_ENTITY, name, name))
         if entity.get("description"):
-            results.append({
-                "category": "description",
-                "text": entity["description"],
-                "entityName": entity["name"],
-            })
+            append(Hit(CAT_DESCRIPTION, entity["description"], name))
         for tag in entity.get("tags", []):
-            results.append({
-                "category": "tag",
-                "text": str(tag),
-                "entityName": entity["name"],
-            })
+            append(Hit(CAT_TAG, str(tag), name))
         for field in entity.get("fields", []):
-            results.append({
-                "category": "field",
-                "text": field["name"],
-                "entityName": entity["name"],
-            })
+            append(Hit(CAT_FIELD, field["name"], name))
             if field.get("description"):
-                results.append({
-                    "category": "description",
-                    "text": field["description"],
-                    "entityName": entity["name"],
-                })
+                append(Hit(CAT_DESCRIPTION, field["description"], name))
     for term in model.get("glossary", []):
-        results.append({
-            "category": "glossary",
-            "text": term.get("term", ""),
-            "entityName": None,
-        })
+        append(Hit(CAT_GLOSSARY, term.get("term", ""), None))
     return results
 
 
+class SearchIndex(NamedTuple):
+    items: List[Hit]
+    by_category: Dict[str, List[Hit]]
+    lowered: List[str]  # items[i].text.lower(), precomputed
+
+    def query(self, text):
+        q = text.lower()
+        return [self.items[i] for i, t in enumerate(self.lowered) if q in t]
+
+
+@pytest.fixture(scope="session")
+def search_index(base_model):
+    items = build_search_index(base_model)
+    by_category = defaultdict(list)
+    for item in items:
+        by_category[item.category].append(item)
+    return SearchIndex(items, by_category, [item.text.lower() for item in items])
+
+
 class TestGlobalSearch:
     """Tests for global search index building and querying."""
 
-    def test_index_contains_entities(self):
-        model = build_model_with_subject_areas()
-        index = build_search_index(model)
-        entity_items = [i for i in index if i["category"] == "entity"]
+    def test_index_contains_entities(self, search_index):
+        entity_items = search_index.by_category["entity"]
         assert len(entity_items) == 5
-        names = {i["text"] for i in entity_items}
+        names = {i.text for i in entity_items}
         assert names == {"Customer", "Order", "Product", "Address", "AuditLog"}
 
-    def test_index_contains_fields(self):
-        model = build_model_with_subject_areas()
-        index = build_search_index(model)
-        field_items = [i for i in index if i["category"] == "field"]
-        field_names = {i["text"] for i in field_items}
+    def test_index_contains_fields(self, search_index):
+        field_names = {i.text for i in search_index.by_category["field"]}
         assert "email" in field_names
         assert "total" in field_names
         assert "street" in field_names
 
-    def test_index_contains_tags(self):
-        model = build_model_with_subject_areas()
-        index = build_search_index(model)
-        tag_items = [i for i in index if i["category"] == "tag"]
-        tag_texts = {i["text"] for i in tag_items}
+    def test_index_contains_tags(self, search_index):
+        tag_texts = {i.text for i in search_index.by_category["tag"]}
         assert "core" in tag_texts
         assert "pii" in tag_texts
         assert "inventory" in tag_texts
 
-    def test_index_contains_descriptions(self):
-        model = build_model_with_subject_areas()
-        index = build_search_index(model)
-        desc_items = [i for i in index if i["category"] == "description"]
-        desc_texts = {i["text"] for i in desc_items}
+    def test_index_contains_descriptions(self, search_index):
+        desc_texts = {i.text for i in search_index.by_category["description"]}
         assert "Customer master data" in desc_texts
         assert "Sales orders" in desc_texts
 
-    def test_index_contains_glossary(self):
-        model = build_model_with_subject_areas()
-        index = build_search_index(model)
-        glossary_items = [i for i in index if i["category"] == "glossary"]
+    def test_index_contains_glossary(self, search_index):
+        glossary_items = search_index.by_category["glossary"]
         assert len(glossary_items) == 2
-        terms = {i["text"] for i in glossary_items}
+        terms = {i.text for i in glossary_items}
         assert "SLA" in terms
         assert "PII" in terms
 
-    def test_search_by_query(self):
-        model = build_model_with_subject_areas()
-        index = build_search_index(model)
-        query = "customer"
-        results = [i for i in index if query.lower() in i["text"].lower()]
+    def test_search_by_query(self, search_index):
+        results = search_index.query("customer")
         assert len(results) >= 2  # Customer entity + customer_id field
 
-    def test_search_no_results(self):
-        model = build_model_with_subject_areas()
-        index = build_search_index(model)
-        query = "zzzznonexistent"
-        results = [i for i in index if query.lower() in i["text"].lower()]
+    def test_search_no_results(self, search_index):
+        results = search_index.query("zzzznonexistent")
         assert len(results) == 0
 
-    def test_search_case_insensitive(self):
-        model = build_model_with_subject_areas()
-        index = build_search_index(model)
-        q1 = [i for i in index if "customer" in i["text"].lower()]
-        q2 = [i for i in index if "CUSTOMER" in i["text"].upper()]
+    def test_search_case_insensitive(self, search_index):
+        q1 = search_index.query("customer")
+        q2 = [i for i in search_index.items if "CUSTOMER" in i.text.upper()]
         assert len(q1) == len(q2)
 
-    def test_search_filter_by_category(self):
-        model = build_model_with_subject_areas()
-        index = build_search_index(model)
-        query = "id"
-        all_results = [i for i in index if query.lower() in i["text"].lower()]
-        field_only = [i for i in all_results if i["category"] == "field"]
+    def test_search_filter_by_category(self, search_index):
+        all_results = search_index.query("id")
+        field_only = [i for i in all_results if i.category == "field"]
         assert len(field_only) <= len(all_results)
-        assert all(i["category"] == "field" for i in field_only)
+        assert all(i.category == "field" for i in field_only)
 
     def test_empty_model_search(self):
         index = build_search_index({})
@@ -329,7 +364,8 @@ class TestGlobalSearch:
 # 4. YAML Autocomplete Schema Keywords Tests
 # ══════════════════════════════════════════════════════════════════════════════
 
-SCHEMA_KEYWORDS = {
+# Membership is all the tests check, so each group is a frozenset.
+SCHEMA_KEYWORDS = {k: frozenset(v) for k, v in {
     "root": ["model:", "entities:", "relationships:", "indexes:", "governance:", "glossary:"],
     "model": ["name:", "version:", "domain:", "owners:", "state:", "description:", "spec_version:", "imports:"],
     "entity": ["name:", "type:", "description:", "fields:", "tags:", "schema:", "database:", "subject_area:", "owner:", "sla:"],
@@ -341,7 +377,7 @@ SCHEMA_KEYWORDS = {
     "states": ["draft", "approved", "deprecated"],
     "entityTypes": ["table", "view", "materialized_view", "external_table", "snapshot"],
     "sensitivity": ["public", "internal", "confidential", "restricted"],
-}
+}.items()}
 
 
 class TestYamlAutocomplete:
@@ -402,41 +438,32 @@ class TestYamlAutocomplete:
 class TestDarkMode:
     """Tests for dark mode CSS variable definitions."""
 
-    def test_dark_theme_css_exists(self):
-        css_path = os.path.join(WEB_APP_DIR, "styles", "globals.css")
-        assert os.path.exists(css_path)
-        with open(css_path) as f:
-            css = f.read()
+    def test_dark_theme_css_exists(self, read_source, file_exists):
+        assert file_exists(PATH_CSS)
+        css = read_source(PATH_CSS)
         assert '[data-theme="dark"]' in css
 
-    def test_dark_theme_has_bg_colors(self):
-        css_path = os.path.join(WEB_APP_DIR, "styles", "globals.css")
-        with open(css_path) as f:
-            css = f.read()
-        assert "--color-bg-primary: #0f172a" in css
-        assert "--color-bg-secondary: #1e293b" in css
-
-    def test_dark_theme_has_text_colors(self):
-        css_path = os.path.join(WEB_APP_DIR, "styles", "globals.css")
-        with open(css_path) as f:
-            css = f.read()
-        assert "--color-text-primary: #f1f5f9" in css
-        assert "--color-text-secondary: #cbd5e1" in css
-
-    def test_dark_theme_has_border_colors(self):
-        css_path = os.path.join(WEB_APP_DIR, "styles", "globals.css")
-        with open(css_path) as f:
-            css = f.read()
+    def test_dark_theme_has_bg_colors(self, read_source):
+        css = read_source(PATH_CSS)
+        _assert_all_in(css, "--color-bg-primary: #0f172a", "--color-bg-secondary: #1e293b")
+
+    def test_dark_theme_has_text_colors(self, read_source):
+        css = read_source(PATH_CSS)
+        _assert_all_in(css, "--color-text-primary: #f1f5f9", "--color-text-secondary: #cbd5e1")
+
+    def test_dark_theme_has_border_colors(self, read_source):
+        css = read_source(PATH_CSS)
         assert "--color-border-primary: #334155" in css
 
-    def test_css_uses_variables_not_hardcoded(self):
-        css_path = os.path.join(WEB_APP_DIR, "styles", "globals.css")
-        with open(css_path) as f:
-            css = f.read()
+    def test_css_uses_variables_not_hardcoded(self, read_source):
+        css = read_source(PATH_CSS)
         # CodeMirror should use CSS variables
-        assert "var(--color-bg-primary)" in css
-        assert "var(--color-bg-secondary)" in css
-        assert "var(--color-text-primary)" in css
+        _assert_all_in(
+            css,
+            "var(--color-bg-primary)",
+            "var(--color-bg-secondary)",
+            "var(--color-text-primary)",
+        )
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -446,154 +473,84 @@ class TestDarkMode:
 class TestKeyboardShortcuts:
     """Tests for keyboard shortcuts panel definitions."""
 
-    def test_shortcuts_panel_exists(self):
-        panel_path = os.path.join(WEB_APP_DIR, "components", "panels", "KeyboardShortcutsPanel.jsx")
-        assert os.path.exists(panel_path)
-
-    def test_shortcuts_panel_has_groups(self):
-        panel_path = os.path.join(WEB_APP_DIR, "components", "panels", "KeyboardShortcutsPanel.jsx")
-        with open(panel_path) as f:
-            content = f.read()
-        assert "General" in content
-        assert "Diagram" in content
-        assert "Editor" in content
-
-    def test_shortcuts_panel_has_save(self):
-        panel_path = os.path.join(WEB_APP_DIR, "components", "panels", "KeyboardShortcutsPanel.jsx")
-        with open(panel_path) as f:
-            content = f.read()
+    def test_shortcuts_panel_exists(self, file_exists):
+        assert file_exists(PATH_KB)
+
+    def test_shortcuts_panel_has_groups(self, read_source):
+        content = read_source(PATH_KB)
+        _assert_all_in(content, "General", "Diagram", "Editor")
+
+    def test_shortcuts_panel_has_save(self, read_source):
+        content = read_source(PATH_KB)
         assert "Save current file" in content
 
-    def test_shortcuts_panel_has_search(self):
-        panel_path = os.path.join(WEB_APP_DIR, "components", "panels", "KeyboardShortcutsPanel.jsx")
-        with open(panel_path) as f:
-            content = f.read()
+    def test_shortcuts_panel_has_search(self, read_source):
+        content = read_source(PATH_KB)
         assert "Open global search" in content
 
-    def test_shortcuts_panel_has_dark_mode(self):
-        panel_path = os.path.join(WEB_APP_DIR, "components", "panels", "KeyboardShortcutsPanel.jsx")
-        with open(panel_path) as f:
-            content = f.read()
+    def test_shortcuts_panel_has_dark_mode(self, read_source):
+        content = read_source(PATH_KB)
         assert "Toggle dark mode" in content
 
-    def test_shortcuts_panel_has_export(self):
-        panel_path = os.path.join(WEB_APP_DIR, "components", "panels", "KeyboardShortcutsPanel.jsx")
-        with open(panel_path) as f:
-            content = f.read()
-        assert "Export diagram as PNG" in content
-        assert "Export diagram as SVG" in content
+    def test_shortcuts_panel_has_export(self, read_source):
+        content = read_source(PATH_KB)
+        _assert_all_in(content, "Export diagram as PNG", "Export diagram as SVG")
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # 7. Component File Existence Tests
 # ══════════════════════════════════════════════════════════════════════════════
 
-class TestComponentFiles:
-    """Tests that all Phase 5 component files exist."""
-
-    def test_subject_area_group_component(self):
-        path = os.path.join(WEB_APP_DIR, "components", "diagram", "SubjectAreaGroup.jsx")
-        assert os.path.exists(path)
-
-    def test_annotation_node_component(self):
-        path = os.path.join(WEB_APP_DIR, "components", "diagram", "AnnotationNode.jsx")
-        assert os.path.exists(path)
+COMPONENT_FILES = [
+    "components/diagram/SubjectAreaGroup.jsx",
+    "components/diagram/AnnotationNode.jsx",
+    "components/panels/GlobalSearchPanel.jsx",
+    "components/panels/KeyboardShortcutsPanel.jsx",
+]
+
+COMPONENT_CHECKS = [
+    pytest.param("lib/elkLayout.js", ["groupBySubjectArea", "getSubjectAreaColor", "SUBJECT_AREA_COLORS"],
+                 id="elk_layout_has_grouping"),
+    pytest.param("components/diagram/DiagramCanvas.jsx", ["annotation: AnnotationNode", "group: SubjectAreaGroup"],
+                 id="diagram_canvas_has_annotation_type"),
+    pytest.param("components/diagram/DiagramToolbar.jsx", ["html-to-image", "toPng", "toSvg"],
+                 id="diagram_toolbar_has_export"),
+    pytest.param("components/diagram/DiagramToolbar.jsx", ["StickyNote", "__dlAddAnnotation"],
+                 id="diagram_toolbar_has_note_button"),
+    pytest.param("components/diagram/DiagramToolbar.jsx", ["groupBySubjectArea"],
+                 id="diagram_toolbar_has_group_toggle"),
+    pytest.param("components/editor/YamlEditor.jsx", ["autocompletion", "yamlCompletions", "SCHEMA_KEYWORDS"],
+                 id="yaml_editor_has_autocomplete"),
+    pytest.param("components/editor/YamlEditor.jsx", ["linter", "lintGutter", "yamlLinter"],
+                 id="yaml_editor_has_linter"),
+    pytest.param("components/layout/TopBar.jsx", ["toggleTheme", "Moon", "Sun"],
+                 id="topbar_has_theme_toggle"),
+    pytest.param("stores/uiStore.js", ["theme:", "toggleTheme", "dm_theme"],
+                 id="ui_store_has_theme"),
+    pytest.param("stores/diagramStore.js", ["groupBySubjectArea: true"],
+                 id="diagram_store_has_group_setting"),
+    pytest.param("App.jsx", ['"search"', "GlobalSearchPanel"],
+                 id="app_has_search_tab"),
+    pytest.param("App.jsx", ["KeyboardShortcutsPanel", "showShortcuts"],
+                 id="app_has_keyboard_shortcuts"),
+]
+
+
+# Every file a content check reads also gets an existence check, so a missing
+# file fails here once while its content checks skip.
+COMPONENT_FILES += sorted({p.values[0] for p in COMPONENT_CHECKS} - set(COMPONENT_FILES))
 
-    def test_global_search_panel(self):
-        path = os.path.join(WEB_APP_DIR, "components", "panels", "GlobalSearchPanel.jsx")
-        assert os.path.exists(path)
 
-    def test_keyboard_shortcuts_panel(self):
-        path = os.path.join(WEB_APP_DIR, "components", "panels", "KeyboardShortcutsPanel.jsx")
-        assert os.path.exists(path)
+class TestComponentFiles:
+    """Tests that all Phase 5 component files exist."""
 
-    def test_elk_layout_has_grouping(self):
-        path = os.path.join(WEB_APP_DIR, "lib", "elkLayout.js")
-        with open(path) as f:
-            content = f.read()
-        assert "groupBySubjectArea" in content
-        assert "getSubjectAreaColor" in content
-        assert "SUBJECT_AREA_COLORS" in content
+    @pytest.mark.parametrize("rel", COMPONENT_FILES)
+    def test_component_exists(self, rel, file_exists):
+        assert file_exists(os.path.join(WEB_APP_DIR, rel))
 
-    def test_diagram_canvas_has_annotation_type(self):
-        path = os.path.join(WEB_APP_DIR, "components", "diagram", "DiagramCanvas.jsx")
-        with open(path) as f:
-            content = f.read()
-        assert "annotation: AnnotationNode" in content
-        assert "group: SubjectAreaGroup" in content
-
-    def test_diagram_toolbar_has_export(self):
-        path = os.path.join(WEB_APP_DIR, "components", "diagram", "DiagramToolbar.jsx")
-        with open(path) as f:
-            content = f.read()
-        assert "html-to-image" in content
-        assert "toPng" in content
-        assert "toSvg" in content
-
-    def test_diagram_toolbar_has_note_button(self):
-        path = os.path.join(WEB_APP_DIR, "components", "diagram", "DiagramToolbar.jsx")
-        with open(path) as f:
-            content = f.read()
-        assert "StickyNote" in content
-        assert "__dlAddAnnotation" in content
-
-    def test_diagram_toolbar_has_group_toggle(self):
-        path = os.path.join(WEB_APP_DIR, "components", "diagram", "DiagramToolbar.jsx")
-        with open(path) as f:
-            content = f.read()
-        assert "groupBySubjectArea" in content
-
-    def test_yaml_editor_has_autocomplete(self):
-        path = os.path.join(WEB_APP_DIR, "components", "editor", "YamlEditor.jsx")
-        with open(path) as f:
-            content = f.read()
-        assert "autocompletion" in content
-        assert "yamlCompletions" in content
-        assert "SCHEMA_KEYWORDS" in content
-
-    def test_yaml_editor_has_linter(self):
-        path = os.path.join(WEB_APP_DIR, "components", "editor", "YamlEditor.jsx")
-        with open(path) as f:
-            content = f.read()
-        assert "linter" in content
-        assert "lintGutter" in content
-        assert "yamlLinter" in content
-
-    def test_topbar_has_theme_toggle(self):
-        path = os.path.join(WEB_APP_DIR, "components", "layout", "TopBar.jsx")
-        with open(path) as f:
-            content = f.read()
-        assert "toggleTheme" in content
-        assert "Moon" in content
-        assert "Sun" in content
-
-    def test_ui_store_has_theme(self):
-        path = os.path.join(WEB_APP_DIR, "stores", "uiStore.js")
-        with open(path) as f:
-            content = f.read()
-        assert "theme:" in content
-        assert "toggleTheme" in content
-        assert "dm_theme" in content
-
-    def test_diagram_store_has_group_setting(self):
-        path = os.path.join(WEB_APP_DIR, "stores", "diagramStore.js")
-        with open(path) as f:
-            content = f.read()
-        assert "groupBySubjectArea: true" in content
-
-    def test_app_has_search_tab(self):
-        path = os.path.join(WEB_APP_DIR, "App.jsx")
-        with open(path) as f:
-            content = f.read()
-        assert '"search"' in content
-        assert "GlobalSearchPanel" in content
-
-    def test_app_has_keyboard_shortcuts(self):
-        path = os.path.join(WEB_APP_DIR, "App.jsx")
-        with open(path) as f:
-            content = f.read()
-        assert "KeyboardShortcutsPanel" in content
-        assert "showShortcuts" in content
+    @pytest.mark.parametrize("rel, needles", COMPONENT_CHECKS)
+    def test_component_contains(self, rel, needles, read_source):
+        _assert_all_in(read_source(os.path.join(WEB_APP_DIR, rel)), *needles)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -603,33 +560,23 @@ class TestComponentFiles:
 class TestAnnotationNode:
     """Tests for annotation node component."""
 
-    def test_annotation_component_exists(self):
-        path = os.path.join(WEB_APP_DIR, "components", "diagram", "AnnotationNode.jsx")
-        assert os.path.exists(path)
+    def test_annotation_component_exists(self, file_exists):
+        assert file_exists(PATH_ANNOT)
 
-    def test_annotation_has_colors(self):
-        path = os.path.join(WEB_APP_DIR, "components", "diagram", "AnnotationNode.jsx")
-        with open(path) as f:
-            content = f.read()
+    def test_annotation_has_colors(self, read_source):
+        content = read_source(PATH_ANNOT)
         assert "ANNOTATION_COLORS" in content
 
-    def test_annotation_has_edit_mode(self):
-        path = os.path.join(WEB_APP_DIR, "components", "diagram", "AnnotationNode.jsx")
-        with open(path) as f:
-            content = f.read()
-        assert "editing" in content
-        assert "setEditing" in content
-
-    def test_annotation_has_delete(self):
-        path = os.path.join(WEB_APP_DIR, "components", "diagram", "AnnotationNode.jsx")
-        with open(path) as f:
-            content = f.read()
+    def test_annotation_has_edit_mode(self, read_source):
+        content = read_source(PATH_ANNOT)
+        _assert_all_in(content, "editing", "setEditing")
+
+    def test_annotation_has_delete(self, read_source):
+        content = read_source(PATH_ANNOT)
         assert "onDelete" in content
 
-    def test_annotation_has_update(self):
-        path = os.path.join(WEB_APP_DIR, "components", "diagram", "AnnotationNode.jsx")
-        with open(path) as f:
-            content = f.read()
+    def test_annotation_has_update(self, read_source):
+        content = read_source(PATH_ANNOT)
         assert "onUpdate" in content
 
 
@@ -648,16 +595,12 @@ class TestDiagramExport:
             pkg = json.load(f)
         assert "html-to-image" in pkg.get("dependencies", {})
 
-    def test_toolbar_has_png_export(self):
-        path = os.path.join(WEB_APP_DIR, "components", "diagram", "DiagramToolbar.jsx")
-        with open(path) as f:
-            content = f.read()
+    def test_toolbar_has_png_export(self, read_source):
+        content = read_source(PATH_TOOLBAR)
         assert "datalex-diagram.png" in content
 
-    def test_toolbar_has_svg_export(self):
-        path = os.path.join(WEB_APP_DIR, "components", "diagram", "DiagramToolbar.jsx")
-        with open(path) as f:
-            content = f.read()
+    def test_toolbar_has_svg_export(self, read_source):
+        content = read_source(PATH_TOOLBAR)
         assert "datalex-diagram.svg" in content
 
 
@@ -668,42 +611,28 @@ class TestDiagramExport:
 class TestElkLayoutConfig:
     """Tests for ELK layout subject area grouping configuration."""
 
-    def test_elk_layout_exports_color_function(self):
-        path = os.path.join(WEB_APP_DIR, "lib", "elkLayout.js")
-        with open(path) as f:
-            content = f.read()
+    def test_elk_layout_exports_color_function(self, read_source):
+        content = read_source(PATH_ELK)
         assert "export function getSubjectAreaColor" in content
 
-    def test_elk_layout_has_hierarchy_handling(self):
-        path = os.path.join(WEB_APP_DIR, "lib", "elkLayout.js")
-        with open(path) as f:
-            content = f.read()
-        assert "elk.hierarchyHandling" in content
-        assert "INCLUDE_CHILDREN" in content
-
-    def test_elk_layout_creates_group_nodes(self):
-        path = os.path.join(WEB_APP_DIR, "lib", "elkLayout.js")
-        with open(path) as f:
-            content = f.read()
-        assert "groupNodes" in content
-        assert "__group_" in content
-
-    def test_elk_layout_returns_group_nodes(self):
-        path = os.path.join(WEB_APP_DIR, "lib", "elkLayout.js")
-        with open(path) as f:
-            content = f.read()
+    def test_elk_layout_has_hierarchy_handling(self, read_source):
+        content = read_source(PATH_ELK)
+        _assert_all_in(content, "elk.hierarchyHandling", "INCLUDE_CHILDREN")
+
+    def test_elk_layout_creates_group_nodes(self, read_source):
+        content = read_source(PATH_ELK)
+        _assert_all_in(content, "groupNodes", "__group_")
+
+    def test_elk_layout_returns_group_nodes(self, read_source):
+        content = read_source(PATH_ELK)
         assert "return { nodes: layoutedNodes, edges, groupNodes }" in content
 
-    def test_fallback_layout_returns_group_nodes(self):
-        path = os.path.join(WEB_APP_DIR, "lib", "elkLayout.js")
-        with open(path) as f:
-            content = f.read()
+    def test_fallback_layout_returns_group_nodes(self, read_source):
+        content = read_source(PATH_ELK)
         assert "return { nodes: layoutedNodes, edges, groupNodes: [] }" in content
 
-    def test_subject_area_colors_defined(self):
-        path = os.path.join(WEB_APP_DIR, "lib", "elkLayout.js")
-        with open(path) as f:
-            content = f.read()
+    def test_subject_area_colors_defined(self, read_source):
+        content = read_source(PATH_ELK)
         assert "SUBJECT_AREA_COLORS" in content
         # Should have at least 5 colors
         assert content.count("bg:") >= 5
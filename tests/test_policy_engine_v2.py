@@ -19,7 +19,7 @@ import sys
 import tempfile
 import unittest
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import yaml
 
@@ -43,51 +43,69 @@ from datalex_core.policy import (
     policy_issues,
 )
 from datalex_core.schema import load_schema, schema_issues
-from datalex_core.issues import Issue, has_errors
+from datalex_core.issues import Issue, has_errors, severity_counts
+from datalex_cli.main import build_parser
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# One factory per top-level key: each call builds fresh objects (a literal is
+# far cheaper than deepcopying a shared template), and keys a test overrides
+# are never built at all.
+_MODEL_DEFAULTS: Dict[str, Callable[[], Any]] = {
+    "model": lambda: {
+        "name": "test_model",
+        "version": "1.0.0",
+        "domain": "test",
+        "owners": ["test@example.com"],
+        "state": "draft",
+    },
+    "entities": lambda: [
+        {
+            "name": "Customer",
+            "type": "table",
+            "description": "Customer table",
+            "owner": "team@example.com",
+            "tags": ["GOLD"],
+            "sla": {"freshness": "24h", "quality_score": 99.5},
+            "fields": [
+                {"name": "customer_id", "type": "integer", "primary_key": True, "nullable": False},
+                {"name": "email", "type": "string", "nullable": False, "description": "Email"},
+                {"name": "name", "type": "string", "nullable": False, "description": "Name"},
+                {"name": "status", "type": "string", "nullable": False, "description": "Status"},
+                {"name": "created_at", "type": "timestamp", "nullable": False, "description": "Created"},
+            ],
+        },
+    ],
+    "relationships": lambda: [],
+    "indexes": lambda: [
+        {"name": "idx_customer_email", "entity": "Customer", "fields": ["email"], "unique": True},
+    ],
+}
+
+
 def _make_model(**overrides) -> Dict[str, Any]:
     """Build a minimal valid model dict, merging *overrides*."""
     base: Dict[str, Any] = {
-        "model": {
-            "name": "test_model",
-            "version": "1.0.0",
-            "domain": "test",
-            "owners": ["test@example.com"],
-            "state": "draft",
-        },
-        "entities": [
-            {
-                "name": "Customer",
-                "type": "table",
-                "description": "Customer table",
-                "owner": "team@example.com",
-                "tags": ["GOLD"],
-                "sla": {"freshness": "24h", "quality_score": 99.5},
-                "fields": [
-                    {"name": "customer_id", "type": "integer", "primary_key": True, "nullable": False},
-                    {"name": "email", "type": "string", "nullable": False, "description": "Email"},
-                    {"name": "name", "type": "string", "nullable": False, "description": "Name"},
-                    {"name": "status", "type": "string", "nullable": False, "description": "Status"},
-                    {"name": "created_at", "type": "timestamp", "nullable": False, "description": "Created"},
-                ],
-            },
-        ],
-        "relationships": [],
-        "indexes": [
-            {"name": "idx_customer_email", "entity": "Customer", "fields": ["email"], "unique": True},
-        ],
+        key: overrides[key] if key in overrides else factory()
+        for key, factory in _MODEL_DEFAULTS.items()
     }
     base.update(overrides)
     return base
 
 
-def _issues_by_code(issues: List[Issue], code_prefix: str) -> List[Issue]:
-    return [i for i in issues if i.code.startswith(code_prefix)]
+def _issues_by_code(issues: Iterable[Issue], code_prefix: str) -> Iterator[Issue]:
+    return (i for i in issues if i.code.startswith(code_prefix))
+
+
+def _first_issue_by_code(issues: Iterable[Issue], code_prefix: str) -> Optional[Issue]:
+    return next(_issues_by_code(issues, code_prefix), None)
+
+
+def _messages(issues: Iterable[Issue]) -> str:
+    return "\n".join(i.message for i in issues)
 
 
 # ===========================================================================
@@ -149,6 +167,14 @@ class TestNamingConvention(unittest.TestCase):
         self.assertEqual(len(issues), 1)
         self.assertIn("MISCONFIGURED", issues[0].code)
 
+    def test_patterns_are_compiled_once(self):
+        from datalex_core.policy import _compile
+
+        self.assertIs(_compile("^[A-Z][a-zA-Z0-9]*$")[0], _compile("^[A-Z][a-zA-Z0-9]*$")[0])
+        pattern, error = _compile("[invalid(")
+        self.assertIsNone(pattern)
+        self.assertTrue(error)
+
     def test_no_patterns_misconfigured(self):
         model = _make_model()
         issues = _naming_convention(model, "error", "NC", {})
@@ -502,6 +528,14 @@ class TestCustomExpression(unittest.TestCase):
         })
         self.assertEqual(len(issues), 1)
 
+    def test_field_scope_sees_owning_entity(self):
+        model = _make_model()
+        issues = _custom_expression(model, "error", "CE", {
+            "scope": "field",
+            "expression": "entity == 'Customer' and name != ''",
+        })
+        self.assertEqual(len(issues), 0)
+
     def test_model_scope_pass(self):
         model = _make_model(governance={"classification": {}})
         issues = _custom_expression(model, "error", "CE", {
@@ -526,6 +560,28 @@ class TestCustomExpression(unittest.TestCase):
         })
         self.assertEqual(len(issues), 0)
 
+    def test_builtin_expressions_match_eval(self):
+        from datalex_core.policy import (
+            _BUILTIN_EXPRESSIONS,
+            _ENTITY_EXPRESSION_CONTEXT,
+            _FIELD_EXPRESSION_CONTEXT,
+            _MODEL_EXPRESSION_CONTEXT,
+        )
+
+        model = _make_model(governance={"classification": {}})
+        entity = model["entities"][0]
+        items = {
+            "entity": (_ENTITY_EXPRESSION_CONTEXT, [entity, {"name": "Bare"}]),
+            "field": (_FIELD_EXPRESSION_CONTEXT, entity["fields"] + [{"name": "x", "deprecated": True, "sensitivity": "pii"}]),
+            "model": (_MODEL_EXPRESSION_CONTEXT, [model, {}]),
+        }
+        for (scope, expression), predicate in _BUILTIN_EXPRESSIONS.items():
+            getters, samples = items[scope]
+            for item in samples:
+                ctx = {key: getter(item) for key, getter in getters.items()}
+                expected = eval(expression, {"__builtins__": {}}, ctx)
+                self.assertEqual(bool(expected), bool(predicate(item)), (scope, expression))
+
     def test_invalid_expression(self):
         model = _make_model()
         issues = _custom_expression(model, "error", "CE", {
@@ -535,6 +591,15 @@ class TestCustomExpression(unittest.TestCase):
         self.assertEqual(len(issues), 1)
         self.assertIn("MISCONFIGURED", issues[0].code)
 
+    def test_syntax_error_expression(self):
+        model = _make_model(entities=[])
+        issues = _custom_expression(model, "error", "CE", {
+            "scope": "entity",
+            "expression": "has_description and",
+        })
+        self.assertEqual(len(issues), 1)
+        self.assertIn("MISCONFIGURED", issues[0].code)
+
     def test_missing_expression(self):
         model = _make_model()
         issues = _custom_expression(model, "error", "CE", {"scope": "entity"})
@@ -638,74 +703,125 @@ class TestMergePolicyPacks(unittest.TestCase):
 # load_policy_pack_with_inheritance
 # ===========================================================================
 
+_INHERITANCE_FIXTURES: Dict[str, Dict[str, Any]] = {
+    # base <- child
+    "base": {
+        "pack": {"name": "base", "version": "1.0.0"},
+        "policies": [
+            {"id": "BASE_ONLY", "type": "require_owner", "severity": "warn", "params": {}},
+            {"id": "SHARED", "type": "require_sla", "severity": "warn", "params": {}},
+        ],
+    },
+    "child": {
+        "pack": {"name": "child", "version": "1.0.0", "extends": "base.policy.yaml"},
+        "policies": [
+            {"id": "SHARED", "type": "require_sla", "severity": "error", "params": {"require_quality_score": True}},
+            {"id": "CHILD_ONLY", "type": "naming_convention", "severity": "error", "params": {"entity_pattern": "^[A-Z].*$"}},
+        ],
+    },
+    # gp <- parent <- grandchild
+    "gp": {
+        "pack": {"name": "gp", "version": "1.0.0"},
+        "policies": [{"id": "GP", "type": "require_owner", "severity": "info", "params": {}}],
+    },
+    "parent": {
+        "pack": {"name": "parent", "version": "1.0.0", "extends": "gp.policy.yaml"},
+        "policies": [{"id": "PARENT", "type": "require_sla", "severity": "warn", "params": {}}],
+    },
+    "grandchild": {
+        "pack": {"name": "grandchild", "version": "1.0.0", "extends": "parent.policy.yaml"},
+        "policies": [{"id": "CHILD", "type": "naming_convention", "severity": "error", "params": {"entity_pattern": "^[A-Z].*$"}}],
+    },
+    # diamond_base <- left, right <- diamond
+    "diamond_base": {"pack": {"name": "diamond_base"}, "policies": [
+        {"id": "SHARED", "type": "require_owner", "severity": "info", "params": {}},
+    ]},
+    "left": {"pack": {"name": "left", "extends": "diamond_base.policy.yaml"}, "policies": [
+        {"id": "SHARED", "type": "require_owner", "severity": "error", "params": {}},
+    ]},
+    "right": {"pack": {"name": "right", "extends": "diamond_base.policy.yaml"}, "policies": [
+        {"id": "RIGHT", "type": "require_sla", "severity": "warn", "params": {}},
+    ]},
+    "diamond": {"pack": {"name": "diamond", "extends": ["left.policy.yaml", "right.policy.yaml"]}, "policies": []},
+    # cycle_a <-> cycle_b
+    "cycle_a": {"pack": {"name": "cycle_a", "extends": "cycle_b.policy.yaml"}, "policies": []},
+    "cycle_b": {"pack": {"name": "cycle_b", "extends": "cycle_a.policy.yaml"}, "policies": []},
+}
+
+
 class TestPolicyInheritance(unittest.TestCase):
     """Tests for policy inheritance via pack.extends."""
 
+    @classmethod
+    def setUpClass(cls):
+        # The fixture packs are read-only, so every test shares one directory.
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.tmpdir = cls._tmp.name
+        for name, body in _INHERITANCE_FIXTURES.items():
+            with open(cls._pack_path(name), "w") as f:
+                json.dump(body, f)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    @classmethod
+    def _pack_path(cls, name: str) -> str:
+        return os.path.join(cls.tmpdir, f"{name}.policy.yaml")
+
     def test_load_without_extends(self):
         pack = load_policy_pack_with_inheritance(str(ROOT / "policies" / "default.policy.yaml"))
         self.assertIn("policies", pack)
         self.assertGreater(len(pack["policies"]), 0)
 
     def test_load_with_extends(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base_path = os.path.join(tmpdir, "base.policy.yaml")
-            child_path = os.path.join(tmpdir, "child.policy.yaml")
-
-            base = {
-                "pack": {"name": "base", "version": "1.0.0"},
-                "policies": [
-                    {"id": "BASE_ONLY", "type": "require_owner", "severity": "warn", "params": {}},
-                    {"id": "SHARED", "type": "require_sla", "severity": "warn", "params": {}},
-                ],
-            }
-            child = {
-                "pack": {"name": "child", "version": "1.0.0", "extends": "base.policy.yaml"},
-                "policies": [
-                    {"id": "SHARED", "type": "require_sla", "severity": "error", "params": {"require_quality_score": True}},
-                    {"id": "CHILD_ONLY", "type": "naming_convention", "severity": "error", "params": {"entity_pattern": "^[A-Z].*$"}},
-                ],
-            }
-
-            with open(base_path, "w") as f:
-                yaml.safe_dump(base, f)
-            with open(child_path, "w") as f:
-                yaml.safe_dump(child, f)
-
-            result = load_policy_pack_with_inheritance(child_path)
-            ids = [p["id"] for p in result["policies"]]
-            self.assertIn("BASE_ONLY", ids)
-            self.assertIn("SHARED", ids)
-            self.assertIn("CHILD_ONLY", ids)
-            shared = [p for p in result["policies"] if p["id"] == "SHARED"][0]
-            self.assertEqual(shared["severity"], "error")
+        result = load_policy_pack_with_inheritance(self._pack_path("child"))
+        ids = [p["id"] for p in result["policies"]]
+        self.assertIn("BASE_ONLY", ids)
+        self.assertIn("SHARED", ids)
+        self.assertIn("CHILD_ONLY", ids)
+        shared = [p for p in result["policies"] if p["id"] == "SHARED"][0]
+        self.assertEqual(shared["severity"], "error")
 
     def test_transitive_extends(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            grandparent = os.path.join(tmpdir, "gp.policy.yaml")
-            parent = os.path.join(tmpdir, "parent.policy.yaml")
-            child = os.path.join(tmpdir, "child.policy.yaml")
-
-            with open(grandparent, "w") as f:
-                yaml.safe_dump({
-                    "pack": {"name": "gp", "version": "1.0.0"},
-                    "policies": [{"id": "GP", "type": "require_owner", "severity": "info", "params": {}}],
-                }, f)
-            with open(parent, "w") as f:
-                yaml.safe_dump({
-                    "pack": {"name": "parent", "version": "1.0.0", "extends": "gp.policy.yaml"},
-                    "policies": [{"id": "PARENT", "type": "require_sla", "severity": "warn", "params": {}}],
-                }, f)
-            with open(child, "w") as f:
-                yaml.safe_dump({
-                    "pack": {"name": "child", "version": "1.0.0", "extends": "parent.policy.yaml"},
-                    "policies": [{"id": "CHILD", "type": "naming_convention", "severity": "error", "params": {"entity_pattern": "^[A-Z].*$"}}],
-                }, f)
-
-            result = load_policy_pack_with_inheritance(child)
-            ids = [p["id"] for p in result["policies"]]
-            self.assertIn("GP", ids)
-            self.assertIn("PARENT", ids)
-            self.assertIn("CHILD", ids)
+        result = load_policy_pack_with_inheritance(self._pack_path("grandchild"))
+        ids = [p["id"] for p in result["policies"]]
+        self.assertIn("GP", ids)
+        self.assertIn("PARENT", ids)
+        self.assertIn("CHILD", ids)
+
+    def test_diamond_extends_merges_shared_base_once(self):
+        result = load_policy_pack_with_inheritance(self._pack_path("diamond"))
+        self.assertEqual(["SHARED", "RIGHT"], [p["id"] for p in result["policies"]])
+        # The right branch must not re-apply the base definition over left's override.
+        self.assertEqual("error", result["policies"][0]["severity"])
+
+    def test_extends_cycle_raises(self):
+        with self.assertRaises(ValueError):
+            load_policy_pack_with_inheritance(self._pack_path("cycle_a"))
+
+    def test_json_pack_extends_yaml_pack(self):
+        path = self._pack_path("json_child").replace(".yaml", ".json")
+        with open(path, "w") as f:
+            json.dump({
+                "pack": {"name": "json_child", "extends": "base.policy.yaml"},
+                "policies": [{"id": "JSON_ONLY", "type": "require_owner", "params": {}}],
+            }, f)
+        result = load_policy_pack_with_inheritance(path)
+        self.assertEqual(["BASE_ONLY", "SHARED", "JSON_ONLY"], [p["id"] for p in result["policies"]])
+
+    def test_malformed_json_pack_raises_yaml_error(self):
+        path = self._pack_path("malformed").replace(".yaml", ".json")
+        with open(path, "w") as f:
+            f.write('{"policies": [{"id": "A", "type": "require_owner"}')
+        with self.assertRaises(yaml.YAMLError):
+            load_policy_pack(path)
+
+    def test_json_pack_with_yaml_only_syntax_still_loads(self):
+        path = self._pack_path("lenient").replace(".yaml", ".json")
+        with open(path, "w") as f:
+            f.write("{'policies': [{'id': 'Q', 'type': 'require_owner', 'params': {}}]}")
+        self.assertEqual(["Q"], [p["id"] for p in load_policy_pack(path)["policies"]])
 
 
 # ===========================================================================
@@ -715,76 +831,81 @@ class TestPolicyInheritance(unittest.TestCase):
 class TestPolicyIssuesIntegration(unittest.TestCase):
     """Integration tests for policy_issues with new policy types."""
 
-    def test_naming_convention_via_policy_issues(self):
-        model = _make_model(entities=[{"name": "bad_name", "type": "table", "fields": []}])
-        pack = {
+    @classmethod
+    def setUpClass(cls):
+        # One model and one pack exercise every policy type below; each test
+        # filters the shared result by its policy's code.
+        cls.model = _make_model(
+            entities=_MODEL_DEFAULTS["entities"]() + [
+                {"name": "bad_name", "type": "table", "owner": "team@example.com", "fields": []},
+                {"name": "NoOwner", "type": "table", "fields": []},
+            ],
+            indexes=[],
+        )
+        cls.pack = {
             "pack": {"name": "test", "version": "1.0.0"},
-            "policies": [{
-                "id": "NC",
-                "type": "naming_convention",
-                "severity": "error",
-                "params": {"entity_pattern": "^[A-Z][a-zA-Z0-9]*$"},
-            }],
+            "policies": [
+                {"id": "NC", "type": "naming_convention", "severity": "error",
+                 "params": {"entity_pattern": "^[A-Z][a-zA-Z0-9]*$"}},
+                {"id": "RI", "type": "require_indexes", "severity": "warn", "params": {"min_fields": 5}},
+                {"id": "RO", "type": "require_owner", "severity": "error", "params": {}},
+                {"id": "OFF", "type": "require_owner", "severity": "error", "enabled": False, "params": {}},
+                {"id": "CE", "type": "custom_expression", "severity": "warn",
+                 "params": {"scope": "model", "expression": "entity_count >= 1"}},
+            ],
         }
-        issues = policy_issues(model, pack)
-        self.assertTrue(any("bad_name" in i.message for i in issues))
+        cls.issues = policy_issues(cls.model, cls.pack)
+
+    def test_naming_convention_via_policy_issues(self):
+        self.assertIn("bad_name", _messages(_issues_by_code(self.issues, "POLICY_NC")))
 
     def test_require_indexes_via_policy_issues(self):
-        model = _make_model(indexes=[])
-        pack = {
-            "pack": {"name": "test", "version": "1.0.0"},
-            "policies": [{
-                "id": "RI",
-                "type": "require_indexes",
-                "severity": "warn",
-                "params": {"min_fields": 5},
-            }],
-        }
-        issues = policy_issues(model, pack)
-        self.assertTrue(any("no indexes" in i.message for i in issues))
+        self.assertIn("no indexes", _messages(_issues_by_code(self.issues, "POLICY_RI")))
 
     def test_require_owner_via_policy_issues(self):
-        model = _make_model(entities=[{"name": "NoOwner", "type": "table", "fields": []}])
-        pack = {
-            "pack": {"name": "test", "version": "1.0.0"},
-            "policies": [{
-                "id": "RO",
-                "type": "require_owner",
-                "severity": "error",
-                "params": {},
-            }],
-        }
-        issues = policy_issues(model, pack)
-        self.assertTrue(any("NoOwner" in i.message for i in issues))
+        self.assertIn("NoOwner", _messages(_issues_by_code(self.issues, "POLICY_RO")))
 
     def test_disabled_policy_skipped(self):
-        model = _make_model(entities=[{"name": "NoOwner", "type": "table", "fields": []}])
-        pack = {
-            "pack": {"name": "test", "version": "1.0.0"},
-            "policies": [{
-                "id": "RO",
-                "type": "require_owner",
-                "severity": "error",
-                "enabled": False,
-                "params": {},
-            }],
-        }
-        issues = policy_issues(model, pack)
-        self.assertEqual(len(issues), 0)
+        self.assertIsNone(_first_issue_by_code(self.issues, "POLICY_OFF"))
 
     def test_custom_expression_via_policy_issues(self):
-        model = _make_model()
-        pack = {
-            "pack": {"name": "test", "version": "1.0.0"},
-            "policies": [{
-                "id": "CE",
-                "type": "custom_expression",
-                "severity": "warn",
-                "params": {"scope": "model", "expression": "entity_count >= 1"},
-            }],
-        }
-        issues = policy_issues(model, pack)
-        self.assertEqual(len(issues), 0)
+        self.assertIsNone(_first_issue_by_code(self.issues, "POLICY_CE"))
+
+    def test_entity_policies_share_prepass_results(self):
+        model = _make_model(
+            entities=[
+                {"name": "Bare", "type": "table", "tags": ["GOLD"], "fields": [{"name": f"f{i}"} for i in range(6)]},
+                {"name": "Owned", "type": "view", "owner": "a@example.com", "fields": []},
+            ],
+            indexes=[],
+        )
+        policies = [
+            {"id": "RI", "type": "require_indexes", "params": {}},
+            {"id": "RO", "type": "require_owner", "params": {"require_email": True}},
+            {"id": "RS", "type": "require_sla", "params": {"required_tags": ["GOLD"]}},
+        ]
+        expected = (
+            _require_indexes(model, "error", "RI", {})
+            + _require_owner(model, "error", "RO", {"require_email": True})
+            + _require_sla(model, "error", "RS", {"required_tags": ["GOLD"]})
+        )
+        self.assertEqual(expected, policy_issues(model, {"policies": policies}))
+        self.assertEqual(3, len(expected))
+
+    def test_severity_counts_single_pass(self):
+        issues = [Issue("error", "A", "m"), Issue("warn", "B", "m"), Issue("error", "C", "m")]
+        counts = severity_counts(iter(issues))
+        self.assertEqual((2, 1, 0), (counts["error"], counts["warn"], counts["info"]))
+        self.assertTrue(has_errors(issues))
+
+    def test_issue_codes_are_interned(self):
+        model = _make_model(entities=[
+            {"name": "NoOwnerA", "type": "table", "fields": []},
+            {"name": "NoOwnerB", "type": "table", "fields": []},
+        ])
+        first, second = _require_owner(model, "error", "RO", {})
+        self.assertIs(first.code, second.code)
+        self.assertIs(first.severity, second.severity)
 
 
 # ===========================================================================
@@ -794,22 +915,26 @@ class TestPolicyIssuesIntegration(unittest.TestCase):
 class TestPolicySchemaV2(unittest.TestCase):
     """Tests for the updated policy.schema.json."""
 
-    def setUp(self):
-        self.schema = load_schema(str(ROOT / "schemas" / "policy.schema.json"))
+    @classmethod
+    def setUpClass(cls):
+        # One schema object for the class, so schema_issues compiles its
+        # validator once and reuses it for every test below.
+        cls.schema = load_schema(str(ROOT / "schemas" / "policy.schema.json"))
 
     def test_default_policy_validates(self):
-        with open(ROOT / "policies" / "default.policy.yaml") as f:
-            pack = yaml.safe_load(f)
+        pack = load_policy_pack(str(ROOT / "policies" / "default.policy.yaml"))
         issues = schema_issues(pack, self.schema)
         self.assertEqual(len(issues), 0, f"Default policy validation failed: {issues}")
 
     def test_strict_policy_validates(self):
-        with open(ROOT / "policies" / "strict.policy.yaml") as f:
-            pack = yaml.safe_load(f)
+        pack = load_policy_pack(str(ROOT / "policies" / "strict.policy.yaml"))
         issues = schema_issues(pack, self.schema)
         self.assertEqual(len(issues), 0, f"Strict policy validation failed: {issues}")
 
     def test_new_policy_types_accepted(self):
+        # Only the policy type varies, so one pack is built and retyped.
+        policy: Dict[str, Any] = {"id": "T", "type": None, "severity": "warn", "params": {}}
+        pack = {"pack": {"name": "test", "version": "1.0.0"}, "policies": [policy]}
         for ptype in [
             "naming_convention",
             "require_indexes",
@@ -818,28 +943,20 @@ class TestPolicySchemaV2(unittest.TestCase):
             "deprecation_check",
             "custom_expression",
         ]:
-            pack = {
-                "pack": {"name": "test", "version": "1.0.0"},
-                "policies": [{"id": "T", "type": ptype, "severity": "warn", "params": {}}],
-            }
+            policy["type"] = ptype
             issues = schema_issues(pack, self.schema)
             self.assertEqual(len(issues), 0, f"Policy type '{ptype}' should be valid: {issues}")
 
-    def test_extends_string_accepted(self):
+    def test_extends_string_or_array_accepted(self):
+        header: Dict[str, Any] = {"name": "test", "version": "1.0.0"}
         pack = {
-            "pack": {"name": "test", "version": "1.0.0", "extends": "base.policy.yaml"},
+            "pack": header,
             "policies": [{"id": "T", "type": "require_owner", "severity": "warn", "params": {}}],
         }
-        issues = schema_issues(pack, self.schema)
-        self.assertEqual(len(issues), 0)
-
-    def test_extends_array_accepted(self):
-        pack = {
-            "pack": {"name": "test", "version": "1.0.0", "extends": ["base.policy.yaml", "extra.policy.yaml"]},
-            "policies": [{"id": "T", "type": "require_owner", "severity": "warn", "params": {}}],
-        }
-        issues = schema_issues(pack, self.schema)
-        self.assertEqual(len(issues), 0)
+        for extends in ("base.policy.yaml", ["base.policy.yaml", "extra.policy.yaml"]):
+            header["extends"] = extends
+            with self.subTest(extends=extends):
+                self.assertEqual([], schema_issues(pack, self.schema))
 
     def test_invalid_policy_type_rejected(self):
         pack = {
@@ -854,54 +971,80 @@ class TestPolicySchemaV2(unittest.TestCase):
 # CI template files
 # ===========================================================================
 
+CI_TEMPLATES_DIR = ROOT / "ci-templates"
+CI_TEMPLATE_TOKENS: Dict[str, Tuple[str, ...]] = {
+    "github-actions.yml": ("DataLex", "datalex validate", "datalex policy-check", "datalex gate"),
+    "gitlab-ci.yml": ("DataLex", "validate-models", "policy-check"),
+    "bitbucket-pipelines.yml": ("DataLex", "Validate Models", "Policy Check"),
+    "pr-comment-bot.yml": ("DataLex", "PR Comment", "datalex diff"),
+}
+
+
 class TestCITemplates(unittest.TestCase):
     """Tests for CI integration template files."""
 
+    @classmethod
+    def setUpClass(cls):
+        # One directory listing replaces a stat per template; each expected
+        # file is read once and missing ones are reported per test.
+        with os.scandir(CI_TEMPLATES_DIR) as entries:
+            present = {entry.name: entry.path for entry in entries if entry.is_file()}
+        cls._contents = {
+            name: Path(present[name]).read_text()
+            for name in CI_TEMPLATE_TOKENS
+            if name in present
+        }
+
+    def _assert_template(self, name: str) -> None:
+        self.assertIn(name, self._contents, f"Missing: {CI_TEMPLATES_DIR / name}")
+        content = self._contents[name]
+        # A handful of short literals per file: str's C substring search beats
+        # building a multi-pattern automaton, and a regex alternation would
+        # miss overlapping tokens such as "policy-check" in "datalex policy-check".
+        missing = [token for token in CI_TEMPLATE_TOKENS[name] if token not in content]
+        self.assertEqual([], missing, f"{name} is missing expected content")
+
     def test_github_actions_template_exists(self):
-        path = ROOT / "ci-templates" / "github-actions.yml"
-        self.assertTrue(path.exists(), f"Missing: {path}")
-        content = path.read_text()
-        self.assertIn("DataLex", content)
-        self.assertIn("datalex validate", content)
-        self.assertIn("datalex policy-check", content)
-        self.assertIn("datalex gate", content)
+        self._assert_template("github-actions.yml")
 
     def test_gitlab_ci_template_exists(self):
-        path = ROOT / "ci-templates" / "gitlab-ci.yml"
-        self.assertTrue(path.exists(), f"Missing: {path}")
-        content = path.read_text()
-        self.assertIn("DataLex", content)
-        self.assertIn("validate-models", content)
-        self.assertIn("policy-check", content)
+        self._assert_template("gitlab-ci.yml")
 
     def test_bitbucket_pipelines_template_exists(self):
-        path = ROOT / "ci-templates" / "bitbucket-pipelines.yml"
-        self.assertTrue(path.exists(), f"Missing: {path}")
-        content = path.read_text()
-        self.assertIn("DataLex", content)
-        self.assertIn("Validate Models", content)
-        self.assertIn("Policy Check", content)
+        self._assert_template("bitbucket-pipelines.yml")
 
     def test_pr_comment_bot_template_exists(self):
-        path = ROOT / "ci-templates" / "pr-comment-bot.yml"
-        self.assertTrue(path.exists(), f"Missing: {path}")
-        content = path.read_text()
-        self.assertIn("DataLex", content)
-        self.assertIn("PR Comment", content)
-        self.assertIn("datalex diff", content)
+        self._assert_template("pr-comment-bot.yml")
 
 
 # ===========================================================================
 # CLI integration
 # ===========================================================================
 
+# policy_issues only reads the pack, so the one instance is shared.
+_FULL_TYPES_PACK: Dict[str, Any] = {
+    "pack": {"name": "full_test", "version": "1.0.0"},
+    "policies": [
+        {"id": "NC", "type": "naming_convention", "severity": "warn", "params": {"entity_pattern": "^[A-Z].*$"}},
+        {"id": "RI", "type": "require_indexes", "severity": "warn", "params": {"min_fields": 5}},
+        {"id": "RO", "type": "require_owner", "severity": "warn", "params": {}},
+        {"id": "RS", "type": "require_sla", "severity": "warn", "params": {}},
+        {"id": "DC", "type": "deprecation_check", "severity": "warn", "params": {}},
+        {"id": "CE", "type": "custom_expression", "severity": "info", "params": {"scope": "model", "expression": "entity_count >= 0"}},
+    ],
+}
+
+
 class TestCLIPolicyCheck(unittest.TestCase):
     """Tests for CLI policy-check command with new features."""
 
+    @classmethod
+    def setUpClass(cls):
+        # parse_args returns a fresh namespace each call, so one parser is shared.
+        cls.parser = build_parser()
+
     def test_cli_parser_has_inherit_flag(self):
-        from datalex_cli.main import build_parser
-        parser = build_parser()
-        args = parser.parse_args([
+        args = self.parser.parse_args([
             "policy-check",
             "model-examples/starter-commerce.model.yaml",
             "--inherit",
@@ -909,9 +1052,7 @@ class TestCLIPolicyCheck(unittest.TestCase):
         self.assertTrue(args.inherit)
 
     def test_cli_parser_default_no_inherit(self):
-        from datalex_cli.main import build_parser
-        parser = build_parser()
-        args = parser.parse_args([
+        args = self.parser.parse_args([
             "policy-check",
             "model-examples/starter-commerce.model.yaml",
         ])
@@ -923,18 +1064,7 @@ class TestCLIPolicyCheck(unittest.TestCase):
             governance={"classification": {"Customer.email": "PII"}},
             rules=[{"name": "r1", "target": "Customer.email", "expression": "True", "severity": "warn"}],
         )
-        pack = {
-            "pack": {"name": "full_test", "version": "1.0.0"},
-            "policies": [
-                {"id": "NC", "type": "naming_convention", "severity": "warn", "params": {"entity_pattern": "^[A-Z].*$"}},
-                {"id": "RI", "type": "require_indexes", "severity": "warn", "params": {"min_fields": 5}},
-                {"id": "RO", "type": "require_owner", "severity": "warn", "params": {}},
-                {"id": "RS", "type": "require_sla", "severity": "warn", "params": {}},
-                {"id": "DC", "type": "deprecation_check", "severity": "warn", "params": {}},
-                {"id": "CE", "type": "custom_expression", "severity": "info", "params": {"scope": "model", "expression": "entity_count >= 0"}},
-            ],
-        }
-        issues = policy_issues(model, pack)
+        issues = policy_issues(model, _FULL_TYPES_PACK)
         # Should not crash; may have some issues but no MISCONFIGURED errors
         misconfig = [i for i in issues if "MISCONFIGURED" in i.code]
         self.assertEqual(len(misconfig), 0, f"Unexpected misconfigured policies: {misconfig}")
@@ -947,45 +1077,46 @@ class TestCLIPolicyCheck(unittest.TestCase):
 class TestBackwardCompatibility(unittest.TestCase):
     """Ensure existing policy types still work."""
 
-    def test_require_entity_tags(self):
-        model = _make_model()
-        pack = {
+    @classmethod
+    def setUpClass(cls):
+        # One model satisfies every legacy policy below, so the pack is
+        # evaluated once and each test checks its own policy's code.
+        cls.model = _make_model(
+            governance={"classification": {"Customer.email": "PII"}},
+            rules=[
+                {"name": "r1", "target": "Customer.email", "expression": "True", "severity": "warn"},
+                {"name": "r2", "target": "Customer.name", "expression": "True", "severity": "warn"},
+                {"name": "r3", "target": "Customer.status", "expression": "True", "severity": "warn"},
+            ],
+        )
+        cls.pack = {
             "pack": {"name": "test", "version": "1.0.0"},
-            "policies": [{"id": "T", "type": "require_entity_tags", "severity": "warn", "params": {"tags": ["GOLD"]}}],
+            "policies": [
+                {"id": "ET", "type": "require_entity_tags", "severity": "warn", "params": {"tags": ["GOLD"]}},
+                {"id": "FD", "type": "require_field_descriptions", "severity": "warn", "params": {"exempt_primary_key": True}},
+                {"id": "CR", "type": "classification_required_for_tags", "severity": "error", "params": {"field_tags": ["PII"]}},
+                {"id": "RT", "type": "rule_target_required", "severity": "warn", "params": {"field_types": ["string"]}},
+            ],
         }
-        issues = policy_issues(model, pack)
-        self.assertEqual(len(issues), 0)
+        cls.issues = policy_issues(cls.model, cls.pack)
+
+    def _assert_no_issues(self, code: str) -> None:
+        self.assertEqual([], list(_issues_by_code(self.issues, code)))
+
+    def test_require_entity_tags(self):
+        self._assert_no_issues("POLICY_ET")
 
     def test_require_field_descriptions(self):
-        model = _make_model()
-        pack = {
-            "pack": {"name": "test", "version": "1.0.0"},
-            "policies": [{"id": "T", "type": "require_field_descriptions", "severity": "warn", "params": {"exempt_primary_key": True}}],
-        }
-        issues = policy_issues(model, pack)
-        self.assertEqual(len(issues), 0)
+        self._assert_no_issues("POLICY_FD")
 
     def test_classification_required_for_tags(self):
-        model = _make_model(governance={"classification": {"Customer.email": "PII"}})
-        pack = {
-            "pack": {"name": "test", "version": "1.0.0"},
-            "policies": [{"id": "T", "type": "classification_required_for_tags", "severity": "error", "params": {"field_tags": ["PII"]}}],
-        }
-        issues = policy_issues(model, pack)
-        self.assertEqual(len(issues), 0)
+        self._assert_no_issues("POLICY_CR")
 
     def test_rule_target_required(self):
-        model = _make_model(rules=[
-            {"name": "r1", "target": "Customer.email", "expression": "True", "severity": "warn"},
-            {"name": "r2", "target": "Customer.name", "expression": "True", "severity": "warn"},
-            {"name": "r3", "target": "Customer.status", "expression": "True", "severity": "warn"},
-        ])
-        pack = {
-            "pack": {"name": "test", "version": "1.0.0"},
-            "policies": [{"id": "T", "type": "rule_target_required", "severity": "warn", "params": {"field_types": ["string"]}}],
-        }
-        issues = policy_issues(model, pack)
-        self.assertEqual(len(issues), 0)
+        self._assert_no_issues("POLICY_RT")
+
+    def test_legacy_pack_has_no_issues(self):
+        self.assertEqual([], self.issues)
 
 
 if __name__ == "__main__":
@@ -1,77 +1,76 @@
-import subprocess
+import sys
 import unittest
 from pathlib import Path
 
 
 ROOT = Path(__file__).resolve().parents[1]
 SCENARIOS = ROOT / "tests" / "scenarios"
+# The CLI's default --schema is relative to the working directory; pass it
+# explicitly so the in-process runs do not depend on cwd.
+SCHEMA = str(ROOT / "schemas" / "model.schema.json")
+sys.path.insert(0, str(ROOT / "packages" / "core_engine" / "src"))
+sys.path.insert(0, str(ROOT / "packages" / "cli" / "src"))
+# The repository root, so `tests.conftest` imports when run as a script.
+sys.path.insert(0, str(ROOT))
 
+from tests.conftest import run_dm
 
-class RealScenarioTests(unittest.TestCase):
-    def run_dm(self, args):
-        return subprocess.run(
-            ["./datalex", *args],
-            cwd=ROOT,
-            check=False,
-            capture_output=True,
-            text=True,
-        )
 
+# The scenarios only read fixtures and write nothing, so they are left
+# ungrouped for `pytest -n auto` to spread across workers. They are not run on
+# threads: run_dm swaps the process-wide sys.stdout/sys.stderr.
+class RealScenarioTests(unittest.TestCase):
     def test_non_breaking_gate_passes(self):
-        result = self.run_dm(
-            [
-                "gate",
-                str(SCENARIOS / "base.model.yaml"),
-                str(SCENARIOS / "non_breaking.model.yaml"),
-            ]
+        result = run_dm(
+            "gate",
+            str(SCENARIOS / "base.model.yaml"),
+            str(SCENARIOS / "non_breaking.model.yaml"),
+            "--schema",
+            SCHEMA,
         )
         self.assertEqual(0, result.returncode, result.stdout + result.stderr)
         self.assertIn("Gate passed.", result.stdout)
 
     def test_breaking_gate_fails_without_override(self):
-        result = self.run_dm(
-            [
-                "gate",
-                str(SCENARIOS / "base.model.yaml"),
-                str(SCENARIOS / "breaking.model.yaml"),
-            ]
+        result = run_dm(
+            "gate",
+            str(SCENARIOS / "base.model.yaml"),
+            str(SCENARIOS / "breaking.model.yaml"),
+            "--schema",
+            SCHEMA,
         )
         self.assertEqual(2, result.returncode, result.stdout + result.stderr)
         self.assertIn("breaking changes", result.stdout.lower())
 
     def test_breaking_gate_can_be_overridden(self):
-        result = self.run_dm(
-            [
-                "gate",
-                str(SCENARIOS / "base.model.yaml"),
-                str(SCENARIOS / "breaking.model.yaml"),
-                "--allow-breaking",
-            ]
+        result = run_dm(
+            "gate",
+            str(SCENARIOS / "base.model.yaml"),
+            str(SCENARIOS / "breaking.model.yaml"),
+            "--schema",
+            SCHEMA,
+            "--allow-breaking",
         )
         self.assertEqual(0, result.returncode, result.stdout + result.stderr)
         self.assertIn("Gate passed.", result.stdout)
 
     def test_invalid_model_fails_validation(self):
-        result = self.run_dm(
-            [
-                "validate",
-                str(SCENARIOS / "invalid.model.yaml"),
-                "--schema",
-                str(ROOT / "schemas" / "model.schema.json"),
-            ]
+        result = run_dm(
+            "validate",
+            str(SCENARIOS / "invalid.model.yaml"),
+            "--schema",
+            SCHEMA,
         )
         self.assertEqual(1, result.returncode, result.stdout + result.stderr)
         self.assertIn("ERROR", result.stdout)
 
     def test_validate_all_on_scenario_folder_detects_invalid(self):
-        result = self.run_dm(
-            [
-                "validate-all",
-                "--glob",
-                "tests/scenarios/*.model.yaml",
-                "--schema",
-                str(ROOT / "schemas" / "model.schema.json"),
-            ]
+        result = run_dm(
+            "validate-all",
+            "--glob",
+            str(SCENARIOS / "*.model.yaml"),
+            "--schema",
+            SCHEMA,
         )
         self.assertEqual(1, result.returncode, result.stdout + result.stderr)
         self.assertIn("Validation failed", result.stdout)
@@ -3,26 +3,37 @@ field properties (default, check, computed, sensitivity, deprecated),
 SQL generation with new dialects, diff engine index tracking, and
 backward compatibility with v1 models."""
 
-import json
 import subprocess
 import sys
+import types
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Set
 
 import pytest
 import yaml
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "packages" / "core_engine" / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "packages" / "cli" / "src"))
+
+from tests.conftest import run_dm
 
 from datalex_core.canonical import compile_model
 from datalex_core.diffing import semantic_diff
 from datalex_core.generators import generate_sql_ddl
-from datalex_core.loader import load_yaml_model
-from datalex_core.schema import load_schema, schema_issues
+from datalex_core.issues import Issue
+from datalex_core.schema import schema_issues
 from datalex_core.semantic import lint_issues
 
-SCHEMA_PATH = str(Path(__file__).resolve().parent.parent / "schemas" / "model.schema.json")
-DM_CLI = str(Path(__file__).resolve().parent.parent / "dm")
+DM_CLI = str(Path(__file__).resolve().parent.parent / "datalex")
+# libyaml's emitter and parser when PyYAML was built with them.
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -52,28 +63,26 @@ def _base_model(**overrides) -> Dict[str, Any]:
     return model
 
 
-def _schema():
-    return load_schema(SCHEMA_PATH)
+def _codes(issues: Iterable[Issue]) -> Set[str]:
+    """Issue codes as a set: one pass, and a failing assert shows them all."""
+    return {issue.code for issue in issues}
 
 
 # ---------------------------------------------------------------------------
 # Backward compatibility
 # ---------------------------------------------------------------------------
 
-class TestBackwardCompatibility:
-    def test_v1_starter_model_validates(self):
-        model = load_yaml_model("model-examples/starter-commerce.model.yaml")
-        issues = schema_issues(model, _schema())
-        assert len(issues) == 0
+V1_MODEL_PATHS = {
+    "starter": "model-examples/starter-commerce.model.yaml",
+    "fintech": "model-examples/real-scenarios/fintech-risk-baseline.model.yaml",
+    "retail": "model-examples/real-scenarios/retail-analytics-baseline.model.yaml",
+}
 
-    def test_v1_fintech_model_validates(self):
-        model = load_yaml_model("model-examples/real-scenarios/fintech-risk-baseline.model.yaml")
-        issues = schema_issues(model, _schema())
-        assert len(issues) == 0
 
-    def test_v1_retail_model_validates(self):
-        model = load_yaml_model("model-examples/real-scenarios/retail-analytics-baseline.model.yaml")
-        issues = schema_issues(model, _schema())
+class TestBackwardCompatibility:
+    @pytest.mark.parametrize("path", list(V1_MODEL_PATHS.values()), ids=list(V1_MODEL_PATHS))
+    def test_v1_model_validates(self, path, schema, yaml_model):
+        issues = schema_issues(yaml_model(path), schema)
         assert len(issues) == 0
 
 
@@ -83,16 +92,16 @@ class TestBackwardCompatibility:
 
 class TestEntityTypes:
     @pytest.mark.parametrize("entity_type", ["table", "view", "materialized_view", "external_table", "snapshot"])
-    def test_valid_entity_types(self, entity_type):
+    def test_valid_entity_types(self, entity_type, schema):
         model = _base_model()
         model["entities"][0]["type"] = entity_type
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
-    def test_invalid_entity_type_rejected(self):
+    def test_invalid_entity_type_rejected(self, schema):
         model = _base_model()
         model["entities"][0]["type"] = "temporary"
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert any(i.severity == "error" for i in issues)
 
     def test_view_no_pk_required(self):
@@ -100,20 +109,20 @@ class TestEntityTypes:
         model["entities"][0]["type"] = "view"
         model["entities"][0]["fields"] = [{"name": "col_a", "type": "string"}]
         issues = lint_issues(model)
-        assert not any(i.code == "MISSING_PRIMARY_KEY" for i in issues)
+        assert "MISSING_PRIMARY_KEY" not in _codes(issues)
 
     def test_materialized_view_no_pk_required(self):
         model = _base_model()
         model["entities"][0]["type"] = "materialized_view"
         model["entities"][0]["fields"] = [{"name": "col_a", "type": "string"}]
         issues = lint_issues(model)
-        assert not any(i.code == "MISSING_PRIMARY_KEY" for i in issues)
+        assert "MISSING_PRIMARY_KEY" not in _codes(issues)
 
     def test_table_still_requires_pk(self):
         model = _base_model()
         model["entities"][0]["fields"] = [{"name": "col_a", "type": "string"}]
         issues = lint_issues(model)
-        assert any(i.code == "MISSING_PRIMARY_KEY" for i in issues)
+        assert "MISSING_PRIMARY_KEY" in _codes(issues)
 
 
 # ---------------------------------------------------------------------------
@@ -121,31 +130,31 @@ class TestEntityTypes:
 # ---------------------------------------------------------------------------
 
 class TestFieldProperties:
-    def test_default_value_string(self):
+    def test_default_value_string(self, schema):
         model = _base_model()
         model["entities"][0]["fields"][1]["default"] = "active"
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
-    def test_default_value_number(self):
+    def test_default_value_number(self, schema):
         model = _base_model()
         model["entities"][0]["fields"][1]["default"] = 0
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
-    def test_default_value_null(self):
+    def test_default_value_null(self, schema):
         model = _base_model()
         model["entities"][0]["fields"][1]["default"] = None
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
-    def test_check_constraint(self):
+    def test_check_constraint(self, schema):
         model = _base_model()
         model["entities"][0]["fields"][1]["check"] = "length(name) > 0"
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
-    def test_computed_field(self):
+    def test_computed_field(self, schema):
         model = _base_model()
         model["entities"][0]["fields"].append({
             "name": "full_name",
@@ -153,7 +162,7 @@ class TestFieldProperties:
             "computed": True,
             "computed_expression": "first_name || ' ' || last_name",
         })
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
     def test_computed_without_expression_warns(self):
@@ -164,25 +173,25 @@ class TestFieldProperties:
             "computed": True,
         })
         issues = lint_issues(model)
-        assert any(i.code == "MISSING_COMPUTED_EXPRESSION" for i in issues)
+        assert "MISSING_COMPUTED_EXPRESSION" in _codes(issues)
 
     @pytest.mark.parametrize("sensitivity", ["public", "internal", "confidential", "restricted"])
-    def test_valid_sensitivity(self, sensitivity):
+    def test_valid_sensitivity(self, sensitivity, schema):
         model = _base_model()
         model["entities"][0]["fields"][1]["sensitivity"] = sensitivity
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
-    def test_invalid_sensitivity_rejected(self):
+    def test_invalid_sensitivity_rejected(self, schema):
         model = _base_model()
         model["entities"][0]["fields"][1]["sensitivity"] = "top_secret"
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert any(i.severity == "error" for i in issues)
 
-    def test_examples_field(self):
+    def test_examples_field(self, schema):
         model = _base_model()
         model["entities"][0]["fields"][1]["examples"] = ["foo", "bar", 42]
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
     def test_deprecated_field_warns(self):
@@ -190,18 +199,18 @@ class TestFieldProperties:
         model["entities"][0]["fields"][1]["deprecated"] = True
         model["entities"][0]["fields"][1]["deprecated_message"] = "Use new_name instead"
         issues = lint_issues(model)
-        assert any(i.code == "DEPRECATED_FIELD" for i in issues)
+        assert "DEPRECATED_FIELD" in _codes(issues)
         dep_issue = next(i for i in issues if i.code == "DEPRECATED_FIELD")
         assert "Use new_name instead" in dep_issue.message
 
-    def test_foreign_key_field(self):
+    def test_foreign_key_field(self, schema):
         model = _base_model()
         model["entities"][0]["fields"].append({
             "name": "parent_id",
             "type": "integer",
             "foreign_key": True,
         })
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
 
@@ -210,41 +219,41 @@ class TestFieldProperties:
 # ---------------------------------------------------------------------------
 
 class TestEntityProperties:
-    def test_schema_and_database(self):
+    def test_schema_and_database(self, schema):
         model = _base_model()
         model["entities"][0]["schema"] = "analytics"
         model["entities"][0]["database"] = "warehouse"
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
-    def test_subject_area(self):
+    def test_subject_area(self, schema):
         model = _base_model()
         model["entities"][0]["subject_area"] = "customer_domain"
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
-    def test_owner(self):
+    def test_owner(self, schema):
         model = _base_model()
         model["entities"][0]["owner"] = "team@example.com"
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
-    def test_sla(self):
+    def test_sla(self, schema):
         model = _base_model()
         model["entities"][0]["sla"] = {"freshness": "24h", "quality_score": 99.5}
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
-    def test_model_description(self):
+    def test_model_description(self, schema):
         model = _base_model()
         model["model"]["description"] = "Test model"
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
-    def test_spec_version(self):
+    def test_spec_version(self, schema):
         model = _base_model()
         model["model"]["spec_version"] = 2
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
 
@@ -253,46 +262,46 @@ class TestEntityProperties:
 # ---------------------------------------------------------------------------
 
 class TestLayerGrainMetrics:
-    def test_valid_model_layer(self):
+    def test_valid_model_layer(self, schema):
         model = _base_model()
         model["model"]["layer"] = "transform"
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
-    def test_invalid_model_layer_rejected(self):
+    def test_invalid_model_layer_rejected(self, schema):
         model = _base_model()
         model["model"]["layer"] = "semantic"
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert any(i.severity == "error" for i in issues)
 
-    def test_entity_grain_valid(self):
+    def test_entity_grain_valid(self, schema):
         model = _base_model()
         model["entities"][0]["grain"] = ["widget_id"]
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
         lint = lint_issues(model)
-        assert not any(i.code == "GRAIN_FIELD_NOT_FOUND" for i in lint)
+        assert "GRAIN_FIELD_NOT_FOUND" not in _codes(lint)
 
     def test_entity_grain_missing_field(self):
         model = _base_model()
         model["entities"][0]["grain"] = ["missing_col"]
         lint = lint_issues(model)
-        assert any(i.code == "GRAIN_FIELD_NOT_FOUND" for i in lint)
+        assert "GRAIN_FIELD_NOT_FOUND" in _codes(lint)
 
     def test_transform_layer_requires_grain(self):
         model = _base_model()
         model["model"]["layer"] = "transform"
         lint = lint_issues(model)
-        assert any(i.code == "MISSING_GRAIN" for i in lint)
+        assert "MISSING_GRAIN" in _codes(lint)
 
     def test_report_layer_requires_metrics(self):
         model = _base_model()
         model["model"]["layer"] = "report"
         model["entities"][0]["grain"] = ["widget_id"]
         lint = lint_issues(model)
-        assert any(i.code == "MISSING_METRICS" for i in lint)
+        assert "MISSING_METRICS" in _codes(lint)
 
-    def test_metric_schema_valid(self):
+    def test_metric_schema_valid(self, schema):
         model = _base_model()
         model["model"]["layer"] = "report"
         model["entities"][0]["grain"] = ["widget_id"]
@@ -307,7 +316,7 @@ class TestLayerGrainMetrics:
                 "time_dimension": "widget_id",
             }
         ]
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
         lint = lint_issues(model)
         assert not any(i.severity == "error" for i in lint)
@@ -324,7 +333,7 @@ class TestLayerGrainMetrics:
             }
         ]
         lint = lint_issues(model)
-        assert any(i.code == "METRIC_ENTITY_NOT_FOUND" for i in lint)
+        assert "METRIC_ENTITY_NOT_FOUND" in _codes(lint)
 
     def test_metric_grain_field_must_exist(self):
         model = _base_model()
@@ -338,7 +347,7 @@ class TestLayerGrainMetrics:
             }
         ]
         lint = lint_issues(model)
-        assert any(i.code == "METRIC_GRAIN_FIELD_NOT_FOUND" for i in lint)
+        assert "METRIC_GRAIN_FIELD_NOT_FOUND" in _codes(lint)
 
 
 # ---------------------------------------------------------------------------
@@ -346,22 +355,22 @@ class TestLayerGrainMetrics:
 # ---------------------------------------------------------------------------
 
 class TestIndexes:
-    def test_valid_index(self):
+    def test_valid_index(self, schema):
         model = _base_model()
         model["indexes"] = [
             {"name": "idx_widget_name", "entity": "Widget", "fields": ["name"]},
         ]
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
         lint = lint_issues(model)
         assert not any(i.code.startswith("INDEX_") for i in lint)
 
-    def test_unique_index(self):
+    def test_unique_index(self, schema):
         model = _base_model()
         model["indexes"] = [
             {"name": "idx_widget_name", "entity": "Widget", "fields": ["name"], "unique": True, "type": "btree"},
         ]
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
     def test_index_invalid_entity(self):
@@ -370,7 +379,7 @@ class TestIndexes:
             {"name": "idx_missing", "entity": "Missing", "fields": ["col"]},
         ]
         lint = lint_issues(model)
-        assert any(i.code == "INDEX_ENTITY_NOT_FOUND" for i in lint)
+        assert "INDEX_ENTITY_NOT_FOUND" in _codes(lint)
 
     def test_index_invalid_field(self):
         model = _base_model()
@@ -378,7 +387,7 @@ class TestIndexes:
             {"name": "idx_bad_field", "entity": "Widget", "fields": ["nonexistent"]},
         ]
         lint = lint_issues(model)
-        assert any(i.code == "INDEX_FIELD_NOT_FOUND" for i in lint)
+        assert "INDEX_FIELD_NOT_FOUND" in _codes(lint)
 
     def test_duplicate_index_name(self):
         model = _base_model()
@@ -387,7 +396,61 @@ class TestIndexes:
             {"name": "idx_dup", "entity": "Widget", "fields": ["widget_id"]},
         ]
         lint = lint_issues(model)
-        assert any(i.code == "DUPLICATE_INDEX" for i in lint)
+        assert "DUPLICATE_INDEX" in _codes(lint)
+
+
+# ---------------------------------------------------------------------------
+# Validator backends
+# ---------------------------------------------------------------------------
+
+class _FakeRsValidator:
+    """Stands in for jsonschema_rs with its own message and path wording."""
+
+    def __init__(self, schema):
+        from jsonschema import Draft202012Validator
+
+        self._python = Draft202012Validator(schema)
+
+    def is_valid(self, instance):
+        return self._python.is_valid(instance)
+
+    def iter_errors(self, instance):
+        raise AssertionError("violations must be reported by the Python validator")
+
+
+class TestSchemaBackends:
+    @pytest.fixture
+    def fake_rs(self, monkeypatch):
+        from datalex_core import schema as schema_module
+
+        fake = types.ModuleType("jsonschema_rs")
+        fake.Draft202012Validator = _FakeRsValidator
+        monkeypatch.setitem(sys.modules, "jsonschema_rs", fake)
+        monkeypatch.setattr(schema_module, "_RS_VALIDATOR_CACHE", OrderedDict())
+        schema_module._has_jsonschema_rs.cache_clear()
+        yield
+        schema_module._has_jsonschema_rs.cache_clear()
+
+    def _invalid_model(self):
+        model = _base_model()
+        model["entities"][0]["type"] = "spreadsheet"
+        model["entities"][0]["fields"][0]["sensitivity"] = "top-secret"
+        return model
+
+    def test_messages_match_python_backend(self, schema, fake_rs):
+        from jsonschema import Draft202012Validator
+
+        model = self._invalid_model()
+        issues = schema_issues(model, schema)
+        expected = sorted(
+            ("/" + "/".join(str(p) for p in err.absolute_path), err.message)
+            for err in Draft202012Validator(schema).iter_errors(model)
+        )
+        assert sorted((i.path, i.message) for i in issues) == expected
+        assert len(issues) == 2
+
+    def test_valid_model_short_circuits(self, schema, fake_rs):
+        assert schema_issues(_base_model(), schema) == []
 
 
 # ---------------------------------------------------------------------------
@@ -395,7 +458,7 @@ class TestIndexes:
 # ---------------------------------------------------------------------------
 
 class TestGlossary:
-    def test_valid_glossary(self):
+    def test_valid_glossary(self, schema):
         model = _base_model()
         model["glossary"] = [
             {
@@ -407,7 +470,7 @@ class TestGlossary:
                 "tags": ["CORE"],
             }
         ]
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
         lint = lint_issues(model)
         assert not any(i.code.startswith("GLOSSARY_") for i in lint)
@@ -418,7 +481,7 @@ class TestGlossary:
             {"term": "Widget", "definition": "A thing", "related_fields": ["Missing.field"]},
         ]
         lint = lint_issues(model)
-        assert any(i.code == "GLOSSARY_REF_NOT_FOUND" for i in lint)
+        assert "GLOSSARY_REF_NOT_FOUND" in _codes(lint)
 
     def test_duplicate_glossary_term(self):
         model = _base_model()
@@ -427,7 +490,7 @@ class TestGlossary:
             {"term": "Widget", "definition": "Second"},
         ]
         lint = lint_issues(model)
-        assert any(i.code == "DUPLICATE_GLOSSARY_TERM" for i in lint)
+        assert "DUPLICATE_GLOSSARY_TERM" in _codes(lint)
 
 
 # ---------------------------------------------------------------------------
@@ -435,16 +498,16 @@ class TestGlossary:
 # ---------------------------------------------------------------------------
 
 class TestGovernanceV2:
-    def test_phi_classification(self):
+    def test_phi_classification(self, schema):
         model = _base_model()
         model["governance"] = {"classification": {"Widget.name": "PHI"}}
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
-    def test_retention(self):
+    def test_retention(self, schema):
         model = _base_model()
         model["governance"] = {"retention": {"period": "7y", "policy": "GDPR"}}
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
 
@@ -453,7 +516,7 @@ class TestGovernanceV2:
 # ---------------------------------------------------------------------------
 
 class TestRelationshipV2:
-    def test_on_update(self):
+    def test_on_update(self, schema):
         model = _base_model()
         model["entities"].append({
             "name": "Order",
@@ -472,7 +535,7 @@ class TestRelationshipV2:
             "on_update": "no_action",
             "description": "Widget has orders",
         }]
-        issues = schema_issues(model, _schema())
+        issues = schema_issues(model, schema)
         assert len(issues) == 0
 
 
@@ -530,64 +593,53 @@ class TestCanonicalV2:
 # Diff engine v2
 # ---------------------------------------------------------------------------
 
+# semantic_diff only reads its inputs, so the unchanged side of each diff is
+# one shared baseline; the changed side is built with _base_model overrides.
+_DIFF_BASELINE = _base_model()
+_WIDGET_NAME_INDEX = {"name": "idx_name", "entity": "Widget", "fields": ["name"]}
+_WIDGET_COUNT_METRIC = {
+    "name": "widget_count", "entity": "Widget", "expression": "widget_id",
+    "aggregation": "count_distinct", "grain": ["widget_id"],
+}
+
+
 class TestDiffV2:
     def test_index_added(self):
-        old = _base_model()
-        new = _base_model()
-        new["indexes"] = [{"name": "idx_name", "entity": "Widget", "fields": ["name"]}]
-        diff = semantic_diff(old, new)
+        diff = semantic_diff(_DIFF_BASELINE, _base_model(indexes=[_WIDGET_NAME_INDEX]))
         assert "idx_name" in diff["added_indexes"]
         assert diff["summary"]["added_indexes"] == 1
 
     def test_index_removed_is_breaking(self):
-        old = _base_model()
-        old["indexes"] = [{"name": "idx_name", "entity": "Widget", "fields": ["name"]}]
-        new = _base_model()
-        diff = semantic_diff(old, new)
+        diff = semantic_diff(_base_model(indexes=[_WIDGET_NAME_INDEX]), _DIFF_BASELINE)
         assert "idx_name" in diff["removed_indexes"]
         assert diff["has_breaking_changes"]
         assert any("Index removed" in bc for bc in diff["breaking_changes"])
 
     def test_no_index_changes(self):
-        old = _base_model()
-        old["indexes"] = [{"name": "idx_name", "entity": "Widget", "fields": ["name"]}]
-        new = _base_model()
-        new["indexes"] = [{"name": "idx_name", "entity": "Widget", "fields": ["name"]}]
-        diff = semantic_diff(old, new)
+        diff = semantic_diff(
+            _base_model(indexes=[_WIDGET_NAME_INDEX]),
+            _base_model(indexes=[dict(_WIDGET_NAME_INDEX)]),
+        )
         assert diff["summary"]["added_indexes"] == 0
         assert diff["summary"]["removed_indexes"] == 0
 
     def test_metric_added(self):
-        old = _base_model()
-        new = _base_model()
-        new["metrics"] = [
-            {"name": "widget_count", "entity": "Widget", "expression": "widget_id", "aggregation": "count_distinct", "grain": ["widget_id"]},
-        ]
-        diff = semantic_diff(old, new)
+        diff = semantic_diff(_DIFF_BASELINE, _base_model(metrics=[_WIDGET_COUNT_METRIC]))
         assert "widget_count" in diff["added_metrics"]
         assert diff["summary"]["added_metrics"] == 1
 
     def test_metric_removed_is_breaking(self):
-        old = _base_model()
-        old["metrics"] = [
-            {"name": "widget_count", "entity": "Widget", "expression": "widget_id", "aggregation": "count_distinct", "grain": ["widget_id"]},
-        ]
-        new = _base_model()
-        diff = semantic_diff(old, new)
+        diff = semantic_diff(_base_model(metrics=[_WIDGET_COUNT_METRIC]), _DIFF_BASELINE)
         assert "widget_count" in diff["removed_metrics"]
         assert diff["has_breaking_changes"]
         assert any("Metric removed" in bc for bc in diff["breaking_changes"])
 
     def test_metric_contract_change_is_breaking(self):
-        old = _base_model()
-        old["metrics"] = [
-            {"name": "widget_count", "entity": "Widget", "expression": "widget_id", "aggregation": "count_distinct", "grain": ["widget_id"]},
-        ]
-        new = _base_model()
-        new["metrics"] = [
-            {"name": "widget_count", "entity": "Widget", "expression": "name", "aggregation": "count_distinct", "grain": ["widget_id"]},
-        ]
-        diff = semantic_diff(old, new)
+        changed_metric = {**_WIDGET_COUNT_METRIC, "expression": "name"}
+        diff = semantic_diff(
+            _base_model(metrics=[_WIDGET_COUNT_METRIC]),
+            _base_model(metrics=[changed_metric]),
+        )
         assert diff["summary"]["changed_metrics"] == 1
         assert diff["has_breaking_changes"]
         assert any("Metric contract changed" in bc for bc in diff["breaking_changes"])
@@ -598,58 +650,39 @@ class TestDiffV2:
 # ---------------------------------------------------------------------------
 
 class TestSQLGenerationV2:
-    def test_default_clause(self):
-        model = _base_model()
-        model["entities"][0]["fields"][1]["default"] = "active"
-        ddl = generate_sql_ddl(model, "postgres")
-        assert "DEFAULT 'active'" in ddl
-
-    def test_check_constraint(self):
-        model = _base_model()
-        model["entities"][0]["fields"][1]["check"] = "length(name) > 0"
-        ddl = generate_sql_ddl(model, "postgres")
-        assert "CHECK (length(name) > 0)" in ddl
-
-    def test_index_generation(self):
-        model = _base_model()
-        model["indexes"] = [
-            {"name": "idx_widget_name", "entity": "Widget", "fields": ["name"]},
-        ]
-        ddl = generate_sql_ddl(model, "postgres")
-        assert 'CREATE INDEX "idx_widget_name"' in ddl
-
-    def test_unique_index_generation(self):
-        model = _base_model()
-        model["indexes"] = [
-            {"name": "idx_widget_name", "entity": "Widget", "fields": ["name"], "unique": True},
-        ]
-        ddl = generate_sql_ddl(model, "postgres")
-        assert 'CREATE UNIQUE INDEX "idx_widget_name"' in ddl
-
-    def test_view_generates_create_view(self):
-        model = _base_model()
-        model["entities"][0]["type"] = "view"
-        ddl = generate_sql_ddl(model, "postgres")
-        assert "CREATE VIEW" in ddl
-
-    def test_materialized_view_generates(self):
-        model = _base_model()
-        model["entities"][0]["type"] = "materialized_view"
-        ddl = generate_sql_ddl(model, "postgres")
-        assert "CREATE MATERIALIZED VIEW" in ddl
-
-    def test_qualified_name_with_schema(self):
-        model = _base_model()
-        model["entities"][0]["schema"] = "analytics"
-        ddl = generate_sql_ddl(model, "postgres")
-        assert '"analytics"."widget"' in ddl
-
-    def test_qualified_name_with_database_and_schema(self):
-        model = _base_model()
-        model["entities"][0]["schema"] = "analytics"
-        model["entities"][0]["database"] = "warehouse"
-        ddl = generate_sql_ddl(model, "postgres")
-        assert '"warehouse"."analytics"."widget"' in ddl
+    # Each case patches the base Widget model (top-level keys, the entity,
+    # its "name" field) and expects every fragment in the generated DDL.
+    @pytest.mark.parametrize(
+        "model_patch, entity_patch, field_patch, dialect, fragments",
+        [
+            pytest.param({}, {}, {"default": "active"}, "postgres", ["DEFAULT 'active'"], id="default_clause"),
+            pytest.param({}, {}, {"check": "length(name) > 0"}, "postgres", ["CHECK (length(name) > 0)"], id="check_constraint"),
+            pytest.param(
+                {"indexes": [{"name": "idx_widget_name", "entity": "Widget", "fields": ["name"]}]},
+                {}, {}, "postgres", ['CREATE INDEX "idx_widget_name"'], id="index_generation",
+            ),
+            pytest.param(
+                {"indexes": [{"name": "idx_widget_name", "entity": "Widget", "fields": ["name"], "unique": True}]},
+                {}, {}, "postgres", ['CREATE UNIQUE INDEX "idx_widget_name"'], id="unique_index_generation",
+            ),
+            pytest.param({}, {"type": "view"}, {}, "postgres", ["CREATE VIEW"], id="view"),
+            pytest.param({}, {"type": "materialized_view"}, {}, "postgres", ["CREATE MATERIALIZED VIEW"], id="materialized_view"),
+            pytest.param({}, {"schema": "analytics"}, {}, "postgres", ['"analytics"."widget"'], id="qualified_with_schema"),
+            pytest.param(
+                {}, {"schema": "analytics", "database": "warehouse"}, {}, "postgres",
+                ['"warehouse"."analytics"."widget"'], id="qualified_with_database_and_schema",
+            ),
+            pytest.param({}, {"schema": "analytics"}, {}, "bigquery", ["`analytics`", "INT64"], id="bigquery_dialect"),
+            pytest.param({}, {}, {}, "databricks", ["INT", "STRING"], id="databricks_dialect"),
+        ],
+    )
+    def test_ddl_fragment(self, model_patch, entity_patch, field_patch, dialect, fragments):
+        model = _base_model(**model_patch)
+        model["entities"][0].update(entity_patch)
+        model["entities"][0]["fields"][1].update(field_patch)
+        ddl = generate_sql_ddl(model, dialect)
+        missing = [fragment for fragment in fragments if fragment not in ddl]
+        assert not missing, ddl
 
     def test_computed_field_skipped(self):
         model = _base_model()
@@ -704,48 +737,49 @@ class TestSQLGenerationV2:
 # Enterprise example model
 # ---------------------------------------------------------------------------
 
+ENTERPRISE_MODEL_PATH = "model-examples/enterprise-dwh.model.yaml"
+
+
+@pytest.fixture(scope="module")
+def enterprise_model(yaml_model):
+    """The enterprise example, parsed once; the tests below only read it."""
+    return yaml_model(ENTERPRISE_MODEL_PATH)
+
+
+@pytest.fixture(scope="module")
+def enterprise_canonical(enterprise_model):
+    return compile_model(enterprise_model)
+
+
+# Under `-n auto --dist=loadgroup` the rest of this module spreads across
+# workers; these tests stay together so the enterprise fixtures build once.
+@pytest.mark.xdist_group("enterprise_model")
 class TestEnterpriseModel:
-    def test_enterprise_model_validates(self):
-        model = load_yaml_model("model-examples/enterprise-dwh.model.yaml")
-        schema = _schema()
-        issues = schema_issues(model, schema)
+    def test_enterprise_model_validates(self, enterprise_model, schema):
+        issues = schema_issues(enterprise_model, schema)
         assert len(issues) == 0
 
-    def test_enterprise_model_lint(self):
-        model = load_yaml_model("model-examples/enterprise-dwh.model.yaml")
-        issues = lint_issues(model)
+    def test_enterprise_model_lint(self, enterprise_model):
+        issues = lint_issues(enterprise_model)
         errors = [i for i in issues if i.severity == "error"]
         assert len(errors) == 0
 
-    def test_enterprise_model_compiles(self):
-        model = load_yaml_model("model-examples/enterprise-dwh.model.yaml")
-        canonical = compile_model(model)
-        assert len(canonical["entities"]) == 19
-        assert len(canonical["indexes"]) == 17
-        assert len(canonical["glossary"]) == 5
+    def test_enterprise_model_compiles(self, enterprise_canonical):
+        assert len(enterprise_canonical["entities"]) == 19
+        assert len(enterprise_canonical["indexes"]) == 17
+        assert len(enterprise_canonical["glossary"]) == 5
 
-    def test_enterprise_model_sql_postgres(self):
-        model = load_yaml_model("model-examples/enterprise-dwh.model.yaml")
-        ddl = generate_sql_ddl(model, "postgres")
+    def test_enterprise_model_sql_postgres(self, enterprise_model):
+        ddl = generate_sql_ddl(enterprise_model, "postgres")
         assert "CREATE TABLE" in ddl
         assert "CREATE MATERIALIZED VIEW" in ddl
         assert "CREATE VIEW" in ddl
         assert "CREATE INDEX" in ddl
         assert "CREATE UNIQUE INDEX" in ddl
 
-    def test_enterprise_model_sql_bigquery(self):
-        model = load_yaml_model("model-examples/enterprise-dwh.model.yaml")
-        ddl = generate_sql_ddl(model, "bigquery")
-        assert "CREATE TABLE" in ddl
-
-    def test_enterprise_model_sql_snowflake(self):
-        model = load_yaml_model("model-examples/enterprise-dwh.model.yaml")
-        ddl = generate_sql_ddl(model, "snowflake")
-        assert "CREATE TABLE" in ddl
-
-    def test_enterprise_model_sql_databricks(self):
-        model = load_yaml_model("model-examples/enterprise-dwh.model.yaml")
-        ddl = generate_sql_ddl(model, "databricks")
+    @pytest.mark.parametrize("dialect", ["bigquery", "snowflake", "databricks"])
+    def test_enterprise_model_sql_dialect(self, enterprise_model, dialect):
+        ddl = generate_sql_ddl(enterprise_model, dialect)
         assert "CREATE TABLE" in ddl
 
 
@@ -753,21 +787,29 @@ class TestEnterpriseModel:
 # CLI commands
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="module")
+def enterprise_stats():
+    """`datalex stats --output-json` for the enterprise example, run once."""
+    result = run_dm("stats", ENTERPRISE_MODEL_PATH, "--output-json")
+    assert result.returncode == 0, result.stderr
+    return _json_loads(result.stdout)
+
+
 class TestCLIV2:
     def test_dm_fmt(self, tmp_path):
         model = _base_model()
         model_path = tmp_path / "test.model.yaml"
-        model_path.write_text(yaml.safe_dump(model, sort_keys=False))
+        model_path.write_text(yaml.dump(model, Dumper=_YAML_DUMPER, sort_keys=False))
         out_path = tmp_path / "formatted.yaml"
-        result = subprocess.run(
-            [sys.executable, DM_CLI, "fmt", str(model_path), "--out", str(out_path)],
-            capture_output=True, text=True,
-        )
+        result = run_dm("fmt", str(model_path), "--out", str(out_path))
         assert result.returncode == 0
         assert out_path.exists()
-        formatted = yaml.safe_load(out_path.read_text())
+        with out_path.open("rb") as handle:
+            formatted = yaml.load(handle, Loader=_YAML_LOADER)
         assert formatted["entities"][0]["name"] == "Widget"
 
+    # The one launcher smoke test: everything else runs main() in-process.
+    @pytest.mark.slow
     def test_dm_stats(self):
         result = subprocess.run(
             [sys.executable, DM_CLI, "stats", "model-examples/enterprise-dwh.model.yaml"],
@@ -777,32 +819,28 @@ class TestCLIV2:
         assert "Entities: 19" in result.stdout
         assert "Indexes: 17" in result.stdout
 
-    def test_dm_stats_json(self):
-        result = subprocess.run(
-            [sys.executable, DM_CLI, "stats", "model-examples/enterprise-dwh.model.yaml", "--output-json"],
-            capture_output=True, text=True,
-        )
-        assert result.returncode == 0
-        stats = json.loads(result.stdout)
-        assert stats["entity_count"] == 19
-        assert stats["index_count"] == 17
+    def test_dm_stats_json(self, enterprise_stats):
+        assert enterprise_stats["entity_count"] == 19
+        assert enterprise_stats["index_count"] == 17
+
+    def test_dm_stats_json_matches_compiled_model(self, enterprise_stats, enterprise_canonical):
+        assert enterprise_stats["entity_count"] == len(enterprise_canonical["entities"])
+        assert enterprise_stats["index_count"] == len(enterprise_canonical["indexes"])
 
     def test_dm_generate_sql_bigquery(self, tmp_path):
         out = tmp_path / "out.sql"
-        result = subprocess.run(
-            [sys.executable, DM_CLI, "generate", "sql", "model-examples/enterprise-dwh.model.yaml",
-             "--dialect", "bigquery", "--out", str(out)],
-            capture_output=True, text=True,
+        result = run_dm(
+            "generate", "sql", "model-examples/enterprise-dwh.model.yaml",
+            "--dialect", "bigquery", "--out", str(out),
         )
         assert result.returncode == 0
         assert out.exists()
 
     def test_dm_generate_sql_databricks(self, tmp_path):
         out = tmp_path / "out.sql"
-        result = subprocess.run(
-            [sys.executable, DM_CLI, "generate", "sql", "model-examples/enterprise-dwh.model.yaml",
-             "--dialect", "databricks", "--out", str(out)],
-            capture_output=True, text=True,
+        result = run_dm(
+            "generate", "sql", "model-examples/enterprise-dwh.model.yaml",
+            "--dialect", "databricks", "--out", str(out),
         )
         assert result.returncode == 0
         assert out.exists()